@@ -1,12 +1,17 @@
 # examples/MCP/echo_server_stdio.py
 import asyncio
 import logging
+import logging.handlers
 import os
-import sys # For sys.stdout in logging handlers
-from mcp.server import Server, NotificationOptions
+import queue
+import signal
+import socket
+import sys  # For sys.stderr in logging handlers
+
+import mcp.server.stdio  # For stdio_server context manager
+from mcp.server import NotificationOptions, Server
 from mcp.server.models import InitializationOptions
-from mcp.types import Tool, TextContent, Resource
-import mcp.server.stdio # For stdio_server context manager
+from mcp.types import Resource, TextContent, Tool
 
 # --- Logging Setup ---
 # Ensure the 'logs' directory exists in the same directory as this script,
@@ -14,17 +19,30 @@ import mcp.server.stdio # For stdio_server context manager
 LOG_DIR = os.path.join(os.path.dirname(__file__), "logs")
 if not os.path.exists(LOG_DIR):
     os.makedirs(LOG_DIR, exist_ok=True)
-LOG_FILE_PATH = os.path.join(LOG_DIR, 'echo_server_stdio.log')
-
-# Configure logging to write to a file and also to stdout (for direct runs)
-logging.basicConfig(
-    level=logging.DEBUG, # Set to DEBUG for verbose output
-    format="%(asctime)s - ECHO_SRV_STDIO - %(process)d - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
-    handlers=[
-        logging.FileHandler(LOG_FILE_PATH, mode='w'), # Overwrite log file on each start
-        logging.StreamHandler(sys.stdout) # Log to console as well
-    ]
+LOG_FILE_PATH = os.path.join(LOG_DIR, "echo_server_stdio.log")
+
+# stdout carries the MCP protocol stream, so console logs must go to stderr.
+# Records are handed to a QueueListener thread, keeping file/console writes off the event loop.
+LOG_LEVEL = logging.DEBUG if os.getenv("ECHO_SERVER_DEBUG") else logging.INFO
+_log_formatter = logging.Formatter(
+    "%(asctime)s - ECHO_SRV_STDIO - %(process)d - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
 )
+_file_handler = logging.FileHandler(LOG_FILE_PATH, mode="a", delay=True)
+_file_handler.setFormatter(_log_formatter)
+_stderr_handler = logging.StreamHandler(
+    sys.stderr
+)  # Log to console as well, without touching stdout
+_stderr_handler.setFormatter(_log_formatter)
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+log_listener = logging.handlers.QueueListener(
+    _log_queue, _file_handler, _stderr_handler
+)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(
+    logging.Formatter("%(message)s")
+)  # Only merge args; the listener's handlers apply the real format
+logging.basicConfig(level=LOG_LEVEL, handlers=[_queue_handler])
 logger = logging.getLogger("echo_mcp_stdio_srv")
 
 # --- Server Configuration ---
@@ -37,48 +55,73 @@ server = Server("EchoStdioServerExampleInstance")
 logger.debug(f"MCP Server object '{server.name}' created.")
 
 # --- Tool Definitions ---
+# The advertised tools and resources never change, so they are validated once at import
+# and every list_* request returns the same objects.
+_TOOLS: list[Tool] = [
+    Tool(
+        name="echo",
+        description="Echoes the input message with a prefix.",
+        inputSchema={
+            "type": "object",
+            "properties": {
+                "message": {"type": "string", "description": "The message to echo."}
+            },
+            "required": ["message"],
+        },
+    )
+]
+
+_RESOURCES: list[Resource] = [
+    Resource(
+        uri="echo://status",
+        name="Server Status",
+        description="Provides the current status and prefix of the echo server.",
+        mimeType="text/plain",
+    )
+]
+
+
 @server.list_tools()
 async def list_tools_impl() -> list[Tool]:
     logger.debug("Handler: list_tools_impl called.")
-    return [
-        Tool(
-            name="echo",
-            description="Echoes the input message with a prefix.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "message": {"type": "string", "description": "The message to echo."}
-                },
-                "required": ["message"],
-            }
-        )
-    ]
+    return _TOOLS
+
+
+_ECHO_PREFIX_SP = f"{ECHO_PREFIX} "  # Precomputed once instead of per call
+
+
+async def _echo(args: dict | None) -> list[TextContent]:
+    response_text = _ECHO_PREFIX_SP + (args or {}).get(
+        "message", "No message provided."
+    )
+    logger.info(f"Tool 'echo' responding with: '{response_text}'")
+    return [TextContent(type="text", text=response_text)]
+
+
+# Tool name -> handler; a single dict lookup replaces an if/elif chain as tools are added
+_HANDLERS = {"echo": _echo}
+
 
 @server.call_tool()
 async def call_tool_impl(name: str, args: dict | None) -> list[TextContent]:
-    logger.debug(f"Handler: call_tool_impl called with tool_name='{name}', args={args!r}")
-    if name == "echo":
-        message_to_echo = args.get("message", "No message provided.") if args else "No message provided."
-        response_text = f"{ECHO_PREFIX} {message_to_echo}"
-        logger.info(f"Tool 'echo' responding with: '{response_text}'")
-        return [TextContent(type="text", text=response_text)]
+    logger.debug(
+        f"Handler: call_tool_impl called with tool_name='{name}', args={args!r}"
+    )
+    handler = _HANDLERS.get(name)
+    if handler:
+        return await handler(args)
     logger.warning(f"Handler: call_tool_impl received unknown tool name: '{name}'")
     # According to MCP spec, should ideally raise an error or return an error in CallToolResult.
     # For simplicity, returning empty list for unknown tools.
     return []
 
+
 # --- Resource Definitions ---
 @server.list_resources()
 async def list_resources_impl() -> list[Resource]:
     logger.debug("Handler: list_resources_impl called.")
-    return [
-        Resource(
-            uri="echo://status",
-            name="Server Status",
-            description="Provides the current status and prefix of the echo server.",
-            mimeType="text/plain"
-        )
-    ]
+    return _RESOURCES
+
 
 @server.read_resource()
 async def read_resource_impl(uri: str) -> str:
@@ -87,32 +130,43 @@ async def read_resource_impl(uri: str) -> str:
         status_text = f"Echo server is operational. Current prefix: {ECHO_PREFIX}"
         logger.info(f"Resource 'echo://status' responding with: '{status_text}'")
         return status_text
-    logger.warning(f"Handler: read_resource_impl received unknown resource URI: '{uri}'")
-    raise ValueError(f"Resource not found: {uri}") # MCP server should handle this and convert to error response
+    logger.warning(
+        f"Handler: read_resource_impl received unknown resource URI: '{uri}'"
+    )
+    raise ValueError(
+        f"Resource not found: {uri}"
+    )  # MCP server should handle this and convert to error response
+
 
 # --- Main Server Logic ---
 async def main_echo():
     """Initializes and runs the MCP stdio server."""
-    logger.info(f"Echo MCP stdio Server starting up (prefix: {ECHO_PREFIX}). PID: {os.getpid()}")
+    logger.info(
+        f"Echo MCP stdio Server starting up (prefix: {ECHO_PREFIX}). PID: {os.getpid()}"
+    )
     try:
         # mcp.server.stdio.stdio_server() provides the binary read/write streams for MCP communication
         async with mcp.server.stdio.stdio_server() as (binary_reader, binary_writer):
-            logger.debug("stdio_server context manager entered. Binary reader/writer obtained.")
-            
+            logger.debug(
+                "stdio_server context manager entered. Binary reader/writer obtained."
+            )
+
             # Define initialization options for the client
             init_options = InitializationOptions(
-                server_name="EchoStdioSrvFriendlyName", # Name presented to clients
-                server_version="0.2.0",             # Version of this server
+                server_name="EchoStdioSrvFriendlyName",  # Name presented to clients
+                server_version="0.2.0",  # Version of this server
                 capabilities=server.get_capabilities(
-                    notification_options=NotificationOptions(receive=False, send=False), # Example: no notifications
-                    experimental_capabilities={}  # **FIX APPLIED HERE**
-                )
+                    notification_options=NotificationOptions(),  # Example: no list_changed notifications
+                    experimental_capabilities={},  # **FIX APPLIED HERE**
+                ),
+            )
+            logger.debug(
+                f"Server capabilities defined for client: {init_options.capabilities!r}"
             )
-            logger.debug(f"Server capabilities defined for client: {init_options.capabilities!r}")
 
             # Start the MCP server loop, listening on the provided streams
             await server.run(binary_reader, binary_writer, init_options)
-            
+
             # This line is typically only reached if server.run() exits gracefully (e.g., client disconnects cleanly)
             logger.info("MCP server.run() completed.")
 
@@ -126,15 +180,71 @@ async def main_echo():
     finally:
         logger.info("main_echo function finished or exited.")
 
-if __name__ == "__main__":
-    # This block executes when the script is run directly (e.g., `python echo_server_stdio.py`)
-    logger.info(f"Executing echo_server_stdio.py directly. Logging to: {LOG_FILE_PATH}")
+
+def run_stdio_server(listener: logging.handlers.QueueListener) -> None:
+    """Runs one MCP session over stdin/stdout, with queued logging active for its duration."""
+    listener.start()
+    logger.info(f"Serving MCP over stdio. Logging to: {LOG_FILE_PATH}")
     try:
         asyncio.run(main_echo())
     except KeyboardInterrupt:
         logger.info("echo_server_stdio.py terminated by user (KeyboardInterrupt).")
     except Exception as e_main:
         # Catch errors from asyncio.run(main_echo()) itself or unhandled exceptions from main_echo
-        logger.critical(f"Unhandled exception in echo_server_stdio.py __main__ block: {e_main!r}", exc_info=True)
+        logger.critical(
+            f"Unhandled exception in echo_server_stdio.py: {e_main!r}", exc_info=True
+        )
     finally:
-        logger.info("echo_server_stdio.py process exiting.")
\ No newline at end of file
+        logger.info("echo_server_stdio.py session exiting.")
+        listener.stop()  # Flush queued records before the process exits
+
+
+def run_forkserver(socket_path: str) -> None:
+    """
+    Unix-only fork server. All modules above are already imported, so each session forked
+    from here starts instantly instead of paying interpreter + mcp import time. Clients reach
+    it through forkserver_relay.py, which pipes the MCP stdio stream over the socket.
+    """
+    signal.signal(
+        signal.SIGCHLD, signal.SIG_IGN
+    )  # Finished sessions are reaped automatically
+    if os.path.exists(socket_path):
+        os.unlink(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as listen_sock:
+        listen_sock.bind(socket_path)
+        listen_sock.listen()
+        print(
+            f"Echo MCP fork server listening on {socket_path} (PID {os.getpid()})",
+            file=sys.stderr,
+        )
+        while True:
+            conn, _ = listen_sock.accept()
+            if os.fork() == 0:
+                listen_sock.close()
+                # The session speaks MCP over fds 0/1 exactly as if the client had spawned it
+                os.dup2(conn.fileno(), 0)
+                os.dup2(conn.fileno(), 1)
+                conn.close()
+                sys.stdin = os.fdopen(0, "r", encoding="utf-8", closefd=False)
+                sys.stdout = os.fdopen(1, "w", encoding="utf-8", closefd=False)
+                signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+                # Listener threads don't survive fork(), so each session gets its own
+                run_stdio_server(
+                    logging.handlers.QueueListener(
+                        _log_queue, _file_handler, _stderr_handler
+                    )
+                )
+                os._exit(0)
+            conn.close()
+
+
+if __name__ == "__main__":
+    # `python echo_server_stdio.py` serves a single stdio session (what servers_config.json spawns).
+    # `python echo_server_stdio.py --forkserver /tmp/echo_mcp.sock` pre-imports once and forks per session.
+    if len(sys.argv) == 3 and sys.argv[1] == "--forkserver" and hasattr(os, "fork"):
+        try:
+            run_forkserver(sys.argv[2])
+        except KeyboardInterrupt:
+            pass
+    else:
+        run_stdio_server(log_listener)
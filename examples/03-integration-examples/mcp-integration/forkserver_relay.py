@@ -0,0 +1,59 @@
+# examples/MCP/forkserver_relay.py
+"""
+Tiny stdio <-> Unix socket relay for `echo_server_stdio.py --forkserver`.
+
+It only imports the stdlib, so starting it is far cheaper than starting the real server.
+Use it as the stdio command in servers_config.json:
+
+    "echo_stdio_service": {
+      "type": "stdio",
+      "command": "python",
+      "args": ["-I", "./forkserver_relay.py", "/tmp/echo_mcp.sock", "./echo_server_stdio.py"]
+    }
+
+Sessions inherit the fork server's environment (e.g. ECHO_PREFIX), not the "env" block above.
+If the fork server isn't running (or on Windows), the relay replaces itself with a normal
+`python echo_server_stdio.py` process, so the config works either way.
+"""
+import os
+import selectors
+import socket
+import sys
+
+CHUNK_SIZE = 1 << 16
+
+
+def relay(sock: socket.socket) -> None:
+    stdin_fd, stdout_fd = sys.stdin.fileno(), sys.stdout.fileno()
+    selector = selectors.DefaultSelector()
+    selector.register(stdin_fd, selectors.EVENT_READ)
+    selector.register(sock, selectors.EVENT_READ)
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is sock:
+                data = sock.recv(CHUNK_SIZE)
+                if not data:  # Session ended on the server side
+                    return
+                os.write(stdout_fd, data)
+            else:
+                data = os.read(stdin_fd, CHUNK_SIZE)
+                if not data:  # Client closed our stdin
+                    sock.shutdown(socket.SHUT_WR)
+                    selector.unregister(stdin_fd)
+                    continue
+                sock.sendall(data)
+
+
+def main() -> None:
+    socket_path, server_args = sys.argv[1], sys.argv[2:]
+    try:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(socket_path)
+    except (AttributeError, OSError):
+        os.execv(sys.executable, [sys.executable, *server_args])
+    with sock:
+        relay(sock)
+
+
+if __name__ == "__main__":
+    main()
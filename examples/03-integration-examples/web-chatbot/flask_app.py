@@ -1,6 +1,7 @@
 # flask_app.py
 import asyncio
 import logging
+import threading
 
 from dotenv import load_dotenv
 from flask import Flask, jsonify, render_template_string, request
@@ -18,6 +19,15 @@ tframex_app_instance = get_tframex_app()  # Get the configured TFrameXApp instan
 # Configure Flask logging
 flask_app.logger.setLevel(logging.INFO)
 
+# One event loop for the life of the server. Flask runs each async view on a fresh event
+# loop, and the LLM's pooled httpx client (with its keep-alive connections) belongs to the
+# loop that created it, so every request would otherwise reconnect to the LLM endpoint.
+# Requests hand their agent work to this loop instead.
+tframex_loop = asyncio.new_event_loop()
+threading.Thread(
+    target=tframex_loop.run_forever, name="tframex-loop", daemon=True
+).start()
+
 # In-memory session store for conversation history
 # Maps session_id (str) to a list of serialized Message objects (dicts)
 conversation_history_store = {}
@@ -148,6 +158,56 @@ def index():
     return render_template_string(CHAT_HTML_TEMPLATE)
 
 
+async def run_chat_turn(session_id: str, user_message_content: str) -> Message:
+    """Runs one chat turn for a session on tframex_loop, carrying its history in and out."""
+    async with tframex_app_instance.run_context() as rt:
+        # Get the agent instance.
+        # The agent name here MUST match the name defined in tframex_config.py
+        agent_name_to_use = "RedditAnalystAgent"  # MODIFIED HERE
+        chatbot_agent = rt._get_agent_instance(agent_name_to_use)
+
+        # 1. Load history for the current session into the agent's memory
+        if chatbot_agent.memory:  # Ensure agent has a memory store
+            session_history_data = conversation_history_store.get(session_id, [])
+            if session_history_data:
+                flask_app.logger.info(
+                    f"Loading {len(session_history_data)} messages from history for session '{session_id}' into agent '{agent_name_to_use}' memory."
+                )
+                for msg_data in session_history_data:
+                    try:
+                        message_obj = Message.model_validate(msg_data)
+                        await chatbot_agent.memory.add_message(message_obj)
+                    except Exception as e:
+                        flask_app.logger.error(
+                            f"Error rehydrating message for session '{session_id}': {msg_data}, error: {e}"
+                        )
+            else:
+                flask_app.logger.info(
+                    f"No prior history found for session '{session_id}'. Starting fresh for agent '{agent_name_to_use}'."
+                )
+        else:
+            flask_app.logger.warning(
+                f"Agent '{agent_name_to_use}' does not have a memory store. History will not be maintained across calls."
+            )
+
+        # 2. Call the agent with the new user message.
+        bot_response_message = await rt.call_agent(
+            agent_name_to_use, user_message_content  # MODIFIED HERE
+        )
+
+        # 3. Save updated history
+        if chatbot_agent.memory:
+            updated_full_history = await chatbot_agent.memory.get_history()
+            conversation_history_store[session_id] = [
+                msg.model_dump(exclude_none=True) for msg in updated_full_history
+            ]
+            flask_app.logger.info(
+                f"Saved {len(updated_full_history)} total messages to history for session '{session_id}' (Agent: {agent_name_to_use})."
+            )
+
+    return bot_response_message
+
+
 @flask_app.route("/chat", methods=["POST"])
 async def chat():
     try:
@@ -164,50 +224,12 @@ async def chat():
             f"Received message for session '{session_id}': \"{user_message_content}\""
         )
 
-        async with tframex_app_instance.run_context() as rt:
-            # Get the agent instance.
-            # The agent name here MUST match the name defined in tframex_config.py
-            agent_name_to_use = "RedditAnalystAgent"  # MODIFIED HERE
-            chatbot_agent = rt._get_agent_instance(agent_name_to_use)
-
-            # 1. Load history for the current session into the agent's memory
-            if chatbot_agent.memory:  # Ensure agent has a memory store
-                session_history_data = conversation_history_store.get(session_id, [])
-                if session_history_data:
-                    flask_app.logger.info(
-                        f"Loading {len(session_history_data)} messages from history for session '{session_id}' into agent '{agent_name_to_use}' memory."
-                    )
-                    for msg_data in session_history_data:
-                        try:
-                            message_obj = Message.model_validate(msg_data)
-                            await chatbot_agent.memory.add_message(message_obj)
-                        except Exception as e:
-                            flask_app.logger.error(
-                                f"Error rehydrating message for session '{session_id}': {msg_data}, error: {e}"
-                            )
-                else:
-                    flask_app.logger.info(
-                        f"No prior history found for session '{session_id}'. Starting fresh for agent '{agent_name_to_use}'."
-                    )
-            else:
-                flask_app.logger.warning(
-                    f"Agent '{agent_name_to_use}' does not have a memory store. History will not be maintained across calls."
-                )
-
-            # 2. Call the agent with the new user message.
-            bot_response_message = await rt.call_agent(
-                agent_name_to_use, user_message_content  # MODIFIED HERE
+        # Runs on the shared TFrameX loop, whose LLM connections stay open between requests
+        bot_response_message = await asyncio.wrap_future(
+            asyncio.run_coroutine_threadsafe(
+                run_chat_turn(session_id, user_message_content), tframex_loop
             )
-
-            # 3. Save updated history
-            if chatbot_agent.memory:
-                updated_full_history = await chatbot_agent.memory.get_history()
-                conversation_history_store[session_id] = [
-                    msg.model_dump(exclude_none=True) for msg in updated_full_history
-                ]
-                flask_app.logger.info(
-                    f"Saved {len(updated_full_history)} total messages to history for session '{session_id}' (Agent: {agent_name_to_use})."
-                )
+        )
 
         bot_reply_content = (
             bot_response_message.content
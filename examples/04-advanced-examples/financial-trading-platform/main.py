@@ -24,15 +24,16 @@ Always consult with qualified financial professionals before making investment d
 import asyncio
 import json
 import logging
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
 
 from dotenv import load_dotenv
-from tframex import TFrameX, Message, Flow
+
+from tframex import Flow, Message, TFrameX
 from tframex.llms import OpenAILLM
 from tframex.memory import InMemoryMemoryStore
 
@@ -44,13 +45,11 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Initialize TFrameX app
-app = TFrameX(
-    default_llm=OpenAILLM(),
-    default_memory_store_factory=InMemoryMemoryStore
-)
+app = TFrameX(default_llm=OpenAILLM(), default_memory_store_factory=InMemoryMemoryStore)
 
 # ===== FINANCIAL DATA MODELS =====
 
+
 class AssetType(Enum):
     STOCK = "stock"
     BOND = "bond"
@@ -59,21 +58,25 @@ class AssetType(Enum):
     COMMODITY = "commodity"
     ETF = "etf"
 
+
 class OrderType(Enum):
     MARKET = "market"
     LIMIT = "limit"
     STOP_LOSS = "stop_loss"
     STOP_LIMIT = "stop_limit"
 
+
 class RiskLevel(Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
     CRITICAL = "critical"
 
+
 @dataclass
 class MarketData:
     """Real-time market data for an asset."""
+
     symbol: str
     price: Decimal
     volume: int
@@ -82,9 +85,11 @@ class MarketData:
     ask: Decimal
     timestamp: datetime
 
+
 @dataclass
 class Position:
     """Trading position information."""
+
     symbol: str
     quantity: int
     entry_price: Decimal
@@ -92,9 +97,11 @@ class Position:
     unrealized_pnl: Decimal
     asset_type: AssetType
 
+
 @dataclass
 class TradingSignal:
     """Trading signal from analysis agents."""
+
     symbol: str
     action: str  # BUY, SELL, HOLD
     confidence: float
@@ -103,8 +110,10 @@ class TradingSignal:
     reasoning: str
     agent_source: str
 
+
 # ===== TRADING AGENTS =====
 
+
 @app.agent(
     name="TradingOrchestrator",
     description="Central coordinator for all trading operations and risk management",
@@ -126,12 +135,13 @@ class TradingSignal:
     
     IMPORTANT: This is a simulation for educational purposes only.
     All recommendations should be clearly marked as educational examples.
-    """
+    """,
 )
 async def trading_orchestrator():
     """Central coordinator for all trading operations."""
     pass
 
+
 @app.agent(
     name="MarketAnalyst",
     description="Analyzes market trends, technical indicators, and price movements",
@@ -153,12 +163,13 @@ async def trading_orchestrator():
     
     Focus on providing objective, data-driven market analysis.
     Always include confidence levels and risk considerations in your analysis.
-    """
+    """,
 )
 async def market_analyst():
     """Analyzes market trends and technical indicators."""
     pass
 
+
 @app.agent(
     name="FundamentalAnalyst",
     description="Analyzes company fundamentals, economic data, and valuation metrics",
@@ -180,12 +191,13 @@ async def market_analyst():
     
     Provide thorough fundamental analysis with clear investment thesis.
     Consider both upside potential and downside risks.
-    """
+    """,
 )
 async def fundamental_analyst():
     """Analyzes company fundamentals and economic data."""
     pass
 
+
 @app.agent(
     name="RiskManager",
     description="Monitors and manages trading risk across all positions and strategies",
@@ -212,12 +224,13 @@ async def fundamental_analyst():
     - Minimum cash reserve: 10% of portfolio
     
     Provide clear risk assessments and immediate alerts for any limit violations.
-    """
+    """,
 )
 async def risk_manager():
     """Monitors and manages all trading risks."""
     pass
 
+
 @app.agent(
     name="AlgorithmicTrader",
     description="Executes algorithmic trading strategies and order management",
@@ -245,12 +258,13 @@ async def risk_manager():
     - Market making strategies
     
     Focus on efficient execution while maintaining strict risk controls.
-    """
+    """,
 )
 async def algorithmic_trader():
     """Executes algorithmic trading strategies."""
     pass
 
+
 @app.agent(
     name="PortfolioManager",
     description="Manages portfolio allocation, rebalancing, and optimization",
@@ -277,12 +291,13 @@ async def algorithmic_trader():
     - Cash: 5-10%
     
     Provide portfolio recommendations that balance growth and risk management.
-    """
+    """,
 )
 async def portfolio_manager():
     """Manages portfolio allocation and optimization."""
     pass
 
+
 @app.agent(
     name="SentimentAnalyst",
     description="Analyzes market sentiment, news, and social media trends",
@@ -310,43 +325,44 @@ async def portfolio_manager():
     - Assess crowd psychology and behavioral factors
     
     Provide sentiment insights that complement technical and fundamental analysis.
-    """
+    """,
 )
 async def sentiment_analyst():
     """Analyzes market sentiment and behavioral indicators."""
     pass
 
+
 # ===== TRADING FLOWS =====
 
 # Market analysis flow
 market_analysis_flow = Flow(
     flow_name="MarketAnalysisFlow",
-    description="Comprehensive market analysis combining multiple perspectives"
+    description="Comprehensive market analysis combining multiple perspectives",
 )
-market_analysis_flow.add_step("MarketAnalyst")        # Technical analysis
-market_analysis_flow.add_step("FundamentalAnalyst")   # Fundamental analysis  
-market_analysis_flow.add_step("SentimentAnalyst")     # Sentiment analysis
+market_analysis_flow.add_step("MarketAnalyst")  # Technical analysis
+market_analysis_flow.add_step("FundamentalAnalyst")  # Fundamental analysis
+market_analysis_flow.add_step("SentimentAnalyst")  # Sentiment analysis
 market_analysis_flow.add_step("TradingOrchestrator")  # Synthesis
 
 # Trade evaluation flow
 trade_evaluation_flow = Flow(
-    flow_name="TradeEvaluationFlow", 
-    description="Evaluate and validate potential trades"
+    flow_name="TradeEvaluationFlow",
+    description="Evaluate and validate potential trades",
 )
-trade_evaluation_flow.add_step("RiskManager")         # Risk assessment
-trade_evaluation_flow.add_step("PortfolioManager")    # Portfolio impact
-trade_evaluation_flow.add_step("AlgorithmicTrader")   # Execution planning
-trade_evaluation_flow.add_step("TradingOrchestrator") # Final decision
+trade_evaluation_flow.add_step("RiskManager")  # Risk assessment
+trade_evaluation_flow.add_step("PortfolioManager")  # Portfolio impact
+trade_evaluation_flow.add_step("AlgorithmicTrader")  # Execution planning
+trade_evaluation_flow.add_step("TradingOrchestrator")  # Final decision
 
 # Portfolio review flow
 portfolio_review_flow = Flow(
     flow_name="PortfolioReviewFlow",
-    description="Comprehensive portfolio analysis and rebalancing"
+    description="Comprehensive portfolio analysis and rebalancing",
 )
-portfolio_review_flow.add_step("PortfolioManager")    # Portfolio analysis
-portfolio_review_flow.add_step("RiskManager")         # Risk review
-portfolio_review_flow.add_step("MarketAnalyst")       # Market context
-portfolio_review_flow.add_step("TradingOrchestrator") # Rebalancing decisions
+portfolio_review_flow.add_step("PortfolioManager")  # Portfolio analysis
+portfolio_review_flow.add_step("RiskManager")  # Risk review
+portfolio_review_flow.add_step("MarketAnalyst")  # Market context
+portfolio_review_flow.add_step("TradingOrchestrator")  # Rebalancing decisions
 
 # Register flows
 app.register_flow(market_analysis_flow)
@@ -355,141 +371,237 @@ app.register_flow(portfolio_review_flow)
 
 # ===== SAMPLE DATA GENERATION =====
 
+
 def generate_sample_market_data() -> Dict[str, MarketData]:
     """Generate sample market data for demonstration."""
     return {
-        "AAPL": MarketData("AAPL", Decimal("175.50"), 1000000, 2.1, Decimal("175.45"), Decimal("175.55"), datetime.now()),
-        "GOOGL": MarketData("GOOGL", Decimal("142.30"), 800000, -0.8, Decimal("142.25"), Decimal("142.35"), datetime.now()),
-        "TSLA": MarketData("TSLA", Decimal("248.75"), 1500000, 3.2, Decimal("248.70"), Decimal("248.80"), datetime.now()),
-        "MSFT": MarketData("MSFT", Decimal("378.90"), 900000, 1.5, Decimal("378.85"), Decimal("378.95"), datetime.now()),
-        "SPY": MarketData("SPY", Decimal("485.20"), 2000000, 0.9, Decimal("485.15"), Decimal("485.25"), datetime.now()),
+        "AAPL": MarketData(
+            "AAPL",
+            Decimal("175.50"),
+            1000000,
+            2.1,
+            Decimal("175.45"),
+            Decimal("175.55"),
+            datetime.now(),
+        ),
+        "GOOGL": MarketData(
+            "GOOGL",
+            Decimal("142.30"),
+            800000,
+            -0.8,
+            Decimal("142.25"),
+            Decimal("142.35"),
+            datetime.now(),
+        ),
+        "TSLA": MarketData(
+            "TSLA",
+            Decimal("248.75"),
+            1500000,
+            3.2,
+            Decimal("248.70"),
+            Decimal("248.80"),
+            datetime.now(),
+        ),
+        "MSFT": MarketData(
+            "MSFT",
+            Decimal("378.90"),
+            900000,
+            1.5,
+            Decimal("378.85"),
+            Decimal("378.95"),
+            datetime.now(),
+        ),
+        "SPY": MarketData(
+            "SPY",
+            Decimal("485.20"),
+            2000000,
+            0.9,
+            Decimal("485.15"),
+            Decimal("485.25"),
+            datetime.now(),
+        ),
     }
 
+
 def generate_sample_portfolio() -> Dict[str, Position]:
     """Generate sample portfolio positions."""
     return {
-        "AAPL": Position("AAPL", 100, Decimal("170.00"), Decimal("175.50"), Decimal("550.00"), AssetType.STOCK),
-        "GOOGL": Position("GOOGL", 50, Decimal("145.00"), Decimal("142.30"), Decimal("-135.00"), AssetType.STOCK),
-        "SPY": Position("SPY", 200, Decimal("480.00"), Decimal("485.20"), Decimal("1040.00"), AssetType.ETF),
+        "AAPL": Position(
+            "AAPL",
+            100,
+            Decimal("170.00"),
+            Decimal("175.50"),
+            Decimal("550.00"),
+            AssetType.STOCK,
+        ),
+        "GOOGL": Position(
+            "GOOGL",
+            50,
+            Decimal("145.00"),
+            Decimal("142.30"),
+            Decimal("-135.00"),
+            AssetType.STOCK,
+        ),
+        "SPY": Position(
+            "SPY",
+            200,
+            Decimal("480.00"),
+            Decimal("485.20"),
+            Decimal("1040.00"),
+            AssetType.ETF,
+        ),
     }
 
+
 # ===== SIMULATION FUNCTIONS =====
 
+
 async def execute_market_analysis(symbols: List[str]) -> Dict:
     """Execute comprehensive market analysis for given symbols."""
-    
+
     print(f"📊 Market Analysis for: {', '.join(symbols)}")
     print("=" * 60)
-    
-    analysis_results = {}
+
     market_data = generate_sample_market_data()
-    
+
+    async def analyze_symbol(rt, symbol: str, data) -> Dict:
+        print(f"\n🔍 Analyzing {symbol} - ${data.price} ({data.change_percent:+.1f}%)")
+
+        analysis_context = f"""
+        Analyze {symbol} with the following market data:
+        - Current Price: ${data.price}
+        - Daily Change: {data.change_percent:+.1f}%
+        - Volume: {data.volume:,}
+        - Bid/Ask: ${data.bid}/${data.ask}
+        
+        Provide your specialized analysis for this asset.
+        """
+
+        # Parallel analysis by specialists: the three views are independent, so they
+        # take as long as the slowest one instead of the sum of all three
+        analysis_tasks = [
+            ("MarketAnalyst", "technical_analysis"),
+            ("FundamentalAnalyst", "fundamental_analysis"),
+            ("SentimentAnalyst", "sentiment_analysis"),
+        ]
+        results = await asyncio.gather(
+            *(
+                rt.call_agent(
+                    agent_name, Message(role="user", content=analysis_context)
+                )
+                for agent_name, _ in analysis_tasks
+            )
+        )
+
+        symbol_analysis = {}
+        for (agent_name, analysis_type), result in zip(analysis_tasks, results):
+            symbol_analysis[analysis_type] = result.current_message.content
+            agent_display = agent_name.replace("Analyst", "")
+            print(
+                f"   📈 {symbol} {agent_display}: {result.current_message.content[:60]}..."
+            )
+
+        # Orchestrator synthesis
+        synthesis_input = Message(
+            role="user",
+            content=f"""
+        Synthesize the analysis for {symbol}:
+        
+        Technical Analysis: {symbol_analysis['technical_analysis']}
+        Fundamental Analysis: {symbol_analysis['fundamental_analysis']}
+        Sentiment Analysis: {symbol_analysis['sentiment_analysis']}
+        
+        Provide overall trading recommendation and rationale.
+        """,
+        )
+
+        synthesis_result = await rt.call_agent("TradingOrchestrator", synthesis_input)
+        symbol_analysis["trading_recommendation"] = (
+            synthesis_result.current_message.content
+        )
+        print(
+            f"   🎯 {symbol} Recommendation: {synthesis_result.current_message.content[:80]}..."
+        )
+        return symbol_analysis
+
     async with app.run_context() as rt:
-        for symbol in symbols:
-            if symbol not in market_data:
-                continue
-                
-            data = market_data[symbol]
-            print(f"\n🔍 Analyzing {symbol} - ${data.price} ({data.change_percent:+.1f}%)")
-            
-            analysis_context = f"""
-            Analyze {symbol} with the following market data:
-            - Current Price: ${data.price}
-            - Daily Change: {data.change_percent:+.1f}%
-            - Volume: {data.volume:,}
-            - Bid/Ask: ${data.bid}/${data.ask}
-            
-            Provide your specialized analysis for this asset.
-            """
-            
-            # Parallel analysis by specialists
-            analysis_tasks = [
-                ("MarketAnalyst", "technical_analysis"),
-                ("FundamentalAnalyst", "fundamental_analysis"),
-                ("SentimentAnalyst", "sentiment_analysis")
-            ]
-            
-            symbol_analysis = {}
-            for agent_name, analysis_type in analysis_tasks:
-                input_msg = Message(role="user", content=analysis_context)
-                result = await rt.call_agent(agent_name, input_msg)
-                symbol_analysis[analysis_type] = result.current_message.content
-                agent_display = agent_name.replace("Analyst", "")
-                print(f"   📈 {agent_display}: {result.current_message.content[:60]}...")
-            
-            # Orchestrator synthesis
-            synthesis_input = Message(role="user", content=f"""
-            Synthesize the analysis for {symbol}:
-            
-            Technical Analysis: {symbol_analysis['technical_analysis']}
-            Fundamental Analysis: {symbol_analysis['fundamental_analysis']}
-            Sentiment Analysis: {symbol_analysis['sentiment_analysis']}
-            
-            Provide overall trading recommendation and rationale.
-            """)
-            
-            synthesis_result = await rt.call_agent("TradingOrchestrator", synthesis_input)
-            symbol_analysis["trading_recommendation"] = synthesis_result.current_message.content
-            print(f"   🎯 Recommendation: {synthesis_result.current_message.content[:80]}...")
-            
-            analysis_results[symbol] = symbol_analysis
-    
+        # Symbols don't depend on each other either, so they are analyzed concurrently
+        analyzed = [symbol for symbol in symbols if symbol in market_data]
+        results = await asyncio.gather(
+            *(analyze_symbol(rt, symbol, market_data[symbol]) for symbol in analyzed)
+        )
+        analysis_results = dict(zip(analyzed, results))
+
     return analysis_results
 
+
 async def execute_trade_evaluation(trade_request: str) -> Dict:
     """Evaluate a potential trade through the risk management process."""
-    
+
     print(f"⚖️ Trade Evaluation: {trade_request}")
     print("=" * 50)
-    
+
     evaluation_results = {}
     portfolio = generate_sample_portfolio()
-    
+
     async with app.run_context() as rt:
         # Risk assessment
         print("\n🛡️ Risk Assessment")
-        risk_input = Message(role="user", content=f"""
+        risk_input = Message(
+            role="user",
+            content=f"""
         Evaluate the risk for this trade request: {trade_request}
         
         Current portfolio positions:
         {json.dumps({k: f"{v.symbol}: {v.quantity} shares @ ${v.entry_price}" for k, v in portfolio.items()}, indent=2)}
         
         Assess position sizing, portfolio impact, and risk compliance.
-        """)
-        
+        """,
+        )
+
         risk_result = await rt.call_agent("RiskManager", risk_input)
         evaluation_results["risk_assessment"] = risk_result.current_message.content
         print(f"   Risk: {risk_result.current_message.content[:80]}...")
-        
-        # Portfolio impact analysis  
+
+        # Portfolio impact analysis
         print("\n📊 Portfolio Impact Analysis")
-        portfolio_input = Message(role="user", content=f"""
+        portfolio_input = Message(
+            role="user",
+            content=f"""
         Analyze portfolio impact for: {trade_request}
         
         Current portfolio allocation and the proposed trade's impact on diversification,
         sector exposure, and strategic allocation targets.
-        """)
-        
+        """,
+        )
+
         portfolio_result = await rt.call_agent("PortfolioManager", portfolio_input)
-        evaluation_results["portfolio_impact"] = portfolio_result.current_message.content
+        evaluation_results["portfolio_impact"] = (
+            portfolio_result.current_message.content
+        )
         print(f"   Portfolio: {portfolio_result.current_message.content[:80]}...")
-        
+
         # Execution planning
         print("\n⚡ Execution Planning")
-        execution_input = Message(role="user", content=f"""
+        execution_input = Message(
+            role="user",
+            content=f"""
         Plan execution strategy for: {trade_request}
         
         Consider optimal timing, order types, and execution methodology
         to minimize market impact and maximize efficiency.
-        """)
-        
+        """,
+        )
+
         execution_result = await rt.call_agent("AlgorithmicTrader", execution_input)
         evaluation_results["execution_plan"] = execution_result.current_message.content
         print(f"   Execution: {execution_result.current_message.content[:80]}...")
-        
+
         # Final orchestration decision
         print("\n🎯 Final Trading Decision")
-        decision_input = Message(role="user", content=f"""
+        decision_input = Message(
+            role="user",
+            content=f"""
         Make final trading decision for: {trade_request}
         
         Risk Assessment: {evaluation_results['risk_assessment']}
@@ -497,105 +609,122 @@ async def execute_trade_evaluation(trade_request: str) -> Dict:
         Execution Plan: {evaluation_results['execution_plan']}
         
         Approve, modify, or reject the trade with clear rationale.
-        """)
-        
+        """,
+        )
+
         decision_result = await rt.call_agent("TradingOrchestrator", decision_input)
         evaluation_results["final_decision"] = decision_result.current_message.content
         print(f"   Decision: {decision_result.current_message.content[:80]}...")
-    
+
     return evaluation_results
 
+
 # ===== DEMO FUNCTIONS =====
 
+
 async def demo_market_analysis():
     """Demonstrate comprehensive market analysis."""
     print("📊 Market Analysis Demo")
     print("=" * 50)
-    
+
     symbols = ["AAPL", "GOOGL", "TSLA"]
     await execute_market_analysis(symbols)
 
+
 async def demo_trade_evaluation():
     """Demonstrate trade evaluation process."""
     print("\n⚖️ Trade Evaluation Demo")
     print("=" * 50)
-    
+
     trade_request = "Buy 50 shares of NVDA at market price"
     await execute_trade_evaluation(trade_request)
 
+
 async def demo_portfolio_review():
     """Demonstrate portfolio review and rebalancing."""
     print("\n📊 Portfolio Review Demo")
     print("=" * 50)
-    
+
     portfolio = generate_sample_portfolio()
-    
+
     async with app.run_context() as rt:
         print("📋 Current Portfolio:")
         for symbol, position in portfolio.items():
             pnl_color = "🟢" if position.unrealized_pnl > 0 else "🔴"
-            print(f"   {symbol}: {position.quantity} shares @ ${position.entry_price} "
-                  f"(Current: ${position.current_price}) {pnl_color} ${position.unrealized_pnl}")
-        
+            print(
+                f"   {symbol}: {position.quantity} shares @ ${position.entry_price} "
+                f"(Current: ${position.current_price}) {pnl_color} ${position.unrealized_pnl}"
+            )
+
         # Portfolio analysis
-        portfolio_input = Message(role="user", content=f"""
+        portfolio_input = Message(
+            role="user",
+            content=f"""
         Review and analyze the current portfolio:
         
         Positions:
         {json.dumps({k: f"{v.quantity} shares of {v.symbol} @ ${v.entry_price}, current ${v.current_price}, P&L ${v.unrealized_pnl}" for k, v in portfolio.items()}, indent=2)}
         
         Assess allocation, performance, and recommend any rebalancing actions.
-        """)
-        
+        """,
+        )
+
         portfolio_result = await rt.call_agent("PortfolioManager", portfolio_input)
         print(f"\n📊 Portfolio Analysis: {portfolio_result.current_message.content}")
 
+
 async def demo_risk_monitoring():
     """Demonstrate real-time risk monitoring."""
     print("\n🛡️ Risk Monitoring Demo")
     print("=" * 50)
-    
+
     portfolio = generate_sample_portfolio()
-    
+
     async with app.run_context() as rt:
         # Simulate risk scenarios
         risk_scenarios = [
             "Market volatility spike - VIX up 25%",
             "Single position (AAPL) down 8% in one day",
-            "Sector concentration risk - Tech positions correlated"
+            "Sector concentration risk - Tech positions correlated",
         ]
-        
+
         for scenario in risk_scenarios:
             print(f"\n⚠️ Risk Scenario: {scenario}")
-            
-            risk_input = Message(role="user", content=f"""
+
+            risk_input = Message(
+                role="user",
+                content=f"""
             Assess risk impact for scenario: {scenario}
             
             Current portfolio:
             {json.dumps({k: f"{v.symbol}: {v.quantity} shares" for k, v in portfolio.items()}, indent=2)}
             
             Provide risk assessment and recommended actions.
-            """)
-            
+            """,
+            )
+
             risk_result = await rt.call_agent("RiskManager", risk_input)
             print(f"   Risk Assessment: {risk_result.current_message.content[:100]}...")
 
+
 async def demo_algorithmic_strategies():
     """Demonstrate algorithmic trading strategies."""
     print("\n⚡ Algorithmic Trading Strategies Demo")
     print("=" * 50)
-    
+
     strategies = [
         "Momentum strategy - Buy stocks with strong upward momentum",
-        "Mean reversion - Buy oversold stocks near support levels", 
-        "Pairs trading - Long AAPL, short GOOGL on relative value"
+        "Mean reversion - Buy oversold stocks near support levels",
+        "Pairs trading - Long AAPL, short GOOGL on relative value",
     ]
-    
+
     async with app.run_context() as rt:
         for strategy in strategies:
             print(f"\n🤖 Strategy: {strategy}")
-            
-            strategy_input = Message(role="user", content=f"""
+
+            strategy_input = Message(
+                role="user",
+                content=f"""
             Implement algorithmic strategy: {strategy}
             
             Provide execution plan including:
@@ -603,78 +732,90 @@ async def demo_algorithmic_strategies():
             - Position sizing
             - Risk controls  
             - Performance metrics
-            """)
-            
+            """,
+            )
+
             strategy_result = await rt.call_agent("AlgorithmicTrader", strategy_input)
-            print(f"   Implementation: {strategy_result.current_message.content[:100]}...")
+            print(
+                f"   Implementation: {strategy_result.current_message.content[:100]}..."
+            )
+
 
 async def demo_parallel_analysis():
     """Demonstrate parallel analysis across multiple agents."""
     print("\n⚡ Parallel Analysis Demo")
     print("=" * 50)
-    
+
     symbol = "SPY"
     market_data = generate_sample_market_data()[symbol]
-    
+
     async with app.run_context() as rt:
         print(f"📊 Parallel Analysis for {symbol}")
         print(f"💰 Price: ${market_data.price} ({market_data.change_percent:+.1f}%)")
-        
+
         # Parallel analysis by all agents
         agents = [
             "MarketAnalyst",
-            "FundamentalAnalyst", 
+            "FundamentalAnalyst",
             "SentimentAnalyst",
             "RiskManager",
-            "PortfolioManager"
+            "PortfolioManager",
         ]
-        
-        analysis_input = Message(role="user", content=f"Analyze {symbol} from your perspective")
-        
+
+        analysis_input = Message(
+            role="user", content=f"Analyze {symbol} from your perspective"
+        )
+
         tasks = []
         for agent in agents:
             task = rt.call_agent(agent, analysis_input)
             tasks.append((agent, task))
-        
+
         print("\n🎯 Agent Perspectives:")
         for agent, task in tasks:
             result = await task
             agent_name = agent.replace("Manager", "").replace("Analyst", "")
             print(f"   {agent_name}: {result.current_message.content[:70]}...")
 
+
 async def demo_interactive_trading():
     """Interactive trading interface."""
     print("\n💬 Interactive Trading Interface")
     print("=" * 50)
     print("Ask about market analysis, trading strategies, or portfolio management!")
     print("Type 'quit' to exit.\n")
-    
+
     async with app.run_context() as rt:
         while True:
             user_input = input("💹 Trading Query: ").strip()
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if user_input.lower() in ["quit", "exit", "q"]:
                 break
-                
+
             if not user_input:
                 continue
-            
+
             try:
                 # Route to orchestrator for intelligent handling
-                trading_input = Message(role="user", content=f"""
+                trading_input = Message(
+                    role="user",
+                    content=f"""
                 Trading platform query: {user_input}
                 
                 Provide professional trading analysis or recommendation.
                 Always include appropriate disclaimers for educational use only.
-                """)
-                
+                """,
+                )
+
                 result = await rt.call_agent("TradingOrchestrator", trading_input)
                 print(f"🎯 Trading System: {result.current_message.content}\n")
-                
+
             except Exception as e:
                 print(f"❌ Error: {e}\n")
 
+
 # ===== MAIN DEMO =====
 
+
 async def main():
     """Main demo function with user choices."""
     print("💹 TFrameX Financial Trading Platform")
@@ -682,20 +823,20 @@ async def main():
     print("⚠️  EDUCATIONAL SIMULATION ONLY - NOT FOR REAL TRADING")
     print("This example demonstrates multi-agent financial analysis")
     print("and trading coordination using TFrameX patterns.\n")
-    
+
     while True:
         print("Choose a demo:")
         print("1. 📊 Market Analysis Demo")
         print("2. ⚖️ Trade Evaluation Demo")
-        print("3. 📊 Portfolio Review Demo") 
+        print("3. 📊 Portfolio Review Demo")
         print("4. 🛡️ Risk Monitoring Demo")
         print("5. ⚡ Algorithmic Strategies Demo")
         print("6. ⚡ Parallel Analysis Demo")
         print("7. 💬 Interactive Trading Interface")
         print("8. ❌ Exit")
-        
+
         choice = input("\nEnter your choice (1-8): ").strip()
-        
+
         if choice == "1":
             await demo_market_analysis()
         elif choice == "2":
@@ -716,10 +857,15 @@ async def main():
         else:
             print("❌ Invalid choice. Please try again.\n")
 
+
 if __name__ == "__main__":
     print("\n⚠️  IMPORTANT DISCLAIMER:")
     print("This is a demonstration for educational purposes only.")
-    print("This is NOT real trading software and should not be used for actual financial trading.")
-    print("Always consult with qualified financial professionals before making investment decisions.\n")
-    
-    asyncio.run(main())
\ No newline at end of file
+    print(
+        "This is NOT real trading software and should not be used for actual financial trading."
+    )
+    print(
+        "Always consult with qualified financial professionals before making investment decisions.\n"
+    )
+
+    asyncio.run(main())
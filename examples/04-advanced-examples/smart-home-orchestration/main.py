@@ -19,14 +19,16 @@ System Features:
 import asyncio
 import json
 import logging
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, time
+from enum import Enum
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass
-from enum import Enum
 
 from dotenv import load_dotenv
-from tframex import TFrameX, Message, Flow
+
+from tframex import Flow, Message, TFrameX
 from tframex.llms import OpenAILLM
 from tframex.memory import InMemoryMemoryStore
 
@@ -34,17 +36,33 @@ from tframex.memory import InMemoryMemoryStore
 load_dotenv()
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+# WARNING keeps the framework's per-call INFO chatter off the hot path; the demo's
+# print() output already gives the user feedback. A single precompiled formatter
+# is shared by the root handler instead of the default per-record layout.
+LOG_FORMATTER = logging.Formatter("%(message)s")
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(LOG_FORMATTER)
+logging.basicConfig(level=logging.WARNING, handlers=[_log_handler])
 logger = logging.getLogger(__name__)
 
 # Initialize TFrameX app
-app = TFrameX(
-    default_llm=OpenAILLM(),
-    default_memory_store_factory=InMemoryMemoryStore
-)
+app = TFrameX(default_llm=OpenAILLM(), default_memory_store_factory=InMemoryMemoryStore)
+
+# ===== AGENT NAMES =====
+# Interned once so registry lookups, flow steps and call_agent dispatch all share
+# the same string objects instead of re-hashing scattered literals.
+
+AGENT_ORCHESTRATOR = sys.intern("HomeOrchestrator")
+AGENT_LIGHTING = sys.intern("LightingAgent")
+AGENT_CLIMATE = sys.intern("ClimateAgent")
+AGENT_SECURITY = sys.intern("SecurityAgent")
+AGENT_ENERGY = sys.intern("EnergyAgent")
+AGENT_APPLIANCE = sys.intern("ApplianceAgent")
+AGENT_CONTEXT = sys.intern("ContextAgent")
 
 # ===== SMART HOME DATA MODELS =====
 
+
 class RoomType(Enum):
     LIVING_ROOM = "living_room"
     KITCHEN = "kitchen"
@@ -53,6 +71,7 @@ class RoomType(Enum):
     OFFICE = "office"
     GARAGE = "garage"
 
+
 class DeviceType(Enum):
     LIGHTS = "lights"
     THERMOSTAT = "thermostat"
@@ -61,9 +80,11 @@ class DeviceType(Enum):
     APPLIANCE = "appliance"
     SENSOR = "sensor"
 
+
 @dataclass
 class HomeState:
     """Current state of the smart home."""
+
     occupied_rooms: List[str]
     current_temperature: float
     target_temperature: float
@@ -72,10 +93,20 @@ class HomeState:
     time_of_day: str
     weather_outside: str
     resident_preferences: Dict[str, str]
+    # Rendered once, in sorted order, so every prompt embeds identical text
+    preferences_block: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.preferences_block = "\n".join(
+            f"- {key}: {value}"
+            for key, value in sorted(self.resident_preferences.items())
+        )
+
 
 @dataclass
 class DeviceState:
     """State of a smart home device."""
+
     device_id: str
     device_type: DeviceType
     room: str
@@ -83,10 +114,12 @@ class DeviceState:
     settings: Dict[str, str]
     energy_usage: float
 
+
 # ===== SPECIALIZED AGENTS =====
 
+
 @app.agent(
-    name="HomeOrchestrator",
+    name=AGENT_ORCHESTRATOR,
     description="Main coordinator that orchestrates all smart home agents and makes high-level decisions",
     system_prompt="""
     You are the central home orchestration system responsible for:
@@ -106,14 +139,15 @@ class DeviceState:
     
     When making decisions, consider input from all specialist agents and provide
     clear, coordinated instructions for optimal home management.
-    """
+    """,
 )
 async def home_orchestrator():
     """Central coordinator for all smart home systems."""
     pass
 
+
 @app.agent(
-    name="LightingAgent",
+    name=AGENT_LIGHTING,
     description="Manages all lighting systems throughout the home",
     system_prompt="""
     You are the intelligent lighting management system responsible for:
@@ -133,14 +167,15 @@ async def home_orchestrator():
     
     Consider time of day, occupancy, activity type, and energy efficiency.
     Provide specific lighting recommendations with brightness levels and color temperatures.
-    """
+    """,
 )
 async def lighting_agent():
     """Manages intelligent lighting throughout the home."""
     pass
 
+
 @app.agent(
-    name="ClimateAgent", 
+    name=AGENT_CLIMATE,
     description="Controls heating, cooling, and ventilation systems",
     system_prompt="""
     You are the climate control system responsible for:
@@ -160,14 +195,15 @@ async def lighting_agent():
     
     Consider occupancy patterns, weather, energy costs, and comfort preferences.
     Provide specific temperature and ventilation recommendations.
-    """
+    """,
 )
 async def climate_agent():
     """Manages home climate control systems."""
     pass
 
+
 @app.agent(
-    name="SecurityAgent",
+    name=AGENT_SECURITY,
     description="Monitors and manages home security systems",
     system_prompt="""
     You are the home security system responsible for:
@@ -187,14 +223,15 @@ async def climate_agent():
     
     Always prioritize safety and security. Provide clear threat assessments
     and specific security recommendations.
-    """
+    """,
 )
 async def security_agent():
     """Manages home security and monitoring systems."""
     pass
 
+
 @app.agent(
-    name="EnergyAgent",
+    name=AGENT_ENERGY,
     description="Optimizes energy usage and manages utility costs",
     system_prompt="""
     You are the energy management system responsible for:
@@ -214,14 +251,15 @@ async def security_agent():
     
     Balance energy efficiency with comfort and convenience.
     Provide specific recommendations for energy optimization.
-    """
+    """,
 )
 async def energy_agent():
     """Manages energy optimization and cost efficiency."""
     pass
 
+
 @app.agent(
-    name="ApplianceAgent",
+    name=AGENT_APPLIANCE,
     description="Coordinates smart appliances and their optimal operation",
     system_prompt="""
     You are the appliance coordination system responsible for:
@@ -241,14 +279,15 @@ async def energy_agent():
     
     Focus on convenience, efficiency, and proactive maintenance.
     Provide specific appliance scheduling and operation recommendations.
-    """
+    """,
 )
 async def appliance_agent():
     """Coordinates smart appliances throughout the home."""
     pass
 
+
 @app.agent(
-    name="ContextAgent",
+    name=AGENT_CONTEXT,
     description="Analyzes home context, occupancy patterns, and resident preferences",
     system_prompt="""
     You are the context analysis system responsible for:
@@ -268,56 +307,57 @@ async def appliance_agent():
     
     Analyze all available data to provide rich context for home automation decisions.
     Help other agents understand the current situation and resident needs.
-    """
+    """,
 )
 async def context_agent():
     """Analyzes home context and occupancy patterns."""
     pass
 
+
 # ===== ORCHESTRATION FLOWS =====
 
 # Morning routine flow
 morning_routine = Flow(
     flow_name="MorningRoutine",
-    description="Coordinate morning home automation sequence"
+    description="Coordinate morning home automation sequence",
 )
-morning_routine.add_step("ContextAgent")      # Assess morning context
-morning_routine.add_step("ClimateAgent")      # Adjust temperature
-morning_routine.add_step("LightingAgent")     # Morning lighting
-morning_routine.add_step("ApplianceAgent")    # Start morning appliances
-morning_routine.add_step("HomeOrchestrator")  # Final coordination
+morning_routine.add_step(AGENT_CONTEXT)  # Assess morning context
+morning_routine.add_step(AGENT_CLIMATE)  # Adjust temperature
+morning_routine.add_step(AGENT_LIGHTING)  # Morning lighting
+morning_routine.add_step(AGENT_APPLIANCE)  # Start morning appliances
+morning_routine.add_step(AGENT_ORCHESTRATOR)  # Final coordination
 
-# Evening routine flow  
+# Evening routine flow
 evening_routine = Flow(
-    flow_name="EveningRoutine", 
-    description="Coordinate evening home automation sequence"
+    flow_name="EveningRoutine",
+    description="Coordinate evening home automation sequence",
 )
-evening_routine.add_step("ContextAgent")      # Assess evening context
-evening_routine.add_step("SecurityAgent")     # Evening security check
-evening_routine.add_step("LightingAgent")     # Evening lighting
-evening_routine.add_step("ClimateAgent")      # Night temperature
-evening_routine.add_step("HomeOrchestrator")  # Final coordination
+evening_routine.add_step(AGENT_CONTEXT)  # Assess evening context
+evening_routine.add_step(AGENT_SECURITY)  # Evening security check
+evening_routine.add_step(AGENT_LIGHTING)  # Evening lighting
+evening_routine.add_step(AGENT_CLIMATE)  # Night temperature
+evening_routine.add_step(AGENT_ORCHESTRATOR)  # Final coordination
 
 # Energy optimization flow
 energy_optimization = Flow(
     flow_name="EnergyOptimization",
-    description="Optimize home energy usage while maintaining comfort"
+    description="Optimize home energy usage while maintaining comfort",
 )
-energy_optimization.add_step("EnergyAgent")      # Analyze energy usage
-energy_optimization.add_step("ClimateAgent")     # Climate efficiency
-energy_optimization.add_step("ApplianceAgent")   # Appliance scheduling
-energy_optimization.add_step("LightingAgent")    # Lighting efficiency
-energy_optimization.add_step("HomeOrchestrator") # Coordinate optimization
+energy_optimization.add_step(AGENT_ENERGY)  # Analyze energy usage
+energy_optimization.add_step(AGENT_CLIMATE)  # Climate efficiency
+energy_optimization.add_step(AGENT_APPLIANCE)  # Appliance scheduling
+energy_optimization.add_step(AGENT_LIGHTING)  # Lighting efficiency
+energy_optimization.add_step(AGENT_ORCHESTRATOR)  # Coordinate optimization
 
 # Security check flow
 security_check = Flow(
     flow_name="SecurityCheck",
-    description="Comprehensive security assessment and response"
+    description="Comprehensive security assessment and response",
 )
-security_check.add_step("SecurityAgent")      # Security assessment
-security_check.add_step("ContextAgent")       # Context analysis
-security_check.add_step("LightingAgent")      # Security lighting
-security_check.add_step("HomeOrchestrator")   # Response coordination
+security_check.add_step(AGENT_SECURITY)  # Security assessment
+security_check.add_step(AGENT_CONTEXT)  # Context analysis
+security_check.add_step(AGENT_LIGHTING)  # Security lighting
+security_check.add_step(AGENT_ORCHESTRATOR)  # Response coordination
 
 # Register flows
 app.register_flow(morning_routine)
@@ -327,6 +367,7 @@ app.register_flow(security_check)
 
 # ===== SIMULATION FUNCTIONS =====
 
+
 def generate_sample_home_state() -> HomeState:
     """Generate a sample home state for demonstration."""
     return HomeState(
@@ -340,22 +381,69 @@ def generate_sample_home_state() -> HomeState:
         resident_preferences={
             "morning_temp": "71°F",
             "evening_lighting": "warm_dim",
-            "security_mode": "standard"
-        }
+            "security_mode": "standard",
+        },
     )
 
-async def execute_home_automation_scenario(scenario: str, home_state: HomeState) -> Dict:
-    """Execute a specific home automation scenario."""
+
+# Specialists that can work from the raw home state vs. those that need ContextAgent's analysis
+INDEPENDENT_AGENTS = (AGENT_SECURITY, AGENT_ENERGY)
+CONTEXT_DEPENDENT_AGENTS = (AGENT_LIGHTING, AGENT_CLIMATE, AGENT_APPLIANCE)
+
+
+def _specialist_input(
+    scenario: str, home_state: HomeState, context_analysis: Optional[str] = None
+) -> Message:
+    """Build the recommendation request sent to a specialist agent."""
+    context_line = f"Context analysis: {context_analysis}" if context_analysis else ""
+    return Message(
+        role="user",
+        content=f"""
+    Based on this scenario: {scenario}
+    
+    Current home state:
+    - Rooms occupied: {home_state.occupied_rooms}
+    - Temperature: {home_state.current_temperature}°F (target: {home_state.target_temperature}°F)
+    - Time: {home_state.time_of_day}
+    - Weather: {home_state.weather_outside}
+    - Security: {home_state.security_status}
+    - Energy usage: {home_state.energy_usage} kW
     
+    Resident preferences:
+{home_state.preferences_block}
+    
+    {context_line}
+    
+    Provide your specific recommendations for this scenario.
+    """,
+    )
+
+
+async def _consult_agent(
+    rt, agent_name: str, agent_input: Message
+) -> Tuple[str, object]:
+    """Call a specialist and tag the result with its name for as_completed consumers."""
+    return agent_name, await rt.call_agent(agent_name, agent_input)
+
+
+async def execute_home_automation_scenario(
+    scenario: str, home_state: HomeState
+) -> Dict:
+    """Execute a specific home automation scenario."""
+
     print(f"🏠 Executing Scenario: {scenario}")
-    print(f"📊 Home State: {home_state.occupied_rooms}, {home_state.current_temperature}°F, {home_state.time_of_day}")
+    print(
+        f"📊 Home State: {home_state.occupied_rooms}, {home_state.current_temperature}°F, {home_state.time_of_day}"
+    )
     print("=" * 60)
-    
+
     scenario_results = {}
-    
+
     async with app.run_context() as rt:
         # Context analysis first
-        context_input = Message(role="user", content=f"""
+        context_input = Message(
+            role="user",
+            content=f"""
         Analyze the current home context:
         - Occupied rooms: {home_state.occupied_rooms}
         - Current temp: {home_state.current_temperature}°F
@@ -363,41 +451,61 @@ async def execute_home_automation_scenario(scenario: str, home_state: HomeState)
         - Weather: {home_state.weather_outside}
         - Scenario: {scenario}
         
-        Provide context analysis for home automation decisions.
-        """)
-        
-        context_result = await rt.call_agent("ContextAgent", context_input)
-        scenario_results["context_analysis"] = context_result.current_message.content
-        print(f"🧠 Context: {context_result.current_message.content[:100]}...")
-        
-        # Get recommendations from specialist agents
-        agents_to_consult = ["LightingAgent", "ClimateAgent", "SecurityAgent", "EnergyAgent", "ApplianceAgent"]
-        
-        for agent_name in agents_to_consult:
-            agent_input = Message(role="user", content=f"""
-            Based on this scenario: {scenario}
-            
-            Current home state:
-            - Rooms occupied: {home_state.occupied_rooms}
-            - Temperature: {home_state.current_temperature}°F (target: {home_state.target_temperature}°F)
-            - Time: {home_state.time_of_day}
-            - Weather: {home_state.weather_outside}
-            - Security: {home_state.security_status}
-            - Energy usage: {home_state.energy_usage} kW
-            
-            Context analysis: {scenario_results["context_analysis"]}
-            
-            Provide your specific recommendations for this scenario.
-            """)
-            
-            agent_result = await rt.call_agent(agent_name, agent_input)
-            agent_key = agent_name.lower().replace("agent", "_recommendations")
-            scenario_results[agent_key] = agent_result.current_message.content
-            agent_display = agent_name.replace("Agent", "")
-            print(f"🎯 {agent_display}: {agent_result.current_message.content[:80]}...")
+        Resident preferences:
+{home_state.preferences_block}
         
+        Provide context analysis for home automation decisions.
+        """,
+        )
+
+        # Agents that don't need the context analysis start alongside ContextAgent
+        pending = [
+            asyncio.create_task(
+                _consult_agent(rt, agent_name, _specialist_input(scenario, home_state))
+            )
+            for agent_name in INDEPENDENT_AGENTS
+        ]
+
+        try:
+            context_result = await rt.call_agent(AGENT_CONTEXT, context_input)
+            scenario_results["context_analysis"] = (
+                context_result.current_message.content
+            )
+            print(f"🧠 Context: {context_result.current_message.content[:100]}...")
+
+            # Fan out the context-dependent specialists as soon as the context is known
+            pending.extend(
+                asyncio.create_task(
+                    _consult_agent(
+                        rt,
+                        agent_name,
+                        _specialist_input(
+                            scenario, home_state, scenario_results["context_analysis"]
+                        ),
+                    )
+                )
+                for agent_name in CONTEXT_DEPENDENT_AGENTS
+            )
+
+            # Report each recommendation as soon as it arrives
+            for next_done in asyncio.as_completed(pending):
+                agent_name, agent_result = await next_done
+                agent_key = agent_name.lower().replace("agent", "_recommendations")
+                scenario_results[agent_key] = agent_result.current_message.content
+                agent_display = agent_name.replace("Agent", "")
+                print(
+                    f"🎯 {agent_display}: {agent_result.current_message.content[:80]}..."
+                )
+        finally:
+            # A failed agent call must not leave the other calls running
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
         # Final orchestration
-        orchestration_input = Message(role="user", content=f"""
+        orchestration_input = Message(
+            role="user",
+            content=f"""
         Orchestrate the final home automation response for scenario: {scenario}
         
         You have received these specialist recommendations:
@@ -409,21 +517,30 @@ async def execute_home_automation_scenario(scenario: str, home_state: HomeState)
         - Appliances: {scenario_results["appliance_recommendations"]}
         
         Provide coordinated final instructions that balance all considerations.
-        """)
-        
-        orchestration_result = await rt.call_agent("HomeOrchestrator", orchestration_input)
-        scenario_results["final_orchestration"] = orchestration_result.current_message.content
-        print(f"🏠 Orchestrator: {orchestration_result.current_message.content[:100]}...")
-    
+        """,
+        )
+
+        orchestration_result = await rt.call_agent(
+            AGENT_ORCHESTRATOR, orchestration_input
+        )
+        scenario_results["final_orchestration"] = (
+            orchestration_result.current_message.content
+        )
+        print(
+            f"🏠 Orchestrator: {orchestration_result.current_message.content[:100]}..."
+        )
+
     return scenario_results
 
+
 # ===== DEMO FUNCTIONS =====
 
+
 async def demo_morning_routine():
     """Demonstrate morning routine automation."""
     print("🌅 Morning Routine Automation Demo")
     print("=" * 50)
-    
+
     home_state = HomeState(
         occupied_rooms=["bedroom"],
         current_temperature=68.0,
@@ -435,18 +552,19 @@ async def demo_morning_routine():
         resident_preferences={
             "morning_temp": "71°F",
             "wake_time": "7:00 AM",
-            "coffee_ready": "7:15 AM"
-        }
+            "coffee_ready": "7:15 AM",
+        },
     )
-    
+
     scenario = "Resident is waking up, need to prepare home for morning routine"
     await execute_home_automation_scenario(scenario, home_state)
 
+
 async def demo_evening_routine():
     """Demonstrate evening routine automation."""
     print("\n🌙 Evening Routine Automation Demo")
     print("=" * 50)
-    
+
     home_state = HomeState(
         occupied_rooms=["living_room", "kitchen"],
         current_temperature=74.0,
@@ -458,18 +576,19 @@ async def demo_evening_routine():
         resident_preferences={
             "evening_temp": "70°F",
             "bedtime": "10:30 PM",
-            "evening_lighting": "warm_dim"
-        }
+            "evening_lighting": "warm_dim",
+        },
     )
-    
+
     scenario = "Family is settling in for evening, prepare for nighttime routine"
     await execute_home_automation_scenario(scenario, home_state)
 
+
 async def demo_energy_optimization():
     """Demonstrate energy optimization during peak hours."""
     print("\n⚡ Energy Optimization Demo")
     print("=" * 50)
-    
+
     home_state = HomeState(
         occupied_rooms=["office"],
         current_temperature=75.0,
@@ -480,18 +599,19 @@ async def demo_energy_optimization():
         weather_outside="hot, 85°F",
         resident_preferences={
             "max_energy_cost": "$3.00/hour",
-            "comfort_priority": "medium"
-        }
+            "comfort_priority": "medium",
+        },
     )
-    
+
     scenario = "Peak electricity rates in effect, optimize energy usage while maintaining comfort"
     await execute_home_automation_scenario(scenario, home_state)
 
+
 async def demo_security_incident():
     """Demonstrate security incident response."""
     print("\n🚨 Security Incident Response Demo")
     print("=" * 50)
-    
+
     home_state = HomeState(
         occupied_rooms=[],  # Nobody home
         current_temperature=71.0,
@@ -502,18 +622,19 @@ async def demo_security_incident():
         weather_outside="overcast, 62°F",
         resident_preferences={
             "security_level": "high",
-            "notification_method": "mobile_app"
-        }
+            "notification_method": "mobile_app",
+        },
     )
-    
+
     scenario = "Motion detected in living room while home is in away mode - potential security incident"
     await execute_home_automation_scenario(scenario, home_state)
 
+
 async def demo_guest_mode():
     """Demonstrate automation adjustments for guests."""
     print("\n👥 Guest Mode Automation Demo")
     print("=" * 50)
-    
+
     home_state = HomeState(
         occupied_rooms=["living_room", "guest_bedroom", "kitchen"],
         current_temperature=72.0,
@@ -524,34 +645,37 @@ async def demo_guest_mode():
         weather_outside="mild, 65°F",
         resident_preferences={
             "guest_comfort": "high_priority",
-            "privacy_mode": "enabled"
-        }
+            "privacy_mode": "enabled",
+        },
+    )
+
+    scenario = (
+        "Guests staying overnight, adjust home automation for comfort and privacy"
     )
-    
-    scenario = "Guests staying overnight, adjust home automation for comfort and privacy"
     await execute_home_automation_scenario(scenario, home_state)
 
+
 async def demo_parallel_agent_consultation():
     """Demonstrate parallel consultation of multiple agents."""
     print("\n⚡ Parallel Agent Consultation Demo")
     print("=" * 50)
-    
+
     scenario = "Optimize home systems for work-from-home day with video conferences"
     home_state = generate_sample_home_state()
-    
+
     async with app.run_context() as rt:
         print(f"📝 Scenario: {scenario}")
         print(f"🏠 Consulting all agents simultaneously...")
-        
+
         # Parallel consultation
-        agents = ["LightingAgent", "ClimateAgent", "EnergyAgent", "SecurityAgent"]
+        agents = [AGENT_LIGHTING, AGENT_CLIMATE, AGENT_ENERGY, AGENT_SECURITY]
         input_msg = Message(role="user", content=f"Optimize for scenario: {scenario}")
-        
+
         tasks = []
         for agent in agents:
             task = rt.call_agent(agent, input_msg)
             tasks.append((agent, task))
-        
+
         # Collect results
         print("\n🎯 Agent Recommendations:")
         for agent, task in tasks:
@@ -559,27 +683,30 @@ async def demo_parallel_agent_consultation():
             agent_name = agent.replace("Agent", "")
             print(f"   {agent_name}: {result.current_message.content[:60]}...")
 
+
 async def demo_interactive_home_control():
     """Interactive home control interface."""
     print("\n💬 Interactive Smart Home Control")
     print("=" * 50)
     print("Describe a home automation scenario or ask for recommendations!")
     print("Type 'quit' to exit.\n")
-    
+
     home_state = generate_sample_home_state()
-    
+
     async with app.run_context() as rt:
         while True:
             user_input = input("🏠 Home Command: ").strip()
-            if user_input.lower() in ['quit', 'exit', 'q']:
+            if user_input.lower() in ["quit", "exit", "q"]:
                 break
-                
+
             if not user_input:
                 continue
-            
+
             try:
                 # Route to orchestrator for intelligent handling
-                home_input = Message(role="user", content=f"""
+                home_input = Message(
+                    role="user",
+                    content=f"""
                 Home automation request: {user_input}
                 
                 Current home state:
@@ -590,16 +717,19 @@ async def demo_interactive_home_control():
                 - Security: {home_state.security_status}
                 
                 Provide intelligent home automation response.
-                """)
-                
-                result = await rt.call_agent("HomeOrchestrator", home_input)
+                """,
+                )
+
+                result = await rt.call_agent(AGENT_ORCHESTRATOR, home_input)
                 print(f"🏠 System: {result.current_message.content}\n")
-                
+
             except Exception as e:
                 print(f"❌ Error: {e}\n")
 
+
 # ===== MAIN DEMO =====
 
+
 async def main():
     """Main demo function with user choices."""
     print("🏠 TFrameX Smart Home Orchestration")
@@ -607,20 +737,20 @@ async def main():
     print("This advanced example demonstrates intelligent home")
     print("automation using coordinated multi-agent systems")
     print("for lighting, climate, security, and energy management.\n")
-    
+
     while True:
         print("Choose a demo:")
         print("1. 🌅 Morning Routine Automation")
-        print("2. 🌙 Evening Routine Automation") 
+        print("2. 🌙 Evening Routine Automation")
         print("3. ⚡ Energy Optimization Demo")
         print("4. 🚨 Security Incident Response")
         print("5. 👥 Guest Mode Automation")
         print("6. ⚡ Parallel Agent Consultation")
         print("7. 💬 Interactive Home Control")
         print("8. ❌ Exit")
-        
+
         choice = input("\nEnter your choice (1-8): ").strip()
-        
+
         if choice == "1":
             await demo_morning_routine()
         elif choice == "2":
@@ -641,5 +771,6 @@ async def main():
         else:
             print("❌ Invalid choice. Please try again.\n")
 
+
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -16,24 +16,43 @@ License: MIT
 """
 
 import asyncio
+import contextvars
+import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import posixpath
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set, Tuple, Union
 
 from dotenv import load_dotenv
 
+try:
+    import uvloop  # Optional faster event loop: pip install tframex[speedups]
+except ImportError:
+    uvloop = None
+
 from tframex import (
+    CachingLLM,
     DiscussionPattern,
+    FileCacheBackend,
     Flow,
+    FlowCache,
     InMemoryMemoryStore,
     Message,
     OpenAIChatLLM,
     ParallelPattern,
     RouterPattern,
+    SemanticCache,
     SequentialPattern,
+    SQLiteCacheBackend,
     TFrameXApp,
     TFrameXRuntimeContext,
 )
+from tframex.util.cache import make_cache_key
+from tframex.util.text import extract_code_block
+from tframex.util.tokens import truncate_by_tokens
 
 # --- Environment and Logging Setup ---
 load_dotenv()
@@ -42,7 +61,9 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(name)s - [%(funcName)s] - %(message)s",
 )
 logging.getLogger("tframex").setLevel(logging.INFO)
-logging.getLogger("tframex.agents.llm_agent").setLevel(logging.DEBUG)
+# Agent DEBUG logs format every prompt and response (often tens of KB of HTML); opt in only
+if os.getenv("TFRAMEX_DEBUG") == "1":
+    logging.getLogger("tframex.agents.llm_agent").setLevel(logging.DEBUG)
 
 logger = logging.getLogger("website_designer")
 
@@ -51,41 +72,373 @@ default_llm_config = OpenAIChatLLM(
     model_name=os.getenv("OPENAI_MODEL_NAME", "gpt-3.5-turbo"),
     api_base_url=os.getenv("OPENAI_API_BASE", "http://localhost:11434/v1"),
     api_key=os.getenv("OPENAI_API_KEY", "ollama"),
+    # Matches the server's batch size so page workers, styling and review calls wait their
+    # turn client-side instead of queueing (and timing out) on the server
+    max_concurrent_requests=int(os.getenv("LLM_MAX_INFLIGHT", "8")),
 )
 
 if not default_llm_config.api_base_url:
     logger.error("Error: OPENAI_API_BASE not set for default LLM.")
     exit(1)
 
+# --- LLM Response Cache ---
+# Deterministic (temperature 0) calls such as the batched reviews are stored on disk keyed
+# by the SHA-256 of the request, so repeated runs replay them instead of re-querying the
+# model. Sampled calls always reach the model. Disable with LLM_CACHE_ENABLED=0.
+LLM_CACHE_TTL_SECONDS = 7 * 86400
+if os.getenv("LLM_CACHE_ENABLED", "1") != "0":
+    llm = CachingLLM(
+        default_llm_config,
+        backend=FileCacheBackend(
+            os.getenv("LLM_CACHE_DIR", ".website_designer_llm_cache")
+        ),
+        ttl=LLM_CACHE_TTL_SECONDS,
+        max_cacheable_temperature=0.0,
+    )
+else:
+    llm = default_llm_config
+
 # --- Initialize TFrameX Application ---
-app = TFrameXApp(default_llm=default_llm_config)
+app = TFrameXApp(default_llm=llm)
+
+# --- Flow Result Cache ---
+# Re-running the flow with identical requirements (common while iterating on the demo)
+# replays the stored result and rewrites the files it produced instead of re-invoking every
+# agent. This switch covers every result cache below (site, pages and plans): with it on,
+# a repeated request gets the earlier site back rather than a fresh sample from the model.
+# Disable with WEBSITE_CACHE_ENABLED=0.
+RESULT_CACHE_ENABLED = os.getenv("WEBSITE_CACHE_ENABLED", "1") != "0"
+FLOW_CACHE_TTL_SECONDS = 86400
+
+# User-supplied requirements are capped so a verbose answer can't blow the context window
+MAX_REQUIREMENTS_TOKENS = 2048
+flow_cache = FlowCache(
+    backend=SQLiteCacheBackend(
+        os.getenv("WEBSITE_DESIGNER_CACHE_DB", ".website_designer_cache.db")
+    ),
+    default_ttl=FLOW_CACHE_TTL_SECONDS,
+)
+
+# --- Page Cache ---
+# Pages are cached one HTMLDeveloper call at a time, keyed on the requirements and that call's
+# page specs only (not the assembled prompt). Rerunning after editing the shared instructions,
+# or with a plan where only some pages changed, replays the files of every unchanged page.
+page_cache = FlowCache(backend=flow_cache.backend, default_ttl=FLOW_CACHE_TTL_SECONDS)
+
+# --- Semantic Plan Cache ---
+# Reworded requests ("a coffee shop website" / "make me a coffee shop site") reuse the
+# content plan of a similar earlier request and skip the planning call. Needs an embedding
+# model on the same endpoint (EMBEDDING_MODEL_NAME); disabled when unset or when
+# WEBSITE_CACHE_ENABLED=0.
+EMBEDDING_MODEL_NAME = os.getenv("EMBEDDING_MODEL_NAME")
+PLAN_SIMILARITY_THRESHOLD = 0.92
+
+
+async def embed_requirements(text: str) -> List[float]:
+    (vector,) = await default_llm_config.embed([text], model=EMBEDDING_MODEL_NAME)
+    return vector
+
+
+plan_cache = (
+    SemanticCache(
+        embed_requirements,
+        backend=flow_cache.backend,
+        similarity_threshold=PLAN_SIMILARITY_THRESHOLD,
+        default_ttl=FLOW_CACHE_TTL_SECONDS,
+        namespace="website_plan",
+    )
+    if EMBEDDING_MODEL_NAME and RESULT_CACHE_ENABLED
+    else None
+)
+
+# Pages of the same site with reworded page descriptions are replayed the same way once the
+# exact page cache misses. A hit must also name the same page files and come from the same
+# requirements (compared case- and whitespace-insensitively), so a similar-looking request
+# never gets another site's files. Set stricter than plans: the shared requirements
+# dominate the text, so page-level differences move the score less.
+PAGE_SIMILARITY_THRESHOLD = 0.95
+page_semantic_cache = (
+    SemanticCache(
+        embed_requirements,
+        backend=flow_cache.backend,
+        similarity_threshold=PAGE_SIMILARITY_THRESHOLD,
+        default_ttl=FLOW_CACHE_TTL_SECONDS,
+        namespace="website_page",
+    )
+    if EMBEDDING_MODEL_NAME and RESULT_CACHE_ENABLED
+    else None
+)
 
 
 # --- Tools Definition ---
+# Files are written off the event loop so concurrent agents (HTMLDeveloper/CSSDesigner run
+# in parallel) don't stall each other on disk I/O. Content is encoded once and written with
+# os.write on a descriptor opened with O_CREAT|O_TRUNC, bypassing the io buffer layers (and
+# the fstat open() does to size them), so a file costs one open, one write and one close.
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+)  # No \r\n on Windows
+
+
+# Agents may only write inside OUTPUT_DIR. It is resolved once; each target is resolved
+# against it and must share it as a common path, which rejects "../", absolute paths and
+# drive letters alike without false positives on names such as "about..backup.html".
+OUTPUT_DIR = os.path.realpath(os.getenv("WEBSITE_OUTPUT_DIR", "."))
+
+
+def _resolve_output_path(file_path: str) -> str:
+    full_path = os.path.realpath(os.path.join(OUTPUT_DIR, file_path))
+    if os.path.commonpath([OUTPUT_DIR, full_path]) != OUTPUT_DIR:
+        raise ValueError(f"Path '{file_path}' is outside the output directory")
+    return full_path
+
+
+# Directories created so far (with their ancestors), so batch writes into the same tree
+# skip the makedirs stat walk after the first time
+_created_dirs: Set[str] = set()
+
+
+def _ensure_parent_dirs(file_paths: List[str]) -> None:
+    """
+    Creates every missing parent directory of a batch in one pass. The parents and their
+    ancestors are collected first, stopping at known directories and at OUTPUT_DIR, then made
+    shallowest first with one os.mkdir each, so pages sharing a subtree don't each walk it
+    again through os.makedirs.
+    """
+    missing: Set[str] = set()
+    for parent in {os.path.dirname(path) for path in file_paths}:
+        while parent and parent not in _created_dirs and parent not in missing:
+            missing.add(parent)
+            if parent == OUTPUT_DIR:
+                break
+            parent = os.path.dirname(parent)
+    for directory in sorted(missing, key=lambda path: path.count(os.sep)):
+        try:
+            os.mkdir(directory)
+        except FileExistsError:
+            pass
+        except (
+            FileNotFoundError
+        ):  # Something above it (e.g. OUTPUT_DIR's parent) is missing too
+            os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+
+# Every page shares the same document scaffold, so page prompts ask HTMLDeveloper for just the
+# page's head elements (<title>, meta description) and its <body>, and the doctype, charset,
+# viewport and stylesheet link are added here on write instead of generated for every page.
+# Content that already is a full document is written unchanged.
+_FULL_DOCUMENT_MARKERS = ("<!doctype", "<html")
+
+
+def _wrap_in_scaffold(file_path: str, content: str) -> str:
+    if not file_path.endswith(".html"):
+        return content
+    opening = content[:1024].lower()
+    if any(marker in opening for marker in _FULL_DOCUMENT_MARKERS):
+        return content
+    body_start = opening.find("<body")
+    if body_start < 0:
+        head, body = "", f"<body>\n{content.strip()}\n</body>"
+    else:
+        head, body = content[:body_start].strip(), content[body_start:].strip()
+    if "<title" not in head.lower():
+        title = Path(file_path).stem.replace("-", " ").replace("_", " ").title()
+        head = f"<title>{title}</title>\n{head}".rstrip()
+    stylesheet = posixpath.relpath(
+        "styles.css", posixpath.dirname(file_path.replace(os.sep, "/")) or "."
+    )
+    return (
+        '<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="UTF-8">\n'
+        '<meta name="viewport" content="width=device-width, initial-scale=1.0">\n'
+        f'{head}\n<link rel="stylesheet" href="{stylesheet}">\n</head>\n{body}\n</html>\n'
+    )
+
+
+def _write_text_file(file_path: str, content: str) -> None:
+    # Parent directories are only created when the open fails, so the common case
+    # (directory already there) costs a single open() and one thread hop per file.
+    full_path = _resolve_output_path(file_path)
+    data = memoryview(_wrap_in_scaffold(file_path, content).encode("utf-8"))
+    try:
+        fd = os.open(full_path, _WRITE_FLAGS, 0o644)
+    except FileNotFoundError:
+        _created_dirs.discard(
+            os.path.dirname(full_path)
+        )  # Removed since it was created
+        _ensure_parent_dirs([full_path])
+        fd = os.open(full_path, _WRITE_FLAGS, 0o644)
+    try:
+        while (
+            data
+        ):  # A regular file takes it all at once; loop in case of a short write
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
+    _small_file_cache.pop(full_path, None)
+    _record_written_file(file_path)
+
+
+def _write_text_files(files: List[Dict[str, str]]) -> List[Optional[Exception]]:
+    """Writes a batch of files in one pass; returns each file's error (None on success)."""
+    resolved = [
+        _resolve_output_path(entry["path"]) for entry in files
+    ]  # Reject the batch before writing any of it
+    _ensure_parent_dirs(resolved)
+    errors: List[Optional[Exception]] = []
+    for entry in files:
+        try:
+            _write_text_file(entry["path"], entry.get("content", ""))
+            errors.append(None)
+        except Exception as e:
+            errors.append(e)
+    return errors
+
+
+# Every file the agents create goes through _write_text_file, so the write-log is the
+# authoritative list of outputs for the current run; no directory scan or LLM call needed.
+# Tool calls (and the threads they write from) inherit the run's context, so they share its set.
+_written_files: contextvars.ContextVar[Optional[Set[str]]] = contextvars.ContextVar(
+    "written_files", default=None
+)
+
+
+# Files written by the current agent call only; lets the page cache snapshot one call's output.
+_call_written_files: contextvars.ContextVar[Optional[Set[str]]] = (
+    contextvars.ContextVar("call_written_files", default=None)
+)
+
+
+def _record_written_file(file_path: str) -> None:
+    for written in (_written_files.get(), _call_written_files.get()):
+        if written is not None:
+            written.add(file_path)
+
+
+def start_write_log() -> Set[str]:
+    """Begin a fresh write-log for the current run and return it."""
+    written: Set[str] = set()
+    _written_files.set(written)
+    return written
+
+
+# WebsiteCoordinator re-reads and re-lists the same files during review. Directory
+# listings are memoized per directory mtime, and small files per (mtime, size), so
+# repeat lookups skip the filesystem until something actually changes.
+SMALL_FILE_CACHE_LIMIT = 4096  # bytes
+# Reads, listings and writes all resolve paths under OUTPUT_DIR, so the caches are keyed on
+# that resolved path and agents read back exactly what they wrote.
+_small_file_cache: Dict[str, Tuple[int, int, str]] = (
+    {}
+)  # full path -> (mtime_ns, size, content)
+
+
+@lru_cache(maxsize=128)
+def _scan_directory(directory_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    with os.scandir(directory_path) as entries:
+        return tuple(entry.name for entry in entries)
+
+
+def _list_directory(directory_path: str) -> Tuple[str, ...]:
+    full_path = _resolve_output_path(directory_path)
+    return _scan_directory(full_path, os.stat(full_path).st_mtime_ns)
+
+
+def _snapshot_files(file_paths: Set[str]) -> Dict[str, str]:
+    return {
+        path: Path(_resolve_output_path(path)).read_text(encoding="utf-8")
+        for path in sorted(file_paths)
+    }
+
+
+def _restore_files(files: Dict[str, str]) -> None:
+    # A replayed page set is written as one batch, so its directories are set up in one pre-pass
+    errors = _write_text_files(
+        [{"path": path, "content": content} for path, content in files.items()]
+    )
+    for error in errors:
+        if error is not None:
+            raise error
+
+
+def _read_text_file(file_path: str) -> str:
+    full_path = _resolve_output_path(file_path)
+    stat = os.stat(full_path)
+    cached = _small_file_cache.get(full_path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    content = Path(full_path).read_text(encoding="utf-8")
+    if stat.st_size <= SMALL_FILE_CACHE_LIMIT:
+        _small_file_cache[full_path] = (stat.st_mtime_ns, stat.st_size, content)
+    return content
+
+
 @app.tool(description="Writes content to a file in the website directory.")
 async def write_file(file_path: str, content: str) -> str:
-    """Write content to a file, creating directories if needed."""
+    """Write content to a file, creating directories if needed (a one-file write_files batch)."""
+    return await write_files([{"path": file_path, "content": content}])
+
+
+@app.tool(
+    description="Writes several files in one call. Use this to save a whole page set at once.",
+    parameters_schema={
+        "properties": {
+            "files": {
+                "type": "array",
+                "description": "List of objects with 'path' (or 'file_path') and 'content' keys, one per file.",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "path": {
+                            "type": "string",
+                            "description": "File path in the website directory.",
+                        },
+                        "content": {
+                            "type": "string",
+                            "description": "Full file content.",
+                        },
+                    },
+                    "required": ["path", "content"],
+                },
+            }
+        },
+        "required": ["files"],
+    },
+)
+async def write_files(files: List[Dict[str, str]]) -> str:
+    """Write multiple files in one worker-thread pass, creating each parent directory once."""
     try:
-        # Ensure the directory exists
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(content)
-        
-        logger.info(f"File written successfully: {file_path}")
-        return f"File written successfully: {file_path}"
+        # Models often reuse write_file's argument name for the path
+        files = [
+            {
+                "path": entry.get("path") or entry["file_path"],
+                "content": entry.get("content", ""),
+            }
+            for entry in files
+        ]
+        paths = [entry["path"] for entry in files]
+        results = await asyncio.to_thread(_write_text_files, files)
     except Exception as e:
-        error_msg = f"Error writing file {file_path}: {str(e)}"
+        error_msg = f"Error preparing files for writing: {str(e)}"
         logger.error(error_msg)
         return error_msg
 
+    report = []
+    for path, result in zip(paths, results):
+        if result is not None:
+            logger.error(f"Error writing file {path}: {result}")
+            report.append(f"Error writing file {path}: {str(result)}")
+        else:
+            report.append(f"File written successfully: {path}")
+    logger.info(f"Batch write finished for {len(paths)} files")
+    return "\n".join(report)
+
 
-@app.tool(description="Reads content from an existing file.")
+@app.tool(description="Reads content from an existing file in the website directory.")
 async def read_file(file_path: str) -> str:
     """Read content from an existing file."""
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
+        content = await asyncio.to_thread(_read_text_file, file_path)
         logger.info(f"File read successfully: {file_path}")
         return content
     except FileNotFoundError:
@@ -98,11 +451,22 @@ async def read_file(file_path: str) -> str:
         return error_msg
 
 
-@app.tool(description="Lists files in a directory.")
+@app.tool(
+    description="Lists every file written so far in this run, without scanning the disk."
+)
+async def written_files() -> str:
+    """Return the paths recorded by write_file/write_files in this run."""
+    written = _written_files.get()
+    if not written:
+        return "No files have been written in this run."
+    return "\n".join(sorted(written))
+
+
+@app.tool(description="Lists files in a directory of the website directory.")
 async def list_files(directory_path: str = ".") -> str:
     """List files in the specified directory."""
     try:
-        files = os.listdir(directory_path)
+        files = await asyncio.to_thread(_list_directory, directory_path)
         file_list = "\n".join(files)
         logger.info(f"Listed {len(files)} files in {directory_path}")
         return f"Files in {directory_path}:\n{file_list}"
@@ -112,25 +476,172 @@ async def list_files(directory_path: str = ".") -> str:
         return error_msg
 
 
+# --- Batched Review ---
+# Reviewing files one by one costs an LLM round-trip per file. Instead, files are packed
+# into JSON batches (one chat completion per batch) and batches run with bounded
+# concurrency.
+REVIEW_BATCH_SIZE = 10
+REVIEW_MAX_CONCURRENCY = 4
+REVIEW_INSTRUCTIONS = (
+    "You are a meticulous web code reviewer. The user message is a JSON array of "
+    "objects with 'file' and 'content' keys. Review every file for correctness, "
+    "accessibility, responsiveness and consistency. Respond with a JSON object of the "
+    'form {"reviews": [{"file": "<path>", "issues": ["<issue>", ...]}]} containing '
+    "exactly one entry per input file."
+)
+
+
+async def batch_critique(
+    items: List[Dict[str, str]],
+    batch_size: int = REVIEW_BATCH_SIZE,
+    max_concurrency: int = REVIEW_MAX_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """Critique many {file, content} items using one LLM call per batch."""
+    semaphore = asyncio.Semaphore(max_concurrency)
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+
+    async def review_batch(batch: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            response = await llm.chat_completion(
+                [
+                    Message(role="system", content=REVIEW_INSTRUCTIONS),
+                    Message(role="user", content=json.dumps(batch)),
+                ],
+                response_format={"type": "json_object"},
+                temperature=0,
+            )
+        try:
+            # Models often wrap the JSON in a ```json fence despite response_format
+            content = response.content or "{}"
+            return json.loads(extract_code_block(content) or content).get("reviews", [])
+        except (json.JSONDecodeError, AttributeError):
+            logger.warning(
+                f"Could not parse batched review response: {str(response.content)[:200]}"
+            )
+            return [
+                {
+                    "file": item["file"],
+                    "issues": ["Review unavailable (unparseable response)."],
+                }
+                for item in batch
+            ]
+
+    results = await asyncio.gather(*(review_batch(batch) for batch in batches))
+    return [review for batch_reviews in results for review in batch_reviews]
+
+
+@app.tool(
+    description="Reviews several website files at once and reports issues per file.",
+    parameters_schema={
+        "properties": {
+            "file_paths": {
+                "type": "array",
+                "description": "Paths of the files to review.",
+                "items": {"type": "string"},
+            }
+        },
+        "required": ["file_paths"],
+    },
+)
+async def review_files(file_paths: List[str]) -> str:
+    """Read the given files and critique them in batched LLM calls."""
+    items = []
+    for path in file_paths:
+        try:
+            items.append(
+                {
+                    "file": path,
+                    "content": await asyncio.to_thread(_read_text_file, path),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"Skipping review of {path}: {e}")
+    if not items:
+        return "No readable files to review."
+
+    reviews = await batch_critique(items)
+    logger.info(
+        f"Reviewed {len(items)} files in {-(-len(items) // REVIEW_BATCH_SIZE)} batched call(s)"
+    )
+    return json.dumps(reviews, indent=2)
+
+
+# --- System Prompts ---
+# Kept as fixed module-level strings with no per-call interpolation, so every request
+# from an agent starts with a byte-identical system prefix that provider-side prompt
+# caching (OpenAI automatic prefix caching, Anthropic cache_control) can reuse.
+# The two prompts sent on every page-pipeline call (the plan, then one HTMLDeveloper call per
+# page) are kept terse: each is prefilled once per call, so their length is paid N times.
+CONTENT_STRATEGIST_PROMPT = (
+    "You are a website Content Strategist. From the client's requirements and audience, plan the "
+    "site: structure and navigation, tone and key messages, per-page content outlines and SEO "
+    "keywords, all tied to the business goals."
+)
+
+HTML_DEVELOPER_PROMPT = (
+    "You are an expert HTML Developer. Write valid, mobile-first HTML5 using semantic elements "
+    "(header, nav, main, section, article, footer), WCAG accessibility (alt text, ARIA labels, "
+    "heading order) and meaningful class names."
+)
+
+CSS_DESIGNER_PROMPT = (
+    "You are a CSS Designer specializing in modern web design. Your role is to:\n"
+    "1. Create beautiful, responsive CSS designs\n"
+    "2. Implement modern CSS techniques (Grid, Flexbox, Custom Properties)\n"
+    "3. Ensure mobile-first responsive design\n"
+    "4. Create consistent design systems\n"
+    "5. Optimize for performance and maintainability\n\n"
+    "When creating CSS:\n"
+    "- Use CSS Grid and Flexbox for layouts\n"
+    "- Implement CSS custom properties for theming\n"
+    "- Follow BEM or similar naming conventions\n"
+    "- Create smooth animations and transitions\n"
+    "- Ensure excellent mobile experience\n"
+    "- Use modern CSS features appropriately\n"
+    "You can use CSS frameworks like Tailwind CSS if appropriate."
+)
+
+UIUX_DESIGNER_PROMPT = (
+    "You are a UI/UX Designer with expertise in web interfaces. Your role is to:\n"
+    "1. Design intuitive user interfaces\n"
+    "2. Create excellent user experiences\n"
+    "3. Ensure accessibility and usability\n"
+    "4. Design consistent visual hierarchies\n"
+    "5. Optimize for conversion and engagement\n\n"
+    "Consider:\n"
+    "- User journey and flow\n"
+    "- Information architecture\n"
+    "- Visual hierarchy and typography\n"
+    "- Color psychology and accessibility\n"
+    "- Interactive elements and micro-interactions\n"
+    "- Mobile-first design principles\n"
+    "Provide detailed design specifications and recommendations."
+)
+
+WEBSITE_COORDINATOR_PROMPT = (
+    "You are the Website Coordinator managing the entire web development project. Your role is to:\n"
+    "1. Coordinate between all team members\n"
+    "2. Ensure project requirements are met\n"
+    "3. Review and approve deliverables\n"
+    "4. Manage project timeline and priorities\n"
+    "5. Ensure quality and consistency across all pages\n\n"
+    "You can call other agents to handle specific tasks:\n"
+    "- ContentStrategist for content planning\n"
+    "- HTMLDeveloper for HTML structure\n"
+    "- CSSDesigner for styling\n"
+    "- UIUXDesigner for design guidance\n\n"
+    "To review deliverables, pass all file paths to review_files in a single call "
+    "rather than reading files one at a time.\n"
+    "Always ensure the final website meets all requirements and quality standards."
+)
+
+
 # --- Agent Definitions ---
 @app.agent(
     name="ContentStrategist",
     description="Plans website content strategy and structure",
-    system_prompt=(
-        "You are a Content Strategist for websites. Your role is to:\n"
-        "1. Analyze the client's requirements and target audience\n"
-        "2. Create a content strategy and site map\n"
-        "3. Define the tone, messaging, and content pillars\n"
-        "4. Outline content for each page\n"
-        "5. Ensure content aligns with business goals\n\n"
-        "Provide detailed content plans including:\n"
-        "- Site structure and navigation\n"
-        "- Content themes and messaging\n"
-        "- Target audience considerations\n"
-        "- SEO considerations\n"
-        "Be strategic and thorough in your planning."
-    ),
-    tools=["write_file", "read_file"]
+    system_prompt=CONTENT_STRATEGIST_PROMPT,
+    tools=["write_file", "read_file"],
 )
 async def content_strategist():
     pass
@@ -139,22 +650,8 @@ async def content_strategist():
 @app.agent(
     name="HTMLDeveloper",
     description="Creates semantic HTML structure and content",
-    system_prompt=(
-        "You are an expert HTML Developer. Your role is to:\n"
-        "1. Create semantic, accessible HTML structures\n"
-        "2. Implement proper HTML5 elements and attributes\n"
-        "3. Ensure cross-browser compatibility\n"
-        "4. Follow web accessibility (WCAG) guidelines\n"
-        "5. Create clean, maintainable code\n\n"
-        "When creating HTML:\n"
-        "- Use semantic elements (header, nav, main, section, article, aside, footer)\n"
-        "- Include proper meta tags and SEO elements\n"
-        "- Ensure mobile-first responsive structure\n"
-        "- Add accessibility attributes (alt text, ARIA labels, etc.)\n"
-        "- Use meaningful class names and IDs\n"
-        "Create complete, valid HTML documents."
-    ),
-    tools=["write_file", "read_file", "list_files"]
+    system_prompt=HTML_DEVELOPER_PROMPT,
+    tools=["write_file", "write_files", "read_file", "list_files"],
 )
 async def html_developer():
     pass
@@ -163,23 +660,8 @@ async def html_developer():
 @app.agent(
     name="CSSDesigner",
     description="Creates modern, responsive CSS styling",
-    system_prompt=(
-        "You are a CSS Designer specializing in modern web design. Your role is to:\n"
-        "1. Create beautiful, responsive CSS designs\n"
-        "2. Implement modern CSS techniques (Grid, Flexbox, Custom Properties)\n"
-        "3. Ensure mobile-first responsive design\n"
-        "4. Create consistent design systems\n"
-        "5. Optimize for performance and maintainability\n\n"
-        "When creating CSS:\n"
-        "- Use CSS Grid and Flexbox for layouts\n"
-        "- Implement CSS custom properties for theming\n"
-        "- Follow BEM or similar naming conventions\n"
-        "- Create smooth animations and transitions\n"
-        "- Ensure excellent mobile experience\n"
-        "- Use modern CSS features appropriately\n"
-        "You can use CSS frameworks like Tailwind CSS if appropriate."
-    ),
-    tools=["write_file", "read_file", "list_files"]
+    system_prompt=CSS_DESIGNER_PROMPT,
+    tools=["write_file", "write_files", "read_file", "list_files"],
 )
 async def css_designer():
     pass
@@ -188,23 +670,8 @@ async def css_designer():
 @app.agent(
     name="UIUXDesigner",
     description="Focuses on user experience and interface design",
-    system_prompt=(
-        "You are a UI/UX Designer with expertise in web interfaces. Your role is to:\n"
-        "1. Design intuitive user interfaces\n"
-        "2. Create excellent user experiences\n"
-        "3. Ensure accessibility and usability\n"
-        "4. Design consistent visual hierarchies\n"
-        "5. Optimize for conversion and engagement\n\n"
-        "Consider:\n"
-        "- User journey and flow\n"
-        "- Information architecture\n"
-        "- Visual hierarchy and typography\n"
-        "- Color psychology and accessibility\n"
-        "- Interactive elements and micro-interactions\n"
-        "- Mobile-first design principles\n"
-        "Provide detailed design specifications and recommendations."
-    ),
-    tools=["write_file", "read_file"]
+    system_prompt=UIUX_DESIGNER_PROMPT,
+    tools=["write_file", "read_file"],
 )
 async def uiux_designer():
     pass
@@ -213,22 +680,21 @@ async def uiux_designer():
 @app.agent(
     name="WebsiteCoordinator",
     description="Coordinates the entire website creation process",
-    system_prompt=(
-        "You are the Website Coordinator managing the entire web development project. Your role is to:\n"
-        "1. Coordinate between all team members\n"
-        "2. Ensure project requirements are met\n"
-        "3. Review and approve deliverables\n"
-        "4. Manage project timeline and priorities\n"
-        "5. Ensure quality and consistency across all pages\n\n"
-        "You can call other agents to handle specific tasks:\n"
-        "- ContentStrategist for content planning\n"
-        "- HTMLDeveloper for HTML structure\n"
-        "- CSSDesigner for styling\n"
-        "- UIUXDesigner for design guidance\n\n"
-        "Always ensure the final website meets all requirements and quality standards."
-    ),
-    callable_agents=["ContentStrategist", "HTMLDeveloper", "CSSDesigner", "UIUXDesigner"],
-    tools=["write_file", "read_file", "list_files"]
+    system_prompt=WEBSITE_COORDINATOR_PROMPT,
+    callable_agents=[
+        "ContentStrategist",
+        "HTMLDeveloper",
+        "CSSDesigner",
+        "UIUXDesigner",
+    ],
+    tools=[
+        "write_file",
+        "write_files",
+        "read_file",
+        "list_files",
+        "written_files",
+        "review_files",
+    ],
 )
 async def website_coordinator():
     pass
@@ -237,37 +703,431 @@ async def website_coordinator():
 # --- Flow Definitions ---
 def create_website_flow() -> Flow:
     """Create the main website generation flow."""
-    
+
     flow = Flow(
         flow_name="WebsiteCreationFlow",
-        description="Complete website creation process from strategy to implementation"
+        description="Complete website creation process from strategy to implementation",
     )
-    
+
     # Sequential flow for website creation
     flow.add_step("ContentStrategist")  # Plan content strategy
     flow.add_step(
         ParallelPattern(
             pattern_name="DesignAndDevelopment",
-            tasks=["HTMLDeveloper", "CSSDesigner", "UIUXDesigner"]
+            tasks=["HTMLDeveloper", "CSSDesigner", "UIUXDesigner"],
         )
     )
     flow.add_step("WebsiteCoordinator")  # Final coordination and review
-    
+
     return flow
 
 
+# --- Pipelined Generation ---
+# Pages are generated while the ContentStrategist is still writing its plan: each page line it
+# streams is queued straight away and picked up by the next free HTMLDeveloper worker.
+PIPELINED_PAGE_GENERATION = True
+PAGE_WORKERS = 8
+PAGE_PLAN_INSTRUCTIONS = (
+    "Start your answer with the site map, one page per line, formatted exactly as\n"
+    "- <file>.html: <one-line description of the page>\n"
+    "then continue with the rest of the content plan."
+)
+# User prompts follow the system prompt with their static instructions, then the run's
+# requirements, then anything call-specific, so the cached prefix extends past the system
+# prompt across runs as well as within one. Single-page and fused calls use the same
+# instructions and differ only in the page list, so every HTMLDeveloper request of a run
+# starts with one common prefix that the provider's prompt cache (and the priming request
+# sent while planning) reuses, however the pages end up batched.
+PAGE_INSTRUCTIONS = (
+    "Answer with one block per page listed below, without calling any tools, formatted exactly as\n"
+    '<file path="<page>.html">\n...\n</file>\n'
+    "Each block holds only the page's <title> and meta description followed by its <body> element; "
+    "the doctype, <head> and the link to the shared stylesheet `styles.css` are added automatically."
+)
+# Sites with at most this many pages are written by a single HTMLDeveloper call, so the
+# requirements prefix is sent (and prefilled) once instead of once per page. The first pages
+# are held back until the site map is complete and shows whether the site is that small;
+# the rest of the content plan keeps streaming meanwhile. 0 disables this.
+FUSED_PAGE_LIMIT = int(os.getenv("FUSED_PAGE_LIMIT", "3"))
+# [ \t] rather than \s so that, with MULTILINE, a match never runs across lines.
+_PAGE_SPEC_RE = re.compile(
+    r"^[ \t]*(?:[-*]|\d+\.)[ \t]*\**`?([\w\-/]+\.html)`?\**[ \t]*[:\-\u2013][ \t]*(.+)$",
+    re.MULTILINE,
+)
+
+
+def parse_page_specs(text: str) -> List[Tuple[str, str]]:
+    """Extracts (page file, description) for every site-map line in text in a single regex scan."""
+    return [
+        (match.group(1), match.group(2).strip())
+        for match in _PAGE_SPEC_RE.finditer(text)
+    ]
+
+
+# HTMLDeveloper returns pages as <file> blocks that are parsed and written here, rather than
+# through write_file/write_files tool calls: no tool call means no second LLM turn to answer
+# the tool result, and the HTML isn't JSON-escaped into the tool arguments.
+# Either quote style is accepted for the path.
+_FILE_BLOCK_RE = re.compile(
+    r"""<file\s+path=(["'])([^"']+)\1\s*>\n?(.*?)</file>""", re.DOTALL
+)
+_FILE_BLOCK_END = "</file>"
+_FENCE_STARTS = ("```", "~~~")
+
+
+def _file_block_content(body: str) -> str:
+    # Models often wrap a block's content in a Markdown code fence as well; write what's inside
+    if body.lstrip().startswith(_FENCE_STARTS):
+        return extract_code_block(body) or ""
+    return body
+
+
+def parse_file_blocks(text: str) -> List[Dict[str, str]]:
+    """Extracts {"path", "content"} for every <file path="..."> block in text in a single regex scan."""
+    return [
+        {"path": match.group(2), "content": _file_block_content(match.group(3))}
+        for match in _FILE_BLOCK_RE.finditer(text)
+    ]
+
+
+async def stream_page_specs(
+    rt: TFrameXRuntimeContext, requirements: str, plan_parts: List[str]
+) -> AsyncGenerator[Optional[Tuple[str, str]], None]:
+    """
+    Yields (page file, description) as soon as each site-map line of the plan has streamed in,
+    then None once a non-site-map line follows them: the page count is final from there on,
+    while the rest of the content plan is still streaming.
+    """
+    pending = ""
+    seen: Set[str] = set()
+    site_map_done = False
+    prompt = f"{PAGE_PLAN_INSTRUCTIONS}\n\nRequirements:\n{requirements}"
+    async for chunk in rt.call_agent_stream("ContentStrategist", prompt):
+        if not chunk.content:
+            continue
+        plan_parts.append(chunk.content)
+        pending += chunk.content
+        cut = pending.rfind("\n")
+        if cut < 0:  # No complete line yet
+            continue
+        # Scan all lines completed by this chunk at once instead of splitting and matching per line
+        complete, pending = pending[:cut], pending[cut + 1 :]
+        tail_start = 0
+        for match in _PAGE_SPEC_RE.finditer(complete):
+            tail_start = match.end()
+            page = match.group(1)
+            if page not in seen:
+                seen.add(page)
+                yield page, match.group(2).strip()
+        if seen and not site_map_done and complete[tail_start:].strip():
+            site_map_done = True
+            yield None
+    for page, description in parse_page_specs(pending):
+        if page not in seen:
+            yield page, description
+
+
+async def plan_page_specs(
+    rt: TFrameXRuntimeContext, requirements: str, plan_parts: List[str]
+) -> AsyncGenerator[Optional[Tuple[str, str]], None]:
+    """
+    Like stream_page_specs, but replays a stored plan instead of calling ContentStrategist:
+    the plan of the same requirements (flow_cache), else that of a similar earlier request
+    when plan_cache has one. Both follow RESULT_CACHE_ENABLED.
+    """
+    cache_key = FlowCache.key_for("ContentStrategist", {"req": requirements})
+    cached_plan = await flow_cache.get(cache_key) if RESULT_CACHE_ENABLED else None
+    if cached_plan is None and plan_cache is not None:
+        try:
+            cached_plan = await plan_cache.get(requirements)
+        except Exception as e:  # Embedding endpoint trouble must not stop the build
+            logger.warning(f"Plan cache lookup failed, planning from scratch: {e}")
+
+    if cached_plan is not None:
+        logger.info("Reusing the content plan of a similar earlier request.")
+        plan_parts.append(cached_plan)
+        seen: Set[str] = set()
+        for page, description in parse_page_specs(cached_plan):
+            if page not in seen:
+                seen.add(page)
+                yield page, description
+        yield None  # The replayed site map is complete
+        return
+
+    async for spec in stream_page_specs(rt, requirements, plan_parts):
+        yield spec
+    if RESULT_CACHE_ENABLED and plan_parts:
+        await flow_cache.set(cache_key, "".join(plan_parts))
+    if plan_cache is not None and plan_parts:
+        try:
+            await plan_cache.set(requirements, "".join(plan_parts))
+        except Exception as e:
+            logger.warning(f"Could not store the content plan in the plan cache: {e}")
+
+
+def _design_text(result: Union[Message, BaseException], step: str) -> str:
+    # gather(return_exceptions=True) hands back the Message, or the exception the call raised
+    if isinstance(result, BaseException):
+        return f"{step} failed: {result}"
+    return result.content or f"{step} returned no text."
+
+
+async def run_website_pipelined(
+    rt: TFrameXRuntimeContext, requirements: str, max_workers: int = PAGE_WORKERS
+) -> str:
+    """
+    Overlaps planning with generation: pages are built as the plan streams in, styling and
+    UX review start once the plan is complete, and the coordinator reviews the result.
+    Pages go through one shared queue, so whichever worker is free takes the next page
+    and a slow page never holds up the ones queued behind it. Sites of at most
+    FUSED_PAGE_LIMIT pages are written by a single call instead.
+    """
+    queue: "asyncio.Queue[List[Tuple[str, str]]]" = (
+        asyncio.Queue()
+    )  # Pages written by one call
+    page_results: Dict[str, Tuple[str, str]] = (
+        {}
+    )  # file name -> (description, generation result)
+    # The shared prompt prefix is built once per run; each call only appends its page list
+    page_prefix = f"{PAGE_INSTRUCTIONS}\n\nRequirements:\n{requirements}\n\nPages:\n"
+    # Semantic page hits are only replayed for the same requirements
+    requirements_key = make_cache_key(" ".join(requirements.lower().split()))
+
+    async def generate_pages(specs: List[Tuple[str, str]]) -> str:
+        pages = [page for page, _ in specs]
+        cache_key = FlowCache.key_for(
+            "HTMLDeveloper", {"req": requirements, "pages": specs}
+        )
+        semantic_text = (
+            requirements
+            + "\n\n"
+            + "\n".join(f"{page}: {description}" for page, description in specs)
+        )
+        cached = await page_cache.get(cache_key) if RESULT_CACHE_ENABLED else None
+        if cached is None and page_semantic_cache is not None:
+            try:
+                cached = await page_semantic_cache.get(semantic_text)
+            except Exception as e:  # Embedding endpoint trouble must not stop the build
+                logger.warning(
+                    f"Page cache lookup failed, generating {', '.join(pages)}: {e}"
+                )
+            if cached is not None and (
+                cached.get("pages") != pages
+                or cached.get("requirements_key") != requirements_key
+            ):  # Only replay the same files of the same site
+                cached = None
+        if cached is not None:
+            await asyncio.to_thread(_restore_files, cached["files"])
+            logger.info(f"Page(s) {', '.join(pages)} replayed from the page cache.")
+            return cached["result"]
+
+        prompt = page_prefix + "\n".join(
+            f"- `{page}`: {description}" for page, description in specs
+        )
+        written: Set[str] = set()
+        _call_written_files.set(written)
+        rt.isolate_agents()  # Each call gets its own HTMLDeveloper memory
+        # Each <file> block is written as soon as its closing tag streams in, so the disk
+        # writes overlap with the tokens of the pages still being generated
+        parts: List[str] = []
+        pending = ""
+        writes: List["asyncio.Task[str]"] = []
+        complete = True
+        try:
+            async for chunk in rt.call_agent_stream("HTMLDeveloper", prompt):
+                if not chunk.content:
+                    continue
+                parts.append(chunk.content)
+                # Only text that can hold a closing tag ending in this chunk is searched
+                scan_from = max(0, len(pending) - len(_FILE_BLOCK_END) + 1)
+                pending += chunk.content
+                if pending.find(_FILE_BLOCK_END, scan_from) < 0:
+                    continue
+                block_end = 0
+                for match in _FILE_BLOCK_RE.finditer(pending):
+                    block_end = match.end()
+                    block = {
+                        "path": match.group(2),
+                        "content": _file_block_content(match.group(3)),
+                    }
+                    writes.append(asyncio.create_task(write_page_block(block)))
+                pending = pending[block_end:]
+        except Exception as e:
+            if not writes:
+                return f"failed: {e}"
+            logger.warning(
+                f"HTMLDeveloper stream for {', '.join(pages)} failed after {len(writes)} file(s): {e}"
+            )
+            complete = False  # Keep the partial output out of the page cache
+        outcome = "; ".join(await asyncio.gather(*writes)) if writes else "".join(parts)
+        if complete and written and RESULT_CACHE_ENABLED:
+            files = await asyncio.to_thread(_snapshot_files, written)
+            entry = {
+                "pages": pages,
+                "requirements_key": requirements_key,
+                "files": files,
+                "result": outcome,
+            }
+            await page_cache.set(cache_key, entry)
+            if page_semantic_cache is not None:
+                try:
+                    await page_semantic_cache.set(semantic_text, entry)
+                except Exception as e:
+                    logger.warning(
+                        f"Could not store page(s) {', '.join(pages)} in the page cache: {e}"
+                    )
+        return outcome
+
+    async def write_page_block(block: Dict[str, str]) -> str:
+        try:
+            (error,) = await asyncio.to_thread(_write_text_files, [block])
+        except ValueError as e:  # A path outside the output directory
+            error = e
+        return f"{block['path']}: {'written' if error is None else f'failed: {error}'}"
+
+    async def page_worker() -> None:
+        while True:
+            specs = await queue.get()
+            try:
+                try:
+                    result = await generate_pages(specs)
+                except Exception as e:  # Record the failure and keep serving the queue
+                    logger.error(
+                        f"Generating page(s) {', '.join(page for page, _ in specs)} failed: {e}",
+                        exc_info=True,
+                    )
+                    result = f"failed: {e}"
+                for page, description in specs:
+                    page_results[page] = (description, result)
+                logger.info(
+                    f"Page(s) {', '.join(page for page, _ in specs)} generated ({len(page_results)} done)."
+                )
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(page_worker()) for _ in range(max_workers)]
+    # While the plan streams, send HTMLDeveloper's prompt prefix ahead so the first page
+    # request finds its prefill in the provider's prefix cache
+    prime_task = asyncio.create_task(rt.prime_agent("HTMLDeveloper", page_prefix))
+    plan_parts: List[str] = []
+    held: Optional[List[Tuple[str, str]]] = [] if FUSED_PAGE_LIMIT > 1 else None
+    try:
+        async for spec in plan_page_specs(rt, requirements, plan_parts):
+            if spec is None:  # Site map complete: a small site's pages can go out now
+                if held:
+                    logger.info(
+                        f"Small site ({len(held)} pages): generating all pages in one call."
+                    )
+                    queue.put_nowait(held)
+                held = None
+                continue
+            if held is not None:
+                held.append(spec)
+                if len(held) <= FUSED_PAGE_LIMIT:
+                    continue
+                for (
+                    held_spec
+                ) in held:  # Too many pages to fuse: release them one per call
+                    queue.put_nowait([held_spec])
+                held = None
+            else:
+                queue.put_nowait([spec])
+            logger.info(f"Queued page '{spec[0]}' while planning continues.")
+        if held:
+            logger.info(
+                f"Small site ({len(held)} pages): generating all pages in one call."
+            )
+            queue.put_nowait(held)
+    except BaseException:
+        for worker in workers:
+            worker.cancel()
+        prime_task.cancel()
+        raise
+
+    plan = "".join(plan_parts)
+    design_brief = f"{requirements}\n\nContent plan:\n{plan}"
+    design_results = asyncio.gather(
+        rt.call_agent(
+            "CSSDesigner",
+            f"{design_brief}\n\nWrite the shared stylesheet `styles.css`.",
+        ),
+        rt.call_agent("UIUXDesigner", design_brief),
+        return_exceptions=True,
+    )
+    try:
+        await queue.join()
+    finally:
+        for worker in workers:
+            worker.cancel()
+        prime_task.cancel()
+    css_result, uiux_result = await design_results
+
+    # The coordinator's page summary is built from the site map and the write-log, so it says
+    # which pages exist and what they are for without another LLM pass over the answers
+    written_log = _written_files.get() or set()
+    summary = "\n".join(
+        f"- {page}: {description} ({'written' if page in written_log else result[:200]})"
+        for page, (description, result) in page_results.items()
+    )
+    final = await rt.call_agent(
+        "WebsiteCoordinator",
+        f"{requirements}\n\nPages generated:\n{summary or 'none'}\n\n"
+        f"Styling: {_design_text(css_result, 'CSS design')}\n\n"
+        f"UX guidance: {_design_text(uiux_result, 'UX review')}\n\n"
+        "Review the deliverables and report on the finished website.",
+    )
+    return final.content
+
+
 # --- Main Functions ---
+async def run_website_flow(rt: TFrameXRuntimeContext, requirements: str) -> str:
+    """
+    Run WebsiteCreationFlow, serving the final result from flow_cache when possible. A cached
+    run stores the files it wrote next to its result, and a hit writes them back, so the
+    output directory ends up the same as after the original run.
+    """
+    cache_key = FlowCache.key_for("WebsiteCreationFlow", {"req": requirements})
+
+    if RESULT_CACHE_ENABLED:
+        cached = await flow_cache.get(cache_key)
+        if isinstance(
+            cached, dict
+        ):  # Entries without their files can't recreate the site
+            await asyncio.to_thread(_restore_files, cached["files"])
+            logger.info("WebsiteCreationFlow result and files served from cache.")
+            return cached["result"]
+
+    if PIPELINED_PAGE_GENERATION:
+        result = await run_website_pipelined(rt, requirements)
+    else:
+        initial_message = Message(role="user", content=requirements)
+        flow_context = await rt.run_flow("WebsiteCreationFlow", initial_message)
+        result = flow_context.current_message.content
+
+    written = _written_files.get()
+    if RESULT_CACHE_ENABLED and result and written:
+        files = await asyncio.to_thread(_snapshot_files, written)
+        await flow_cache.set(cache_key, {"result": result, "files": files})
+    return result
+
+
 async def create_website_interactive():
     """Interactive website creation with user input."""
-    
+
     print("\n🌐 Welcome to TFrameX Website Designer!")
     print("=====================================")
-    
-    # Get project requirements
-    project_name = input("Enter project name: ").strip()
-    website_type = input("Enter website type (business/portfolio/blog/ecommerce): ").strip()
-    target_audience = input("Describe target audience: ").strip()
-    
+
+    # Get project requirements (read in a worker thread so the event loop keeps running)
+    project_name = (await asyncio.to_thread(input, "Enter project name: ")).strip()
+    website_type = (
+        await asyncio.to_thread(
+            input, "Enter website type (business/portfolio/blog/ecommerce): "
+        )
+    ).strip()
+    target_audience = (
+        await asyncio.to_thread(input, "Describe target audience: ")
+    ).strip()
+
     requirements = f"""
     Project: {project_name}
     Type: {website_type}
@@ -286,32 +1146,31 @@ async def create_website_interactive():
     - Visually appealing
     - Fast loading
     """
-    
+    requirements = truncate_by_tokens(
+        requirements, MAX_REQUIREMENTS_TOKENS, model_name=default_llm_config.model_id
+    )
+
     logger.info(f"Starting website creation for: {project_name}")
-    
+
     async with app.run_context() as rt:
         # Register the flow
         website_flow = create_website_flow()
         app.register_flow(website_flow)
-        
+
         # Execute the flow
-        initial_message = Message(role="user", content=requirements)
-        flow_context = await rt.run_flow("WebsiteCreationFlow", initial_message)
-        
+        start_write_log()
+        final_result = await run_website_flow(rt, requirements)
+
         print(f"\n✅ Website creation completed!")
-        print(f"Final result: {flow_context.current_message.content}")
-        
-        # List created files
-        files_result = await rt.call_agent(
-            "WebsiteCoordinator",
-            Message(role="user", content="Please list all the files that were created for this website.")
-        )
-        print(f"\n📁 Created files:\n{files_result.content}")
+        print(f"Final result: {final_result}")
+
+        # List created files straight from the write-log instead of asking an agent
+        print(f"\n📁 Created files:\n{await written_files()}")
 
 
 async def create_website_automated():
     """Automated website creation with predefined requirements."""
-    
+
     requirements = """
     Create a modern business website for "Brew Haven Coffee Shop" with the following specifications:
     
@@ -340,33 +1199,38 @@ async def create_website_automated():
     - Responsive images
     - Fast loading times
     """
-    
+
     logger.info("Starting automated website creation for Brew Haven Coffee Shop")
-    
+
     async with app.run_context() as rt:
         # Register the flow
         website_flow = create_website_flow()
         app.register_flow(website_flow)
-        
+
         # Execute the flow
-        initial_message = Message(role="user", content=requirements)
-        flow_context = await rt.run_flow("WebsiteCreationFlow", initial_message)
-        
+        start_write_log()
+        final_result = await run_website_flow(rt, requirements)
+
         print(f"\n✅ Automated website creation completed!")
-        print(f"Final result: {flow_context.current_message.content}")
+        print(f"Final result: {final_result}")
+        print(f"\n📁 Created files:\n{await written_files()}")
 
 
 async def main():
     """Main application entry point."""
-    
+
     print("\nTFrameX Website Designer")
     print("========================")
     print("1. Interactive website creation")
     print("2. Automated demo (Brew Haven Coffee Shop)")
     print("3. Chat with Website Coordinator")
-    
-    choice = input("\nEnter your choice (1-3): ").strip()
-    
+
+    # Connect to the LLM endpoint while the user is still choosing
+    warmup_task = asyncio.create_task(
+        app.warmup(prime=os.getenv("LLM_PRIME_ON_START") == "1")
+    )
+    choice = (await asyncio.to_thread(input, "\nEnter your choice (1-3): ")).strip()
+
     try:
         if choice == "1":
             await create_website_interactive()
@@ -378,19 +1242,23 @@ async def main():
         else:
             print("Invalid choice. Running automated demo...")
             await create_website_automated()
-            
+
     except Exception as e:
         logger.error(f"Application error: {e}")
         raise
+    finally:
+        if not warmup_task.done():
+            warmup_task.cancel()
+        await app.close()
 
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        (uvloop.run if uvloop else asyncio.run)(main())
     except KeyboardInterrupt:
         logger.info("Website Designer terminated by user")
     except Exception as e:
         logger.error(f"Unhandled error: {e}")
         exit(1)
-    
-    logger.info("Website Designer completed successfully!")
\ No newline at end of file
+
+    logger.info("Website Designer completed successfully!")
@@ -13,165 +13,300 @@ This example demonstrates the complete enterprise feature set including:
 """
 
 import asyncio
+import logging
 import os
+import sys
 from pathlib import Path
+from typing import List
 
 # Load environment
 from dotenv import load_dotenv
+
+try:
+    import uvloop  # Optional faster event loop: pip install tframex[speedups]
+except ImportError:
+    uvloop = None
 load_dotenv(Path(__file__).parent.parent / ".env.test")
 
+from tframex import DAGPattern, Flow, FlowContext, Message
 from tframex.enterprise import (
-    create_enhanced_enterprise_app, 
+    User,
     create_default_config,
-    User
+    create_enhanced_enterprise_app,
 )
-from tframex.util.llms import OpenAIChatLLM
+from tframex.util.llms import CachingLLM, OpenAIChatLLM
+
+# Per-result status lines go through this logger with lazy %-formatting: nothing is
+# formatted unless INFO is enabled, so raising the level silences them for free.
+logger = logging.getLogger(__name__)
+if not logger.handlers:
+    _status_handler = logging.StreamHandler(sys.stdout)
+    _status_handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_status_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+async def stream_analysis_into_report(ctx, data: str) -> List[str]:
+    """
+    Streams DataAnalyst's answer and hands each finished paragraph to ReportGenerator
+    straight away, so report sections are drafted while the analysis is still being written.
+    """
+    section_tasks: List[asyncio.Task] = []
+
+    def start_section(paragraph: str) -> None:
+        prompt = f"Write a short report section for this finding:\n\n{paragraph}"
+        # run_batch_async gives each section its own ReportGenerator memory
+        section_tasks.append(
+            asyncio.create_task(ctx.run_batch_async("ReportGenerator", [prompt]))
+        )
+
+    pending = ""
+    async for delta in ctx.stream_agent("DataAnalyst", data):
+        pending += delta
+        *paragraphs, pending = pending.split("\n\n")
+        for paragraph in paragraphs:
+            if paragraph.strip():
+                start_section(paragraph.strip())
+    if pending.strip():
+        start_section(pending.strip())
+
+    sections = await asyncio.gather(*section_tasks)
+    return [section.content for (section,) in sections]
 
 
 async def main():
     """Main example function demonstrating enterprise features."""
-    
+
     print("🚀 TFrameX Enhanced Enterprise Features Demo")
     print("=" * 60)
-    
+
     # 1. Create enterprise configuration
     print("\n📋 Setting up enterprise configuration...")
     config = create_default_config(environment="demo")
-    
-    # 2. Create LLM
-    llm = OpenAIChatLLM(
-        model_name=os.getenv("OPENAI_MODEL_NAME", "gpt-3.5-turbo"),
-        api_key=os.getenv("OPENAI_API_KEY"),
-        api_base_url=os.getenv("OPENAI_API_BASE")
+
+    # 2. Create LLM - repeated requests are answered from a response cache
+    llm = CachingLLM(
+        OpenAIChatLLM(
+            model_name=os.getenv("OPENAI_MODEL_NAME", "gpt-3.5-turbo"),
+            api_key=os.getenv("OPENAI_API_KEY"),
+            api_base_url=os.getenv("OPENAI_API_BASE"),
+        ),
+        ttl=3600,
     )
-    
+
     # 3. Create enhanced enterprise app
     print("🏢 Creating enhanced enterprise application...")
-    app = create_enhanced_enterprise_app(
-        default_llm=llm,
-        enterprise_config=config
-    )
-    
+    app = create_enhanced_enterprise_app(default_llm=llm, enterprise_config=config)
+
     # 4. Define enterprise agents
+    # Place static content first, dynamic last: the system prompt is sent unchanged as the
+    # first message and per-call data goes in user turns, so providers can serve the shared
+    # prefix from their prompt cache. cache_control="ephemeral" adds the explicit marker that
+    # Anthropic requires; OpenAI caches stable prefixes automatically.
     @app.agent(
         name="DataAnalyst",
         description="Analyzes data and provides insights",
-        system_prompt="You are a data analyst. Analyze the provided data and give actionable insights. Be concise but thorough."
+        system_prompt="You are a data analyst. Analyze the provided data and give actionable insights. Be concise but thorough.",
+        cache_control="ephemeral",
     )
-    async def data_analyst(): pass
-    
+    async def data_analyst():
+        pass
+
     @app.agent(
-        name="ReportGenerator", 
+        name="ReportGenerator",
         description="Generates comprehensive reports",
-        system_prompt="You are a report generator. Create well-structured reports based on analysis results. Use clear headings and bullet points."
+        system_prompt="You are a report generator. Create well-structured reports based on analysis results. Use clear headings and bullet points.",
+        cache_control="ephemeral",
     )
-    async def report_generator(): pass
-    
+    async def report_generator():
+        pass
+
     @app.agent(
         name="QualityAssurance",
         description="Reviews and validates outputs for quality",
-        system_prompt="You are a quality assurance specialist. Review the provided content for accuracy, completeness, and clarity. Provide feedback and suggestions."
-    )
-    async def quality_assurance(): pass
-    
-    # 5. Create a multi-agent workflow with tracing
-    @app.flow(
-        name="DataProcessingPipeline",
-        description="Complete data processing pipeline with analysis, reporting, and QA"
+        system_prompt="You are a quality assurance specialist. Review the provided content for accuracy, completeness, and clarity. Provide feedback and suggestions.",
+        cache_control="ephemeral",
     )
-    async def data_processing_pipeline():
-        # This will be automatically traced as a workflow
+    async def quality_assurance():
         pass
-    
+
+    # 5. Create a multi-agent workflow. The DAG is compiled into levels once, here;
+    # each run then gathers level by level, so the shard analyses run concurrently
+    # and only real dependencies (analyses -> report -> QA) stay sequential.
+    data_shards = {
+        "sales": "Sales data: Q1: $100k, Q2: $150k, Q3: $200k, Q4: $180k.",
+        "satisfaction": "Customer satisfaction: 85%",
+    }
+    analysis_nodes = [f"analysis_{shard}" for shard in data_shards]
+    data_pipeline = DAGPattern(
+        "DataProcessingPipeline",
+        [
+            # Step 1: Data Analysis - one node per data shard
+            *(
+                (node, "DataAnalyst", (), lambda results, initial, data=data: data)
+                for node, data in zip(analysis_nodes, data_shards.values())
+            ),
+            # Step 2: Report Generation - waits for every analysis
+            (
+                "report",
+                "ReportGenerator",
+                analysis_nodes,
+                lambda results, initial: "Create a report based on these analyses:\n\n"
+                + "\n\n".join(results[node].content for node in analysis_nodes),
+            ),
+            # Step 3: Quality Assurance - reviews the finished report
+            (
+                "qa",
+                "QualityAssurance",
+                ["report"],
+                lambda results, initial: f"Review this report: {results['report'].content}",
+            ),
+        ],
+    )
+    app.register_flow(
+        Flow(
+            "DataProcessingPipeline",
+            "Complete data processing pipeline with analysis, reporting, and QA",
+        ).add_step(data_pipeline)
+    )
+
     # 6. Start enterprise services
     print("⚡ Starting enterprise services...")
     async with app:
         print("✅ Enterprise services started")
-        
+        llm.metrics_manager = (
+            app.get_metrics_manager()
+        )  # Report cache hits/misses as counters
+
         # 7. Create a demo user for security context
-        demo_user = User(
-            username="demo_analyst",
-            email="analyst@company.com"
-        )
-        
+        demo_user = User(username="demo_analyst", email="analyst@company.com")
+
         # 8. Execute workflows with full enterprise features
         print("\n🔬 Executing enterprise workflows...")
-        
+
         async with app.run_context(user=demo_user) as ctx:
             print("📊 Running data processing pipeline...")
-            
-            # Step 1: Data Analysis
-            data_input = "Sales data: Q1: $100k, Q2: $150k, Q3: $200k, Q4: $180k. Customer satisfaction: 85%"
-            
-            analysis_result = await ctx.call_agent(
-                "DataAnalyst",
-                data_input
-            )
-            print(f"   📈 Analysis: {analysis_result.content[:100]}...")
-            
-            # Step 2: Report Generation
-            report_result = await ctx.call_agent(
-                "ReportGenerator",
-                f"Create a report based on this analysis: {analysis_result.content}"
+
+            # Run against the runtime context rather than the bare engine, so every agent call
+            # goes through the enterprise security/audit/metrics hooks. One prompt-cache session
+            # for the whole pipeline: each hand-off resends the previous agent's output, so routing
+            # every call by the same key lets the provider reuse the cached prefix.
+            pipeline_ctx = await data_pipeline.execute(
+                FlowContext(
+                    initial_input=Message(
+                        role="user", content="Run the data processing pipeline."
+                    )
+                ),
+                ctx,
+                agent_call_kwargs={"session": ctx.session()},
             )
-            print(f"   📋 Report: {report_result.content[:100]}...")
-            
-            # Step 3: Quality Assurance
-            qa_result = await ctx.call_agent(
-                "QualityAssurance",
-                f"Review this report: {report_result.content}"
+            pipeline_results = pipeline_ctx.shared_data[
+                "DataProcessingPipeline_results"
+            ]
+            for node, label in [
+                *((n, "📈 Analysis") for n in analysis_nodes),
+                ("report", "📋 Report"),
+                ("qa", "✅ QA Review"),
+            ]:
+                result = pipeline_results[node]
+                if isinstance(result, BaseException):
+                    logger.info("   ❌ %s failed: %s", node, result)
+                else:
+                    logger.info("   %s: %.100s...", label, result.content)
+
+            # Streamed hand-off: report sections start as soon as each analysis paragraph lands
+            print("📡 Streaming analysis straight into report sections...")
+            sections = await stream_analysis_into_report(ctx, data_shards["sales"])
+            logger.info(
+                "   📋 %d report section(s) drafted while the analysis streamed",
+                len(sections),
             )
-            print(f"   ✅ QA Review: {qa_result.content[:100]}...")
-        
+
         # 9. Demonstrate enterprise analytics
         print("\n📊 Retrieving enterprise analytics...")
-        
+
+        # The four reads are independent, so fetch them concurrently
+        real_time, agent_analytics, cost_analytics, traces = await asyncio.gather(
+            app.get_real_time_analytics(),
+            app.get_agent_analytics(),
+            app.get_cost_analytics("24h"),
+            app.search_workflow_traces(limit=5),
+        )
+
         # Real-time analytics
-        real_time = await app.get_real_time_analytics()
-        print(f"   🔄 Real-time metrics:")
+        logger.info("   🔄 Real-time metrics:")
         if "real_time" in real_time:
             rt_data = real_time["real_time"]
-            print(f"      • Success rate: {rt_data.get('success_rate', 0):.1f}%")
-            print(f"      • Avg response time: {rt_data.get('avg_response_time_ms', 0):.1f}ms")
-            print(f"      • Total requests: {rt_data.get('total_requests', 0)}")
-        
+            logger.info("      • Success rate: %.1f%%", rt_data.get("success_rate", 0))
+            logger.info(
+                "      • Avg response time: %.1fms",
+                rt_data.get("avg_response_time_ms", 0),
+            )
+            logger.info("      • Total requests: %s", rt_data.get("total_requests", 0))
+
         # Agent analytics
-        agent_analytics = await app.get_agent_analytics()
         if "agents" in agent_analytics:
-            print(f"   🤖 Agent performance:")
+            logger.info("   🤖 Agent performance:")
             for agent_name, stats in agent_analytics["agents"].items():
-                print(f"      • {agent_name}: {stats.get('success_rate', 0):.1f}% success, {stats.get('total_calls', 0)} calls")
-        
+                logger.info(
+                    "      • %s: %.1f%% success, %s calls",
+                    agent_name,
+                    stats.get("success_rate", 0),
+                    stats.get("total_calls", 0),
+                )
+
+        # LLM response cache
+        cache_stats = llm.get_stats()
+        logger.info(
+            "   🗄️ LLM cache: %d hits, %d misses",
+            cache_stats["exact_hits"] + cache_stats["semantic_hits"],
+            cache_stats["misses"],
+        )
+
         # Cost analytics
-        cost_analytics = await app.get_cost_analytics("24h")
         if "total_cost_usd" in cost_analytics:
-            print(f"   💰 Cost analysis:")
-            print(f"      • Total cost: ${cost_analytics['total_cost_usd']:.4f}")
-            print(f"      • Daily average: ${cost_analytics.get('cost_trends', {}).get('daily_average', 0):.4f}")
-        
+            logger.info("   💰 Cost analysis:")
+            logger.info("      • Total cost: $%.4f", cost_analytics["total_cost_usd"])
+            logger.info(
+                "      • Daily average: $%.4f",
+                cost_analytics.get("cost_trends", {}).get("daily_average", 0),
+            )
+
         # Workflow traces
-        traces = await app.search_workflow_traces(limit=5)
         if traces:
-            print(f"   🔍 Recent workflow traces: {len(traces)} found")
+            logger.info("   🔍 Recent workflow traces: %d found", len(traces))
             for trace in traces[:2]:  # Show first 2
-                print(f"      • {trace['workflow_name']}: {trace['status']} ({trace.get('spans', []) and len(trace['spans'])} spans)")
-        
+                logger.info(
+                    "      • %s: %s (%s spans)",
+                    trace["workflow_name"],
+                    trace["status"],
+                    trace.get("spans", []) and len(trace["spans"]),
+                )
+
         # 10. Export analytics
         print("\n📤 Exporting analytics data...")
         export_data = await app.export_analytics(format="json", time_range="24h")
         if "export_info" in export_data:
-            print(f"   ✅ Export completed: {export_data['export_info']['timestamp']}")
-            print(f"   📊 Included: {len(export_data)} data sections")
-        
+            logger.info(
+                "   ✅ Export completed: %s", export_data["export_info"]["timestamp"]
+            )
+            logger.info("   📊 Included: %d data sections", len(export_data))
+
         # 11. Health check
         health = await app.health_check()
-        print(f"\n🏥 System health: {'✅ Healthy' if health.get('healthy') else '❌ Unhealthy'}")
-        if health.get('components'):
+        print(
+            f"\n🏥 System health: {'✅ Healthy' if health.get('healthy') else '❌ Unhealthy'}"
+        )
+        if health.get("components"):
             print("   Component status:")
-            for component, status in health['components'].items():
-                status_icon = "✅" if status.get('healthy') else "❌"
-                print(f"      • {component}: {status_icon}")
-    
+            for component, status in health["components"].items():
+                status_icon = "✅" if status.get("healthy") else "❌"
+                logger.info("      • %s: %s", component, status_icon)
+
+    # 12. Release the pooled HTTP connections held by the LLM client
+    await llm.aclose()
+
     print("\n🎉 Enhanced enterprise demo completed successfully!")
     print("\n📚 Features demonstrated:")
     print("   ✅ Enhanced enterprise application")
@@ -187,4 +322,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    (uvloop.run if uvloop else asyncio.run)(main())
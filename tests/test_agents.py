@@ -0,0 +1,485 @@
+"""
+Tests for agent helpers that don't need a live LLM.
+"""
+
+import asyncio
+
+import pytest
+
+from tframex.agents.llm_agent import LLMAgent
+from tframex.models.primitives import FunctionCall, MessageChunk, ToolCall
+from tframex.util.llms import OpenAIChatLLM
+
+
+class StubEngine:
+    """Engine stand-in; prompt rendering never touches the engine."""
+
+
+def make_agent(template: str) -> LLMAgent:
+    llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+    return LLMAgent(
+        agent_id="Tester", llm=llm, engine=StubEngine(), system_prompt_template=template
+    )
+
+
+class TestSystemPromptRendering:
+    """Test memoization of rendered system prompts."""
+
+    def test_static_prompt_rendered_once(self):
+        agent = make_agent("You are a tester. Tools: {available_tools_descriptions}")
+
+        first = agent._render_system_prompt()
+        assert first is agent._render_system_prompt()
+        assert first.content == "You are a tester. Tools: No tools available."
+
+    def test_template_vars_key_the_cache(self):
+        agent = make_agent("Hello {name}")
+
+        assert agent._render_system_prompt(name="A").content == "Hello A"
+        assert agent._render_system_prompt(name="B").content == "Hello B"
+        assert (
+            agent._render_system_prompt(name={"unhashable": True}).content
+            == "Hello {'unhashable': True}"
+        )
+
+    def test_cache_keeps_only_recent_renderings(self):
+        from tframex.agents.base import SYSTEM_PROMPT_CACHE_SIZE
+
+        agent = make_agent("Hello {name}")
+        first = agent._render_system_prompt(name="first")
+        for i in range(SYSTEM_PROMPT_CACHE_SIZE * 3):
+            agent._render_system_prompt(name=f"user {i}")
+            agent._render_system_prompt(name="first")  # Recently used, so never evicted
+
+        assert len(agent._system_prompt_cache) == SYSTEM_PROMPT_CACHE_SIZE
+        assert agent._render_system_prompt(name="first") is first
+
+    def test_tool_descriptions_are_one_line(self):
+        from tframex.util.tools import Tool
+
+        async def lookup(query: str) -> str:
+            """Looks things up.
+
+            Args:
+                query: What to look for.
+            """
+
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        agent = LLMAgent(
+            agent_id="Tester",
+            llm=llm,
+            engine=StubEngine(),
+            tools=[Tool("lookup", lookup)],
+            system_prompt_template="{available_tools_descriptions}",
+        )
+
+        assert agent._render_system_prompt().content == "- lookup: Looks things up."
+
+
+class TestThinkTagStripping:
+    """Test removal of <think> blocks from responses."""
+
+    def test_blocks_stripped_and_unclosed_tag_left_alone(self):
+        from tframex.models.primitives import Message
+
+        agent = make_agent("You are a tester.")
+        agent.strip_think_tags = True
+
+        stripped = agent._post_process_llm_response(
+            Message(
+                role="assistant",
+                content="<think>plan <b>\nsteps</think>\n Answer <think>more</think>done",
+            )
+        )
+        unclosed = agent._post_process_llm_response(
+            Message(role="assistant", content="<think>" + "<" * 5000 + " answer")
+        )
+
+        assert stripped.content == "Answer done"
+        assert unclosed.content.endswith(" answer")
+
+    @pytest.mark.asyncio
+    async def test_large_multi_block_response_cleaned_off_loop(self, monkeypatch):
+        import threading
+
+        from tframex.agents import base
+        from tframex.models.primitives import Message
+
+        monkeypatch.setattr(base, "OFFLOAD_POST_PROCESS_CHARS", 64)
+        agent = make_agent("You are a tester.")
+        agent.strip_think_tags = True
+        threads = []
+        original = agent._post_process_llm_response
+
+        def recording(message):
+            threads.append(threading.current_thread())
+            return original(message)
+
+        agent._post_process_llm_response = recording
+        content = "<think>a</think>" + "x" * 64 + "<think>b</think>y"
+
+        result = await agent._post_process_llm_response_async(
+            Message(role="assistant", content=content)
+        )
+
+        assert result.content == "x" * 64 + "y"
+        assert threads[0] is not threading.main_thread()
+
+    def test_single_block_fast_path_matches_regex(self):
+        from tframex.agents.base import _THINK_BLOCK_RE, _strip_think_blocks
+
+        for text in [
+            "<think>a\nb</think>\n\n```html\n<p/>\n```",
+            "Intro <think>x</think>  tail ",
+            "<think>x",
+        ]:
+            assert _strip_think_blocks(text) == _THINK_BLOCK_RE.sub("", text).strip()
+
+    def test_orphan_closing_tag_drops_leading_reasoning(self):
+        from tframex.agents.base import _strip_think_blocks
+
+        assert (
+            _strip_think_blocks(
+                "reasoning already opened in the prompt\n</think>\n\nAnswer"
+            )
+            == "Answer"
+        )
+        no_tags = "Plain answer"
+        assert _strip_think_blocks(no_tags) is no_tags
+
+
+class ScriptedStreamLLM(OpenAIChatLLM):
+    """Replays canned chunk sequences, one per LLM call."""
+
+    def __init__(self, turns):
+        super().__init__(model_name="m", api_base_url="http://x")
+        self.turns = list(turns)
+
+    async def chat_completion(self, messages, stream=False, **kwargs):
+        chunks = self.turns.pop(0)
+
+        async def gen():
+            for chunk in chunks:
+                await asyncio.sleep(0)
+                yield chunk
+
+        return gen()
+
+
+class RecordingEngine:
+    """Records when tool calls start relative to the stream."""
+
+    def __init__(self):
+        self.events = []
+
+    async def execute_tool_by_llm_definition(self, name, args_json):
+        self.events.append(f"tool:{name}")
+        return f"{name} ok"
+
+
+class TestStreamingToolDispatch:
+    """Test that streamed tool calls start before the stream finishes."""
+
+    @pytest.mark.asyncio
+    async def test_tool_calls_dispatched_mid_stream_in_order(self):
+        calls = [
+            ToolCall(id="1", function=FunctionCall(name="first", arguments="{}")),
+            ToolCall(id="2", function=FunctionCall(name="second", arguments="{}")),
+        ]
+        llm = ScriptedStreamLLM(
+            [
+                [
+                    MessageChunk(role="assistant", content=None, tool_calls=[calls[0]]),
+                    MessageChunk(role="assistant", content=None, tool_calls=[calls[1]]),
+                    MessageChunk(role="assistant", content="still generating"),
+                ],
+                [MessageChunk(role="assistant", content="done")],
+            ]
+        )
+        engine = RecordingEngine()
+        agent = LLMAgent(agent_id="Streamer", llm=llm, engine=engine)
+        engine._runtime_context = type("Ctx", (), {"mcp_manager": None})()
+
+        stream = await agent.run("go", stream=True)
+        async for chunk in stream:
+            if chunk.content:
+                engine.events.append(f"chunk:{chunk.content}")
+
+        assert engine.events == [
+            "tool:first",
+            "tool:second",
+            "chunk:still generating",
+            "chunk:done",
+        ]
+        history = await agent.memory.get_history()
+        assert [m.name for m in history if m.role == "tool"] == ["first", "second"]
+
+
+class TestToolDefinitionCache:
+    """Test that tool definitions are serialized once per MCP epoch."""
+
+    def test_payload_reused_until_server_epoch_changes(self):
+        server = type("Server", (), {"epoch": 1, "is_initialized": True, "tools": []})()
+        manager = type(
+            "Manager",
+            (),
+            {"servers": {"svc": server}, "get_all_mcp_tools_for_llm": lambda self: []},
+        )()
+        engine = StubEngine()
+        engine._runtime_context = type("Ctx", (), {"mcp_manager": manager})()
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        agent = LLMAgent(
+            agent_id="Tester",
+            llm=llm,
+            engine=engine,
+            mcp_tools_from_servers_config="ALL",
+        )
+
+        _, first_payload = agent._get_tool_definitions_payload()
+        assert agent._get_tool_definitions_payload()[1] is first_payload
+
+        server.epoch += 1
+        assert agent._get_tool_definitions_payload()[1] is not first_payload
+
+
+class TestPromptCacheLayout:
+    """Test static-prefix message layout for agents with cache_control."""
+
+    def test_template_vars_move_to_trailing_user_turn(self):
+        from tframex.models.primitives import Message
+
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        agent = LLMAgent(
+            agent_id="Tester",
+            llm=llm,
+            engine=StubEngine(),
+            system_prompt_template="You are a tester.",
+            cache_control="ephemeral",
+        )
+        history = [Message(role="user", content="hi")]
+
+        first = agent._assemble_messages(history, {"customer": "A"})
+        second = agent._assemble_messages(history, {"customer": "B"})
+
+        assert first[0] is second[0]
+        assert first[0].content == "You are a tester."
+        assert first[-1].role == "user"
+        assert first[-1].content.endswith("customer: A")
+
+    def test_cache_control_type_reaches_marker(self):
+        llm = OpenAIChatLLM(
+            model_name="m", api_base_url="http://x", prompt_caching=True
+        )
+        messages = [{"role": "system", "content": "static"}]
+        llm._apply_prompt_caching(messages, "persistent")
+
+        assert messages[0]["content"][0]["cache_control"] == {"type": "persistent"}
+
+
+class TestPrime:
+    """Test prefix priming without a real call."""
+
+    @pytest.mark.asyncio
+    async def test_prime_sends_prefix_once_token_and_leaves_memory(self):
+        from tframex.models.primitives import Message
+
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        requests = []
+
+        async def chat_completion(messages, stream=False, **kwargs):
+            requests.append((messages, kwargs))
+            return Message(role="assistant", content=".")
+
+        llm.chat_completion = chat_completion
+        engine = StubEngine()
+        engine._runtime_context = type("Ctx", (), {"mcp_manager": None})()
+        agent = LLMAgent(
+            agent_id="Tester",
+            llm=llm,
+            engine=engine,
+            system_prompt_template="You are a tester.",
+        )
+
+        assert await agent.prime("Create the page `")
+
+        ((messages, kwargs),) = requests
+        assert [m.content for m in messages] == [
+            "You are a tester.",
+            "Create the page `",
+        ]
+        assert kwargs["max_tokens"] == 1
+        assert await agent.memory.get_history() == []
+
+
+class EchoLLM(OpenAIChatLLM):
+    """Answers with the history length, tracking overlapping calls."""
+
+    def __init__(self):
+        super().__init__(model_name="m", api_base_url="http://x")
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat_completion(self, messages, stream=False, **kwargs):
+        from tframex.models.primitives import Message
+
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return Message(
+            role="assistant", content=f"{messages[-1].content} ({len(messages)} msgs)"
+        )
+
+
+class TestRunBatch:
+    """Test bounded, memory-isolated batch agent calls."""
+
+    @pytest.mark.asyncio
+    async def test_batch_is_bounded_ordered_and_isolated(self):
+        from tframex.app import TFrameXApp
+
+        llm = EchoLLM()
+        app = TFrameXApp(default_llm=llm)
+
+        @app.agent(name="Echo", system_prompt="Echo.")
+        async def echo():
+            pass
+
+        async with app.run_context() as ctx:
+            results = await ctx.run_batch_async(
+                "Echo", ["a", "b", "c", "d"], max_concurrency=2
+            )
+
+        # System prompt + one user turn each: no prompt saw another's memory
+        assert [r.content for r in results] == [
+            "a (2 msgs)",
+            "b (2 msgs)",
+            "c (2 msgs)",
+            "d (2 msgs)",
+        ]
+        assert llm.max_in_flight == 2
+
+    @pytest.mark.asyncio
+    async def test_iter_batch_yields_in_completion_order(self):
+        from tframex.app import TFrameXApp
+        from tframex.models.primitives import Message
+
+        class SlowFirstLLM(EchoLLM):
+            async def chat_completion(self, messages, stream=False, **kwargs):
+                if messages[-1].content == "slow":
+                    await asyncio.sleep(0.05)
+                return Message(role="assistant", content=messages[-1].content)
+
+        app = TFrameXApp(default_llm=SlowFirstLLM())
+
+        @app.agent(name="Echo", system_prompt="Echo.")
+        async def echo():
+            pass
+
+        async with app.run_context() as ctx:
+            order = [
+                (i, r.content)
+                async for i, r in ctx.iter_batch_async("Echo", ["slow", "a", "b"])
+            ]
+
+        assert order[-1] == (0, "slow")
+        assert sorted(order) == [(0, "slow"), (1, "a"), (2, "b")]
+
+    @pytest.mark.asyncio
+    async def test_stream_agent_yields_text_deltas(self):
+        from tframex.app import TFrameXApp
+
+        llm = ScriptedStreamLLM(
+            [
+                [
+                    MessageChunk(role="assistant", content="First para"),
+                    MessageChunk(role="assistant", content=""),
+                    MessageChunk(role="assistant", content="graph.\n\nSecond."),
+                ]
+            ]
+        )
+        app = TFrameXApp(default_llm=llm)
+
+        @app.agent(name="Writer", system_prompt="Write.")
+        async def writer():
+            pass
+
+        async with app.run_context() as ctx:
+            deltas = [delta async for delta in ctx.stream_agent("Writer", "go")]
+
+        assert deltas == ["First para", "graph.\n\nSecond."]
+
+    @pytest.mark.asyncio
+    async def test_isolated_streams_start_from_fresh_memory(self):
+        from tframex.app import TFrameXApp
+
+        class CountingStreamLLM(EchoLLM):
+            async def chat_completion(self, messages, stream=False, **kwargs):
+                async def gen():
+                    yield MessageChunk(
+                        role="assistant", content=f"{len(messages)} msgs"
+                    )
+
+                return gen()
+
+        app = TFrameXApp(default_llm=CountingStreamLLM())
+
+        @app.agent(name="Writer", system_prompt="Write.")
+        async def writer():
+            pass
+
+        async with app.run_context() as ctx:
+            shared = [
+                [delta async for delta in ctx.stream_agent("Writer", "go")]
+                for _ in range(2)
+            ]
+
+            async def isolated():
+                ctx.isolate_agents()
+                return [delta async for delta in ctx.stream_agent("Writer", "go")]
+
+            fresh = await asyncio.gather(isolated(), isolated())
+
+        assert shared == [["2 msgs"], ["4 msgs"]]
+        assert fresh == [["2 msgs"], ["2 msgs"]]
+
+
+class RecordingLLM(EchoLLM):
+    """EchoLLM that records the extra request parameters of each call."""
+
+    def __init__(self):
+        super().__init__()
+        self.call_kwargs = []
+
+    async def chat_completion(self, messages, stream=False, **kwargs):
+        self.call_kwargs.append(kwargs)
+        return await super().chat_completion(messages, stream=stream, **kwargs)
+
+
+class TestLLMSession:
+    """Test prompt-cache sessions shared across agent calls."""
+
+    @pytest.mark.asyncio
+    async def test_session_key_reaches_every_llm_request(self):
+        from tframex.app import TFrameXApp
+
+        llm = RecordingLLM()
+        app = TFrameXApp(default_llm=llm)
+
+        @app.agent(name="Analyst", system_prompt="Analyze.")
+        async def analyst():
+            pass
+
+        @app.agent(name="Reporter", system_prompt="Report.")
+        async def reporter():
+            pass
+
+        async with app.run_context() as ctx:
+            session = ctx.session("pipeline-1")
+            analysis = await ctx.call_agent("Analyst", "data", session=session)
+            await ctx.call_agent("Reporter", analysis.content, session=session)
+            await ctx.call_agent("Reporter", "no session")
+
+        keys = [kwargs.get("prompt_cache_key") for kwargs in llm.call_kwargs]
+        assert keys == ["pipeline-1", "pipeline-1", None]
+        assert all("session" not in kwargs for kwargs in llm.call_kwargs)
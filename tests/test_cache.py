@@ -0,0 +1,169 @@
+"""
+Tests for the TFrameX cache utilities (tframex.util.cache).
+"""
+
+import asyncio
+
+import pytest
+
+from tframex.util.cache import (
+    CacheBackend,
+    FileCacheBackend,
+    FlowCache,
+    InMemoryCacheBackend,
+    SemanticCache,
+    SQLiteCacheBackend,
+    make_cache_key,
+)
+
+
+class TestCacheKeys:
+    """Test cache key construction."""
+
+    def test_key_is_order_independent(self):
+        assert make_cache_key({"a": 1, "b": 2}) == make_cache_key({"b": 2, "a": 1})
+
+    def test_key_differs_for_different_payloads(self):
+        assert make_cache_key({"a": 1}) != make_cache_key({"a": 2})
+
+    def test_flow_key_includes_flow_name(self):
+        assert FlowCache.key_for("FlowA", "req") != FlowCache.key_for("FlowB", "req")
+
+
+class TestInMemoryCacheBackend:
+    """Test the in-process LRU backend."""
+
+    @pytest.mark.asyncio
+    async def test_get_set_delete(self):
+        backend = InMemoryCacheBackend()
+        assert isinstance(backend, CacheBackend)
+        assert await backend.get("missing") is None
+
+        await backend.set("k", "v")
+        assert await backend.get("k") == "v"
+
+        await backend.delete("k")
+        assert await backend.get("k") is None
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        backend = InMemoryCacheBackend(max_entries=2)
+        await backend.set("a", 1)
+        await backend.set("b", 2)
+        await backend.get("a")  # "a" becomes most recently used
+        await backend.set("c", 3)
+
+        assert await backend.get("b") is None
+        assert await backend.get("a") == 1
+        assert await backend.get("c") == 3
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        backend = InMemoryCacheBackend()
+        await backend.set("k", "v", ttl=0.01)
+        await asyncio.sleep(0.02)
+        assert await backend.get("k") is None
+
+
+class TestSQLiteCacheBackend:
+    """Test the persistent SQLite backend."""
+
+    @pytest.mark.asyncio
+    async def test_values_persist_across_instances(self, tmp_path):
+        db_path = str(tmp_path / "cache.db")
+
+        backend = SQLiteCacheBackend(db_path)
+        await backend.set("k", {"content": "hello"})
+        await backend.close()
+
+        reopened = SQLiteCacheBackend(db_path)
+        assert await reopened.get("k") == {"content": "hello"}
+        await reopened.clear()
+        assert await reopened.get("k") is None
+        await reopened.close()
+
+    def test_backend_is_usable_from_successive_event_loops(self, tmp_path):
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+
+        async def contend(prefix):
+            await asyncio.gather(*(backend.set(f"{prefix}{i}", i) for i in range(5)))
+            return await backend.get(f"{prefix}4")
+
+        assert asyncio.run(contend("a")) == 4
+        assert (
+            asyncio.run(contend("b")) == 4
+        )  # A lock bound to the first loop would raise here
+        asyncio.run(backend.close())
+
+
+class TestFileCacheBackend:
+    """Test the one-file-per-entry backend."""
+
+    @pytest.mark.asyncio
+    async def test_values_persist_across_instances_and_expire(self, tmp_path):
+        backend = FileCacheBackend(str(tmp_path / "llm"))
+        assert isinstance(backend, CacheBackend)
+        await backend.set("k", {"content": "hello"})
+        await backend.set("short", "v", ttl=0.01)
+        await asyncio.sleep(0.02)
+
+        reopened = FileCacheBackend(str(tmp_path / "llm"))
+        assert await reopened.get("k") == {"content": "hello"}
+        assert await reopened.get("short") is None
+        assert not list((tmp_path / "llm").glob("*.tmp"))
+
+        await reopened.clear()
+        assert await reopened.get("k") is None
+
+
+class TestFlowCache:
+    """Test FlowCache hit/miss accounting."""
+
+    @pytest.mark.asyncio
+    async def test_hit_and_miss_stats(self):
+        cache = FlowCache()
+        key = FlowCache.key_for("WebsiteCreationFlow", {"req": "Brew Haven"})
+
+        assert await cache.get(key) is None
+        await cache.set(key, "final site")
+        assert await cache.get(key) == "final site"
+
+        assert cache.get_stats() == {"hits": 1, "misses": 1}
+
+
+class TestSemanticCache:
+    """Test similarity lookups for reworded requests."""
+
+    VECTORS = {
+        "a coffee shop website": [1.0, 0.0, 0.0],
+        "make me a coffee shop site": [0.98, 0.1, 0.0],
+        "an online bookstore": [0.0, 1.0, 0.0],
+    }
+
+    @pytest.mark.asyncio
+    async def test_similar_request_hits_and_index_persists(self, tmp_path):
+        db_path = str(tmp_path / "cache.db")
+        backend = SQLiteCacheBackend(db_path)
+        cache = SemanticCache(
+            lambda text: self.VECTORS[text], backend=backend, namespace="plans"
+        )
+
+        assert await cache.get("a coffee shop website") is None
+        await cache.set("a coffee shop website", "home.html - landing page")
+        assert (
+            await cache.get("make me a coffee shop site") == "home.html - landing page"
+        )
+        assert await cache.get("an online bookstore") is None
+        assert cache.get_stats() == {"hits": 1, "misses": 2}
+        await backend.close()
+
+        async def async_embedder(text):
+            return self.VECTORS[text]
+
+        reopened = SQLiteCacheBackend(db_path)
+        restarted = SemanticCache(async_embedder, backend=reopened, namespace="plans")
+        assert (
+            await restarted.get("make me a coffee shop site")
+            == "home.html - landing page"
+        )
+        await reopened.close()
@@ -0,0 +1,36 @@
+"""
+Tests for the orjson-backed JSON helpers, with and without orjson available.
+"""
+
+import pytest
+
+from tframex.util import jsonio
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def backend(request, monkeypatch):
+    if request.param == "orjson":
+        if not jsonio.HAS_ORJSON:
+            pytest.skip("orjson not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+class TestJsonIO:
+    """Test that both backends behave the same."""
+
+    def test_dumps_returns_compact_bytes(self, backend):
+        assert jsonio.dumps({"a": [1, 2], "b": "é"}) == '{"a":[1,2],"b":"é"}'.encode(
+            "utf-8"
+        )
+
+    def test_indent_and_round_trip(self, backend):
+        data = {"mcpServers": {"echo": {"type": "stdio"}}}
+        assert jsonio.dumps(data, indent=True).startswith(b'{\n  "mcpServers"')
+        assert jsonio.loads(jsonio.dumps(data)) == data
+        assert jsonio.loads('{"x": 1}') == {"x": 1}
+
+    def test_decode_error_type(self, backend):
+        with pytest.raises(jsonio.JSONDecodeError):
+            jsonio.loads("{not json")
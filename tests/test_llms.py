@@ -0,0 +1,756 @@
+"""
+Tests for OpenAIChatLLM request/response helpers that don't need a live endpoint.
+"""
+
+import asyncio
+
+import pytest
+
+from tframex.models.primitives import Message, MessageChunk
+from tframex.util.cache import SQLiteCacheBackend
+from tframex.util.llms import CachingLLM, OpenAIChatLLM
+
+
+class TestPromptCaching:
+    """Test provider prompt-caching support."""
+
+    def test_prompt_caching_auto_enabled_for_anthropic(self):
+        llm = OpenAIChatLLM(
+            model_name="claude", api_base_url="https://api.anthropic.com/v1/"
+        )
+        assert llm.prompt_caching is True
+
+        llm = OpenAIChatLLM(model_name="gpt", api_base_url="http://localhost:11434/v1")
+        assert llm.prompt_caching is False
+
+    def test_cache_control_marks_first_system_message_only(self):
+        llm = OpenAIChatLLM(
+            model_name="m", api_base_url="http://x", prompt_caching=True
+        )
+        messages = [
+            {"role": "system", "content": "static preamble"},
+            {"role": "system", "content": "dynamic"},
+            {"role": "user", "content": "hi"},
+        ]
+        llm._apply_prompt_caching(messages)
+
+        assert messages[0]["content"] == [
+            {
+                "type": "text",
+                "text": "static preamble",
+                "cache_control": {"type": "ephemeral"},
+            }
+        ]
+        assert messages[1]["content"] == "dynamic"
+        assert messages[2]["content"] == "hi"
+
+    def test_extract_tokens_accumulates_cache_usage(self):
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        llm._extract_tokens(
+            {
+                "prompt_tokens": 100,
+                "completion_tokens": 10,
+                "prompt_tokens_details": {"cached_tokens": 64},
+            }
+        )
+        llm._extract_tokens(
+            {
+                "prompt_tokens": 50,
+                "completion_tokens": 5,
+                "cache_read_input_tokens": 40,
+                "cache_creation_input_tokens": 8,
+            }
+        )
+
+        assert llm.usage_totals == {
+            "prompt_tokens": 150,
+            "completion_tokens": 15,
+            "cached_tokens": 64,
+            "cache_creation_input_tokens": 8,
+            "cache_read_input_tokens": 40,
+        }
+
+    def test_system_message_payload_is_reused_and_not_mutated(self):
+        from tframex.models.primitives import Message
+
+        llm = OpenAIChatLLM(
+            model_name="m", api_base_url="http://x", prompt_caching=True
+        )
+        system_msg = Message(role="system", content="static preamble")
+
+        first = [llm._message_payload(system_msg)]
+        llm._apply_prompt_caching(first)
+        second = llm._message_payload(system_msg)
+
+        assert second == {"role": "system", "content": "static preamble"}
+        assert len(llm._system_payload_cache) == 1
+
+
+class TestClientPooling:
+    """Test the shared httpx client setup."""
+
+    @pytest.mark.asyncio
+    async def test_client_reused_and_options_survive_close(self):
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x", timeout=12.0)
+
+        client = await llm._get_client()
+        assert client is await llm._get_client()
+        assert client.timeout.read == 12.0
+
+        await llm.close()
+        recreated = await llm._get_client()
+        assert recreated is not client
+        assert recreated.timeout.read == 12.0
+        await llm.close()
+
+    def test_each_event_loop_gets_its_own_client(self):
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        sibling = OpenAIChatLLM(model_name="n", api_base_url="http://x")
+
+        async def get_clients():
+            return await llm._get_client(), await sibling._get_client()
+
+        first, _ = asyncio.run(
+            get_clients()
+        )  # Neither wrapper is closed before the loop ends
+        second, second_sibling = asyncio.run(get_clients())
+
+        assert second is not first
+        assert second_sibling is second
+        asyncio.run(second.aclose())
+
+    @pytest.mark.asyncio
+    async def test_warmup_never_raises(self):
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://127.0.0.1:9")
+        assert await llm.warmup() is False
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_priming_caps_the_requests_max_tokens(self):
+        import json
+
+        import httpx
+
+        sent = []
+
+        def handler(request):
+            sent.append(json.loads(request.content))
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+            )
+
+        llm = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            transport=httpx.MockTransport(handler),
+        )
+
+        assert await llm.warmup(prime=True, max_tokens=512) is True
+        assert sent[0]["max_tokens"] == 1
+        await llm.close()
+
+
+class TestRequestLimits:
+    """Test the shared per-endpoint in-flight cap."""
+
+    @pytest.mark.asyncio
+    async def test_wrappers_share_endpoint_cap(self):
+        import asyncio
+
+        import httpx
+
+        state = {"in_flight": 0, "max_in_flight": 0}
+
+        async def handler(request):
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+            await asyncio.sleep(0.01)
+            state["in_flight"] -= 1
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+            )
+
+        transport = httpx.MockTransport(handler)
+        llms = [
+            OpenAIChatLLM(
+                model_name=name,
+                api_base_url="http://x",
+                max_concurrent_requests=2,
+                transport=transport,
+            )
+            for name in ("a", "b")
+        ]
+        messages = [Message(role="user", content="hi")]
+
+        results = await asyncio.gather(
+            *(llms[i % 2].chat_completion(messages) for i in range(6))
+        )
+
+        assert [r.content for r in results] == ["ok"] * 6
+        assert state["max_in_flight"] == 2
+        for llm in llms:
+            await llm.close()
+
+
+class TestStreamParsing:
+    """Test SSE stream parsing against a mock endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_tool_call_argument_fragments_joined(self):
+        import json
+
+        import httpx
+
+        deltas = [
+            {"choices": [{"delta": {"role": "assistant", "content": "Saving"}}]},
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": 0,
+                                    "id": "call_1",
+                                    "function": {
+                                        "name": "write_file",
+                                        "arguments": '{"path": ',
+                                    },
+                                }
+                            ]
+                        }
+                    }
+                ]
+            },
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 0, "function": {"arguments": '"a.html"}'}}
+                            ]
+                        }
+                    }
+                ]
+            },
+            {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+        ]
+        body = (
+            "".join(f"data: {json.dumps(d)}\n\n" for d in deltas) + "data: [DONE]\n\n"
+        )
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+        llm = OpenAIChatLLM(
+            model_name="m", api_base_url="http://x", transport=transport
+        )
+
+        chunks = [
+            c
+            async for c in await llm.chat_completion(
+                [Message(role="user", content="hi")], stream=True
+            )
+        ]
+
+        assert chunks[0].content == "Saving"
+        (tool_call,) = chunks[1].tool_calls
+        assert tool_call.function.name == "write_file"
+        assert tool_call.function.arguments == '{"path": "a.html"}'
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_each_tool_call_yielded_once_the_next_one_starts(self):
+        import json
+
+        import httpx
+
+        def call_delta(index, call_id, args):
+            return {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {
+                                    "index": index,
+                                    "id": call_id,
+                                    "function": {
+                                        "name": "write_file",
+                                        "arguments": args,
+                                    },
+                                }
+                            ]
+                        }
+                    }
+                ]
+            }
+
+        deltas = [
+            call_delta(0, "call_1", '{"path": "a.html"}'),
+            call_delta(1, "call_2", '{"path": '),
+            {
+                "choices": [
+                    {
+                        "delta": {
+                            "tool_calls": [
+                                {"index": 1, "function": {"arguments": '"b.html"}'}}
+                            ]
+                        }
+                    }
+                ]
+            },
+            {"choices": [{"delta": {}, "finish_reason": "tool_calls"}]},
+        ]
+        body = (
+            "".join(f"data: {json.dumps(d)}\n\n" for d in deltas) + "data: [DONE]\n\n"
+        )
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, text=body))
+        llm = OpenAIChatLLM(
+            model_name="m", api_base_url="http://x", transport=transport
+        )
+
+        chunks = [
+            c
+            async for c in await llm.chat_completion(
+                [Message(role="user", content="hi")], stream=True
+            )
+        ]
+
+        assert [[tc.id for tc in c.tool_calls] for c in chunks] == [
+            ["call_1"],
+            ["call_2"],
+        ]
+        assert chunks[1].tool_calls[0].function.arguments == '{"path": "b.html"}'
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_text_tool_call_keeps_quoted_commas_and_parens(self):
+        import json
+
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+
+        (call,) = llm._parse_text_tool_calls(
+            '[write_file(path="a.html", content="Hi (there), you", n=2)]'
+        )
+
+        assert call["function"]["name"] == "write_file"
+        assert json.loads(call["function"]["arguments"]) == {
+            "path": "a.html",
+            "content": "Hi (there), you",
+            "n": 2,
+        }
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_text_tool_calls_converted_only_when_present(self):
+        import httpx
+
+        replies = ['[list_files(directory_path=".")]', "No tools needed."]
+
+        def handler(request):
+            return httpx.Response(
+                200,
+                json={
+                    "choices": [
+                        {"message": {"role": "assistant", "content": replies.pop(0)}}
+                    ]
+                },
+            )
+
+        llm = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            parse_text_tool_calls=True,
+            transport=httpx.MockTransport(handler),
+        )
+
+        with_call = await llm.chat_completion([Message(role="user", content="hi")])
+        plain = await llm.chat_completion([Message(role="user", content="hi")])
+
+        assert with_call.content is None
+        assert with_call.tool_calls[0].function.name == "list_files"
+        assert plain.content == "No tools needed." and not plain.tool_calls
+        await llm.close()
+
+
+class TestRetries:
+    """Test retrying of transient HTTP failures."""
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_after_retry_after(self):
+        import httpx
+
+        statuses = [429, 503, 200]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"}, json={})
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+            )
+
+        llm = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            transport=httpx.MockTransport(handler),
+        )
+
+        response = await llm.chat_completion([Message(role="user", content="hi")])
+
+        assert response.content == "ok"
+        assert statuses == []
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_client_errors_not_retried(self):
+        import httpx
+
+        calls = []
+
+        def handler(request):
+            calls.append(request)
+            return httpx.Response(400, json={"error": {"message": "bad"}})
+
+        llm = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            transport=httpx.MockTransport(handler),
+        )
+
+        response = await llm.chat_completion([Message(role="user", content="hi")])
+
+        assert response.content == "LLM API Error: 400 - bad"
+        assert len(calls) == 1
+        await llm.close()
+
+    @pytest.mark.asyncio
+    async def test_streams_retry_before_first_chunk(self):
+        import httpx
+
+        statuses = [429, 502, 200, 503]
+
+        def handler(request):
+            status = statuses.pop(0)
+            if status != 200:
+                return httpx.Response(status, headers={"Retry-After": "0"}, text="busy")
+            return httpx.Response(
+                200,
+                text='data: {"choices": [{"delta": {"content": "ok"}}]}\n\ndata: [DONE]\n\n',
+            )
+
+        llm = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            transport=httpx.MockTransport(handler),
+        )
+        messages = [Message(role="user", content="hi")]
+
+        chunks = [
+            c.content async for c in await llm.chat_completion(messages, stream=True)
+        ]
+        exhausted = [
+            c.content
+            async for c in await llm.chat_completion(
+                messages, stream=True, max_retries=0
+            )
+        ]
+
+        assert chunks == ["ok"]
+        assert exhausted == ["LLM API Stream Error: 503 - busy"]
+        await llm.close()
+
+
+class StubLLM:
+    """LLM stand-in that counts non-streaming calls."""
+
+    model_id = "stub"
+    api_key = None
+    api_base_url = "http://stub"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def chat_completion(self, messages, stream=False, **kwargs):
+        self.calls += 1
+        return Message(role="assistant", content=f"answer {self.calls}")
+
+    async def close(self):
+        pass
+
+
+class StubMetrics:
+    def __init__(self):
+        self.outcomes = []
+
+    async def increment_counter(self, name, value=1, labels=None):
+        self.outcomes.append(labels["outcome"])
+
+
+class TestCachingLLM:
+    """Test the response cache wrapper."""
+
+    @pytest.mark.asyncio
+    async def test_exact_hit_skips_base_llm(self):
+        base, metrics = StubLLM(), StubMetrics()
+        llm = CachingLLM(base, metrics_manager=metrics)
+        messages = [Message(role="user", content="hello")]
+
+        first = await llm.chat_completion(messages, temperature=0.1)
+        second = await llm.chat_completion(messages, temperature=0.1)
+        await llm.chat_completion(messages, temperature=0.9)
+
+        assert first.content == second.content == "answer 1"
+        assert base.calls == 2
+        assert metrics.outcomes == ["miss", "exact_hit", "miss"]
+
+    @pytest.mark.asyncio
+    async def test_semantic_hit_requires_same_context(self):
+        vectors = {
+            "what is tframex?": [1.0, 0.0],
+            "what's tframex": [0.99, 0.05],
+            "unrelated": [0.0, 1.0],
+        }
+        base = StubLLM()
+        llm = CachingLLM(
+            base, embedder=lambda text: vectors[text], similarity_threshold=0.95
+        )
+
+        await llm.chat_completion([Message(role="user", content="what is tframex?")])
+        close = await llm.chat_completion(
+            [Message(role="user", content="what's tframex")]
+        )
+        await llm.chat_completion([Message(role="user", content="unrelated")])
+        await llm.chat_completion(
+            [
+                Message(role="system", content="other context"),
+                Message(role="user", content="what's tframex"),
+            ]
+        )
+
+        assert close.content == "answer 1"
+        assert llm.get_stats() == {"exact_hits": 0, "semantic_hits": 1, "misses": 3}
+
+    @pytest.mark.asyncio
+    async def test_sampled_requests_bypass_cache(self):
+        base = StubLLM()
+        llm = CachingLLM(base, max_cacheable_temperature=0.0)
+        messages = [Message(role="user", content="hello")]
+
+        await llm.chat_completion(messages, temperature=0.7)
+        await llm.chat_completion(messages, temperature=0.7)
+        await llm.chat_completion(messages, temperature=0, prompt_cache_key="run-1")
+        greedy = await llm.chat_completion(
+            messages, temperature=0, prompt_cache_key="run-2"
+        )
+
+        assert greedy.content == "answer 3"
+        assert base.calls == 3
+        assert llm.get_stats() == {"exact_hits": 1, "semantic_hits": 0, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_error_responses_are_not_cached(self):
+        base = StubLLM()
+
+        async def failing(messages, stream=False, **kwargs):
+            base.calls += 1
+            return Message(role="assistant", content="LLM API Error: 500")
+
+        base.chat_completion = failing
+        llm = CachingLLM(base)
+        messages = [Message(role="user", content="hi")]
+        await llm.chat_completion(messages)
+        await llm.chat_completion(messages)
+
+        assert base.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_completed_streams_are_cached_and_replayed(self):
+        base = StubLLM()
+
+        async def streaming(messages, stream=False, **kwargs):
+            base.calls += 1
+
+            async def chunks():
+                for part in ("str", "eamed"):
+                    yield MessageChunk(role="assistant", content=part)
+
+            return chunks()
+
+        base.chat_completion = streaming
+        llm = CachingLLM(base)
+        messages = [Message(role="user", content="hi")]
+
+        abandoned = await llm.chat_completion(messages, stream=True)
+        await abandoned.__anext__()
+        await abandoned.aclose()  # An unfinished stream is not cached
+        first = [
+            chunk.content
+            async for chunk in await llm.chat_completion(messages, stream=True)
+        ]
+        replayed = [
+            chunk.content
+            async for chunk in await llm.chat_completion(messages, stream=True)
+        ]
+        plain = await llm.chat_completion(messages)
+
+        assert first == ["str", "eamed"]
+        assert replayed == ["streamed"]
+        assert plain.content == "streamed"
+        assert base.calls == 2
+        assert llm.get_stats() == {"exact_hits": 2, "semantic_hits": 0, "misses": 2}
+
+    @pytest.mark.asyncio
+    async def test_streams_use_semantic_hits(self):
+        vectors = {"what is tframex?": [1.0, 0.0], "what's tframex": [0.99, 0.05]}
+        base = StubLLM()
+        llm = CachingLLM(
+            base, embedder=lambda text: vectors[text], similarity_threshold=0.95
+        )
+
+        await llm.chat_completion([Message(role="user", content="what is tframex?")])
+        stream = await llm.chat_completion(
+            [Message(role="user", content="what's tframex")], stream=True
+        )
+
+        assert [chunk.content async for chunk in stream] == ["answer 1"]
+        assert llm.get_stats() == {"exact_hits": 0, "semantic_hits": 1, "misses": 1}
+
+    @pytest.mark.asyncio
+    async def test_semantic_hits_survive_a_restart(self, tmp_path):
+        vectors = {"what is tframex?": [1.0, 0.0], "what's tframex": [0.99, 0.05]}
+        embedded = []
+
+        def embedder(text):
+            embedded.append(text)
+            return vectors[text]
+
+        backend = SQLiteCacheBackend(str(tmp_path / "llm.db"))
+        llm = CachingLLM(
+            StubLLM(), backend=backend, embedder=embedder, similarity_threshold=0.95
+        )
+        await llm.chat_completion([Message(role="user", content="what is tframex?")])
+        await backend.close()
+        assert embedded == ["what is tframex?"]
+
+        reopened = SQLiteCacheBackend(str(tmp_path / "llm.db"))
+        restarted = CachingLLM(
+            StubLLM(), backend=reopened, embedder=embedder, similarity_threshold=0.95
+        )
+        close = await restarted.chat_completion(
+            [Message(role="user", content="what's tframex")]
+        )
+        await reopened.close()
+
+        assert close.content == "answer 1"
+        assert restarted.get_stats() == {
+            "exact_hits": 0,
+            "semantic_hits": 1,
+            "misses": 0,
+        }
+
+
+class TestSharedClientPool:
+    """Test client sharing across wrappers with identical settings."""
+
+    @pytest.mark.asyncio
+    async def test_wrappers_share_client_until_last_close(self):
+        first = OpenAIChatLLM(model_name="a", api_base_url="http://x", api_key="k")
+        second = OpenAIChatLLM(model_name="b", api_base_url="http://x", api_key="k")
+        other_key = OpenAIChatLLM(
+            model_name="c", api_base_url="http://x", api_key="other"
+        )
+
+        client = await first._get_client()
+        assert await second._get_client() is client
+        assert await other_key._get_client() is not client
+
+        await first.close()
+        assert not client.is_closed
+        await second.aclose()
+        assert client.is_closed
+        await other_key.close()
+
+    @pytest.mark.asyncio
+    async def test_caller_supplied_client_is_used_with_per_request_auth(self):
+        import httpx
+
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("Authorization"))
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "ok"}}]},
+            )
+
+        shared = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        first = OpenAIChatLLM(
+            model_name="a", api_base_url="http://x", api_key="k1", http_client=shared
+        )
+        second = OpenAIChatLLM(
+            model_name="b", api_base_url="http://x", api_key="k2", http_client=shared
+        )
+
+        await first.chat_completion([Message(role="user", content="hi")])
+        await second.chat_completion([Message(role="user", content="hi")])
+        await first.close()
+
+        assert await second._get_client() is shared
+        assert seen == ["Bearer k1", "Bearer k2"]
+        assert not shared.is_closed
+        await shared.aclose()
+
+    @pytest.mark.asyncio
+    async def test_run_contexts_keep_default_llm_client_warm(self):
+        from tframex.app import TFrameXApp
+
+        llm = OpenAIChatLLM(model_name="m", api_base_url="http://x")
+        override = OpenAIChatLLM(
+            model_name="o", api_base_url="http://x", api_key="other"
+        )
+        app = TFrameXApp(default_llm=llm, mcp_config_file=None)
+
+        async with app.run_context():
+            client = await llm._get_client()
+        async with app.run_context():
+            assert await llm._get_client() is client
+        async with app.run_context(llm_override=override):
+            override_client = await override._get_client()
+        assert override_client.is_closed
+
+        await app.close()
+        assert client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_app_warmup_primes_once_through_cache_wrapper(self):
+        import asyncio
+
+        import httpx
+
+        from tframex.app import TFrameXApp
+
+        requests = []
+
+        def handler(request):
+            requests.append(request)
+            return httpx.Response(
+                200,
+                json={"choices": [{"message": {"role": "assistant", "content": "h"}}]},
+            )
+
+        base = OpenAIChatLLM(
+            model_name="m",
+            api_base_url="http://x",
+            transport=httpx.MockTransport(handler),
+        )
+        app = TFrameXApp(default_llm=CachingLLM(base), mcp_config_file=None)
+
+        assert await asyncio.gather(app.warmup(prime=True), app.warmup(prime=True)) == [
+            True,
+            True,
+        ]
+        assert await app.warmup(prime=True)
+
+        assert len(requests) == 1
+        assert requests[0].url.path.endswith("/chat/completions")
+        await app.close()
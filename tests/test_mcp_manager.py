@@ -0,0 +1,144 @@
+"""
+Tests for MCPManager server lifecycle handling that don't need real MCP servers.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from tframex.mcp.manager import MCPManager
+from tframex.mcp.server_connector import MCPConnectedServer
+
+
+@pytest.fixture
+def lazy_config(tmp_path):
+    config_path = tmp_path / "servers_config.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "mcpServers": {
+                    "eager": {
+                        "type": "streamable-http",
+                        "url": "http://localhost:1/mcp/",
+                    },
+                    "slow": {
+                        "type": "streamable-http",
+                        "url": "http://localhost:2/mcp/",
+                        "lazy": True,
+                    },
+                }
+            }
+        )
+    )
+    return str(config_path)
+
+
+class TestLazyServers:
+    """Test background initialization of servers marked "lazy"."""
+
+    @pytest.mark.asyncio
+    async def test_lazy_server_does_not_block_startup(self, lazy_config, monkeypatch):
+        release = asyncio.Event()
+
+        async def fake_initialize(self):
+            if self.server_alias == "slow":
+                await release.wait()
+            self.is_initialized = True
+            return True
+
+        monkeypatch.setattr(MCPConnectedServer, "initialize", fake_initialize)
+        manager = MCPManager(mcp_config_file_path=lazy_config)
+
+        await manager.initialize_servers()
+        assert manager.get_server("eager") is not None
+        assert manager.get_server("slow") is None
+        assert manager.has_pending_servers
+
+        release.set()
+        assert await manager.ensure_server_ready("slow") is True
+        assert manager.get_server("slow") is not None
+        assert not manager.has_pending_servers
+
+        await manager.notification_dispatcher.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_lazy_server_is_removed(self, lazy_config, monkeypatch):
+        async def fake_initialize(self):
+            if self.server_alias == "slow":
+                return False
+            self.is_initialized = True
+            return True
+
+        monkeypatch.setattr(MCPConnectedServer, "initialize", fake_initialize)
+        manager = MCPManager(mcp_config_file_path=lazy_config)
+
+        await manager.initialize_servers()
+        await manager.wait_for_pending_servers()
+
+        assert "slow" not in manager.servers
+        assert "eager" in manager.servers
+
+        await manager.notification_dispatcher.stop()
+
+
+class StubRuntimeContext:
+    def __init__(self, mcp_manager):
+        self.mcp_manager = mcp_manager
+
+
+class TestListingCache:
+    """Test per-epoch caching of the MCP listing meta-tools."""
+
+    @pytest.mark.asyncio
+    async def test_listing_cached_until_epoch_changes(self, lazy_config):
+        from tframex.mcp.meta_tools import (
+            tframex_invalidate_mcp_cache,
+            tframex_list_mcp_servers,
+        )
+
+        manager = MCPManager(mcp_config_file_path=lazy_config)
+        server = MCPConnectedServer(
+            "eager", {"type": "streamable-http", "url": "http://localhost:1/mcp/"}
+        )
+        manager.servers["eager"] = server
+        rt_ctx = StubRuntimeContext(manager)
+
+        first = await tframex_list_mcp_servers(rt_ctx)
+        assert "Failed/Not Initialized" in first
+
+        server.is_initialized = (
+            True  # Status changed without a new epoch: listing stays cached
+        )
+        assert await tframex_list_mcp_servers(rt_ctx) is first
+
+        server.epoch += 1  # Simulates a reconnect
+        assert "Status: Initialized" in await tframex_list_mcp_servers(rt_ctx)
+
+        assert (
+            await tframex_invalidate_mcp_cache(rt_ctx)
+            == "Cleared 2 cached MCP listing(s)."
+        )
+
+    @pytest.mark.asyncio
+    async def test_only_successful_listings_are_cached(self, lazy_config, monkeypatch):
+        from tframex.mcp import manager as manager_module
+        from tframex.mcp.meta_tools import tframex_list_mcp_resources
+
+        manager = MCPManager(mcp_config_file_path=lazy_config)
+        rt_ctx = StubRuntimeContext(manager)
+
+        reply = await tframex_list_mcp_resources(rt_ctx, server_alias="missing")
+        assert reply.startswith("Error")
+        assert (
+            manager.get_cached_listing(
+                manager.listing_cache_key("resources", "missing")
+            )
+            is None
+        )
+
+        monkeypatch.setattr(manager_module, "MAX_CACHED_LISTINGS", 2)
+        for epoch in range(3):
+            manager.cache_listing(("servers", None, epoch), f"listing {epoch}")
+        assert manager.get_cached_listing(("servers", None, 0)) is None
+        assert manager.get_cached_listing(("servers", None, 2)) == "listing 2"
@@ -0,0 +1,56 @@
+"""
+Tests for InMemoryMemoryStore and the token budget helpers it uses.
+"""
+
+import pytest
+
+from tframex.models.primitives import FunctionCall, Message, ToolCall
+from tframex.util.memory import InMemoryMemoryStore
+from tframex.util.tokens import count_tokens, truncate_by_tokens
+
+
+class TestTruncateByTokens:
+    """Test section-aware truncation."""
+
+    def test_short_text_unchanged(self):
+        assert truncate_by_tokens("hello", max_tokens=100) == "hello"
+
+    def test_trailing_sections_dropped_first(self):
+        text = "Project: A\n\n" + "details " * 50 + "\n\nfooter"
+        truncated = truncate_by_tokens(text, max_tokens=20)
+        assert truncated == "Project: A"
+        assert count_tokens(truncated) <= 20
+
+    def test_oversized_single_section_is_cut(self):
+        truncated = truncate_by_tokens("x" * 1000, max_tokens=10)
+        assert 0 < count_tokens(truncated) <= 10
+
+
+class TestInMemoryMemoryStore:
+    """Test history eviction limits."""
+
+    @pytest.mark.asyncio
+    async def test_token_budget_evicts_oldest(self):
+        store = InMemoryMemoryStore(max_tokens=60)
+        for i in range(5):
+            await store.add_message(Message(role="user", content=f"{i}" * 80))
+
+        history = await store.get_history()
+        assert [m.content[0] for m in history] == ["3", "4"]
+        assert store.total_tokens <= 60
+
+    @pytest.mark.asyncio
+    async def test_eviction_drops_orphaned_tool_results(self):
+        store = InMemoryMemoryStore(max_history_size=3)
+        call = ToolCall(id="1", function=FunctionCall(name="t", arguments="{}"))
+        await store.add_message(
+            Message(role="assistant", content=None, tool_calls=[call])
+        )
+        await store.add_message(
+            Message(role="tool", tool_call_id="1", name="t", content="r")
+        )
+        await store.add_message(Message(role="assistant", content="answer"))
+        await store.add_message(Message(role="user", content="next"))
+
+        history = await store.get_history()
+        assert [m.role for m in history] == ["assistant", "user"]
@@ -0,0 +1,147 @@
+"""
+Tests for TFrameX flow patterns that can run against a stub engine.
+"""
+
+import asyncio
+
+import pytest
+
+from tframex.flows.flow_context import FlowContext
+from tframex.models.primitives import Message
+from tframex.patterns import ParallelPattern
+
+
+class StubEngine:
+    """Engine stand-in that records how many agent calls overlap."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def call_agent(self, agent_name, input_message, **kwargs):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return Message(role="assistant", content=f"{agent_name} done")
+
+
+class TestParallelPattern:
+    """Test ParallelPattern fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_tasks_run_concurrently(self):
+        engine = StubEngine()
+        pattern = ParallelPattern("fanout", tasks=["A", "B", "C"])
+        ctx = FlowContext(initial_input=Message(role="user", content="go"))
+
+        result_ctx = await pattern.execute(ctx, engine)
+
+        assert engine.max_in_flight == 3
+        assert "A" in result_ctx.current_message.content
+        assert "C" in result_ctx.current_message.content
+
+    @pytest.mark.asyncio
+    async def test_max_concurrency_bounds_in_flight_tasks(self):
+        engine = StubEngine()
+        pattern = ParallelPattern(
+            "bounded", tasks=["A", "B", "C", "D", "E"], max_concurrency=2
+        )
+        ctx = FlowContext(initial_input=Message(role="user", content="go"))
+
+        await pattern.execute(ctx, engine)
+
+        assert engine.max_in_flight == 2
+
+
+class TestDAGPattern:
+    """Test DAGPattern level compilation and execution."""
+
+    def test_levels_compiled_once_and_cycles_rejected(self):
+        from tframex.patterns import DAGPattern
+
+        pattern = DAGPattern(
+            "pipeline",
+            [
+                ("report", "Reporter", ["sales", "support"]),
+                ("sales", "Analyst"),
+                ("support", "Analyst"),
+                ("qa", "Reviewer", ["report"]),
+            ],
+        )
+        assert pattern.levels == [["sales", "support"], ["report"], ["qa"]]
+        assert pattern.sinks == ["qa"]
+
+        with pytest.raises(ValueError):
+            DAGPattern("cycle", [("a", "A", ["b"]), ("b", "B", ["a"])])
+
+    @pytest.mark.asyncio
+    async def test_independent_nodes_overlap_and_failures_skip_dependents(self):
+        from tframex.patterns import DAGPattern
+
+        class FailingEngine(StubEngine):
+            async def call_agent(self, agent_name, input_message, **kwargs):
+                if agent_name == "Broken":
+                    raise RuntimeError("boom")
+                return await super().call_agent(agent_name, input_message, **kwargs)
+
+        engine = FailingEngine()
+        pattern = DAGPattern(
+            "pipeline",
+            [
+                ("a", "A"),
+                ("b", "B"),
+                ("broken", "Broken"),
+                (
+                    "merge",
+                    "Merge",
+                    ["a", "b"],
+                    lambda results, initial: f"{initial.content}: {results['a'].content}",
+                ),
+                ("after_broken", "After", ["broken"]),
+            ],
+        )
+        ctx = FlowContext(initial_input=Message(role="user", content="go"))
+
+        result_ctx = await pattern.execute(ctx, engine)
+        results = result_ctx.shared_data["pipeline_results"]
+
+        assert (
+            engine.max_in_flight == 2
+        )  # "a" and "b" ran together ("broken" fails immediately)
+        assert results["merge"].content == "Merge done"
+        assert isinstance(results["after_broken"], RuntimeError)
+        assert "merge: Merge done" in result_ctx.current_message.content
+
+
+class TestDiscussionPattern:
+    """Test DiscussionPattern stop-phrase handling."""
+
+    @pytest.mark.asyncio
+    async def test_stop_phrase_matches_case_insensitively(self):
+        from tframex.patterns import DiscussionPattern
+
+        class ClosingEngine(StubEngine):
+            speakers = []
+
+            async def call_agent(self, agent_name, input_message, **kwargs):
+                self.speakers.append(agent_name)
+                return Message(
+                    role="assistant",
+                    content=f"{agent_name}: We have CONSENSUS (final).",
+                )
+
+        engine = ClosingEngine()
+        pattern = DiscussionPattern(
+            "debate",
+            participant_agent_names=["A", "B"],
+            discussion_rounds=3,
+            stop_phrase="Consensus (final)",
+        )
+        ctx = FlowContext(initial_input=Message(role="user", content="topic"))
+
+        result_ctx = await pattern.execute(ctx, engine)
+
+        assert result_ctx.current_message.content.startswith("A:")
+        assert engine.speakers == ["A"]
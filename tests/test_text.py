@@ -0,0 +1,30 @@
+"""
+Tests for the TFrameX text extraction helpers (tframex.util.text).
+"""
+
+import time
+
+from tframex.util.text import extract_code_block
+
+
+class TestExtractCodeBlock:
+    """Test the line-scanning code fence parser."""
+
+    def test_first_block_body_without_language_tag(self):
+        text = "Here you go:\n```html\n<p>hi</p>\n```\nand\n```css\np {}\n```"
+        assert extract_code_block(text) == "<p>hi</p>"
+
+    def test_inner_shorter_or_different_fences_stay_in_body(self):
+        text = "````markdown\n# Doc\n```python\nprint(1)\n```\n~~~\n````"
+        assert extract_code_block(text) == "# Doc\n```python\nprint(1)\n```\n~~~"
+
+    def test_no_fence_and_unterminated_block(self):
+        assert extract_code_block("plain answer") is None
+        assert extract_code_block(None) is None
+        assert extract_code_block('```json\n{"a": 1') == '{"a": 1'
+
+    def test_many_unbalanced_backticks_scan_linearly(self):
+        text = "```\n" + "`` x\n" * 50000
+        start = time.perf_counter()
+        assert extract_code_block(text).startswith("`` x")
+        assert time.perf_counter() - start < 1.0
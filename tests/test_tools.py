@@ -0,0 +1,86 @@
+"""
+Tests for the TFrameX Tool wrapper (tframex.util.tools).
+"""
+
+import pytest
+
+from tframex.util.tools import Tool
+
+
+class TestToolResultCache:
+    """Test memoization of cacheable tool results."""
+
+    @pytest.mark.asyncio
+    async def test_cacheable_tool_runs_once_per_argument_set(self):
+        calls = []
+
+        async def lookup(city: str, units: str = "metric") -> str:
+            calls.append((city, units))
+            return f"{city}:{units}:{len(calls)}"
+
+        tool = Tool("lookup", lookup, cacheable=True)
+
+        first = await tool.execute('{"city": "Oslo", "units": "si"}')
+        assert await tool.execute('{"units": "si", "city": "Oslo"}') == first
+        assert await tool.execute('{"city": "Rome"}') == "Rome:metric:2"
+
+        await tool.clear_cache()
+        assert await tool.execute('{"city": "Oslo", "units": "si"}') == "Oslo:si:3"
+
+    @pytest.mark.asyncio
+    async def test_errors_and_uncached_tools_always_run(self):
+        calls = []
+
+        def flaky(attempt: int) -> dict:
+            calls.append(attempt)
+            if len(calls) == 1:
+                raise RuntimeError("temporary")
+            return {"ok": len(calls)}
+
+        cached = Tool("flaky", flaky, cacheable=True)
+        assert "error" in await cached.execute('{"attempt": 1}')
+        assert await cached.execute('{"attempt": 1}') == {"ok": 2}
+        assert await cached.execute('{"attempt": 1}') == {"ok": 2}
+
+        plain = Tool("plain", flaky)
+        assert await plain.execute('{"attempt": 1}') == {"ok": 3}
+        assert await plain.execute('{"attempt": 1}') == {"ok": 4}
+
+    @pytest.mark.asyncio
+    async def test_callers_cannot_mutate_cached_results(self):
+        def listing(folder: str) -> dict:
+            return {"folder": folder, "files": ["a.html"]}
+
+        tool = Tool("listing", listing, cacheable=True)
+
+        (await tool.execute('{"folder": "site"}'))["files"].append("first caller")
+        (await tool.execute('{"folder": "site"}'))["files"].append("second caller")
+
+        assert await tool.execute('{"folder": "site"}') == {
+            "folder": "site",
+            "files": ["a.html"],
+        }
+
+
+class TestToolSchema:
+    """Test parameter schemas sent to the LLM."""
+
+    def test_array_parameters_declare_items(self):
+        from typing import List
+
+        def tag(names: List[int], labels: list, title: str = "") -> str:
+            return title
+
+        properties = (
+            Tool("tag", tag)
+            .get_openai_tool_definition()
+            .function["parameters"]["properties"]
+        )
+
+        assert properties["names"] == {
+            "type": "array",
+            "description": "Parameter 'names'",
+            "items": {"type": "integer"},
+        }
+        assert properties["labels"]["items"] == {"type": "string"}
+        assert "items" not in properties["title"]
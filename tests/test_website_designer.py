@@ -0,0 +1,162 @@
+"""
+Tests for the website designer example's result caches, run against a scripted runtime.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+from tframex.models.primitives import Message, MessageChunk
+
+DESIGNER_PATH = (
+    Path(__file__).resolve().parents[1]
+    / "examples"
+    / "04-advanced-examples"
+    / "website-designer"
+    / "designer.py"
+)
+PLAN = "- index.html: Home page\n- about.html: About us\n\nTone: warm and welcoming."
+
+
+@pytest.fixture
+def designer(tmp_path, monkeypatch):
+    """A fresh copy of the designer module writing to and caching under tmp_path."""
+    monkeypatch.setenv("WEBSITE_OUTPUT_DIR", str(tmp_path / "site"))
+    monkeypatch.setenv("WEBSITE_DESIGNER_CACHE_DB", str(tmp_path / "cache.db"))
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "llm_cache"))
+    monkeypatch.delenv("EMBEDDING_MODEL_NAME", raising=False)
+    monkeypatch.delenv("WEBSITE_CACHE_ENABLED", raising=False)
+    monkeypatch.chdir(tmp_path)
+    spec = importlib.util.spec_from_file_location(
+        "website_designer_under_test", DESIGNER_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class StubRuntime:
+    """Answers every agent call with canned output and records which agents were called."""
+
+    def __init__(self):
+        self.calls = []
+
+    def isolate_agents(self):
+        pass
+
+    async def prime_agent(self, agent_name, input_message):
+        return True
+
+    async def call_agent_stream(self, agent_name, input_message):
+        self.calls.append(agent_name)
+        if agent_name == "ContentStrategist":
+            text = PLAN
+        else:
+            text = "".join(
+                f'<file path="{page}">\n<main>{page}</main>\n</file>\n'
+                for page in ("index.html", "about.html")
+                if f"`{page}`" in input_message
+            )
+        yield MessageChunk(role="assistant", content=text)
+
+    async def call_agent(self, agent_name, input_message):
+        self.calls.append(agent_name)
+        return Message(role="assistant", content=f"{agent_name} done")
+
+
+class TestFlowCache:
+    """Test that a cached site run brings back its files, not just its summary."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_rewrites_the_sites_files(self, designer):
+        output = Path(designer.OUTPUT_DIR)
+        first_rt = StubRuntime()
+        designer.start_write_log()
+        first = await designer.run_website_flow(first_rt, "A coffee shop site")
+        assert "HTMLDeveloper" in first_rt.calls
+        index_html = (output / "index.html").read_text()
+
+        for page in output.iterdir():
+            page.unlink()
+        second_rt = StubRuntime()
+        designer.start_write_log()
+        second = await designer.run_website_flow(second_rt, "A coffee shop site")
+
+        assert second == first
+        assert second_rt.calls == []
+        assert (output / "index.html").read_text() == index_html
+        assert (output / "about.html").exists()
+
+
+class TestPageCache:
+    """Test that pages of an unchanged plan are replayed on the next run."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_replays_unchanged_pages(self, designer):
+        designer.FUSED_PAGE_LIMIT = (
+            0  # One HTMLDeveloper call (and cache entry) per page
+        )
+        output = Path(designer.OUTPUT_DIR)
+        first_rt = StubRuntime()
+        designer.start_write_log()
+        await designer.run_website_pipelined(first_rt, "A coffee shop site")
+        assert first_rt.calls.count("HTMLDeveloper") == 2
+
+        (output / "about.html").unlink()
+        second_rt = StubRuntime()
+        designer.start_write_log()
+        await designer.run_website_pipelined(second_rt, "A coffee shop site")
+
+        assert "HTMLDeveloper" not in second_rt.calls
+        assert "<main>about.html</main>" in (output / "about.html").read_text()
+
+    @pytest.mark.asyncio
+    async def test_similar_pages_of_another_site_are_not_replayed(self, designer):
+        designer.FUSED_PAGE_LIMIT = 0
+        designer.page_semantic_cache = designer.SemanticCache(
+            lambda text: [
+                float("index.html" in text),
+                float("about.html" in text),
+            ],  # Page names only
+            backend=designer.flow_cache.backend,
+            namespace="website_page",
+        )
+        await designer.run_website_pipelined(StubRuntime(), "A coffee shop site")
+
+        other_rt = StubRuntime()
+        await designer.run_website_pipelined(other_rt, "A bookstore site")
+        assert other_rt.calls.count("HTMLDeveloper") == 2
+
+        reworded_rt = StubRuntime()
+        await designer.run_website_pipelined(reworded_rt, "a  Coffee shop SITE")
+        assert "HTMLDeveloper" not in reworded_rt.calls
+
+
+class TestPlanCache:
+    """Test that the content plan is replayed under the same switch as the other caches."""
+
+    @pytest.mark.asyncio
+    async def test_plan_is_replayed_unless_caching_is_disabled(self, designer):
+        requirements = "A coffee shop site"
+        first_parts, second_parts = [], []
+        first = [
+            spec
+            async for spec in designer.plan_page_specs(
+                StubRuntime(), requirements, first_parts
+            )
+        ]
+        replay_rt = StubRuntime()
+        second = [
+            spec
+            async for spec in designer.plan_page_specs(
+                replay_rt, requirements, second_parts
+            )
+        ]
+        assert [spec for spec in second if spec] == [spec for spec in first if spec]
+        assert replay_rt.calls == []
+
+        designer.RESULT_CACHE_ENABLED = False
+        uncached_rt = StubRuntime()
+        [spec async for spec in designer.plan_page_specs(uncached_rt, requirements, [])]
+        assert uncached_rt.calls == ["ContentStrategist"]
@@ -1,6 +1,8 @@
+import asyncio
 import logging
 import re  # For stripping think tags
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 
 from tframex.models.primitives import Message
@@ -12,6 +14,51 @@ logger = logging.getLogger(__name__)
 agent_internal_debug_logger = logging.getLogger("tframex.agent_internal_debug")
 agent_internal_debug_logger.setLevel(logging.DEBUG)
 
+# <think>...</think> blocks plus trailing whitespace. The body is an unrolled loop (runs of
+# non-'<', or a '<' that doesn't start '</think>'), so an unclosed tag fails in linear time
+# instead of backtracking like a lazy DOTALL '.*?'.
+# Responses at least this long with several think blocks are cleaned in a worker thread, so
+# the regex pass doesn't stall other agents' network I/O on the event loop.
+OFFLOAD_POST_PROCESS_CHARS = 1 << 17  # 128 KiB
+_THINK_BLOCK_RE = re.compile(r"<think>[^<]*(?:<(?!/think>)[^<]*)*</think>\s*")
+# Distinct system prompt renderings kept per agent; agents whose template vars change on
+# every call would otherwise grow the cache without bound.
+SYSTEM_PROMPT_CACHE_SIZE = 8
+
+
+def _strip_think_blocks(content: str) -> str:
+    """
+    Removes <think>...</think> blocks and surrounding whitespace. The usual single block is
+    cut out with str.find and one slice; only responses with several blocks go through
+    _THINK_BLOCK_RE. Responses without a closing tag (the common no-reasoning case) cost a
+    single scan. A closing tag with no opener, as sent by reasoning models whose chat
+    template already opened the block in the prompt, drops everything up to it.
+    """
+    close = content.find("</think>")
+    if close == -1:  # No block to remove (an unclosed <think> is left alone)
+        return content.strip()
+    start = content.find("<think>", 0, close)
+    if start == -1:
+        if (
+            "<think>" not in content
+        ):  # Orphan closing tag: the reasoning is everything before it
+            return content[close + len("</think>") :].strip()
+        return _THINK_BLOCK_RE.sub("", content).strip()
+    end = close + len("</think>")
+    if content.find("<think>", end) != -1:
+        return _THINK_BLOCK_RE.sub("", content).strip()
+    if start == 0:
+        return content[end:].strip()
+    return (content[:start] + content[end:].lstrip()).strip()
+
+
+def _summarize_description(description: Optional[str]) -> str:
+    """First paragraph of a (possibly docstring-derived) description, whitespace-collapsed."""
+    if not description:
+        return ""
+    first_paragraph = description.strip().split("\n\n", 1)[0]
+    return " ".join(first_paragraph.split())
+
 
 class BaseAgent(ABC):
     def __init__(
@@ -44,6 +91,9 @@ class BaseAgent(ABC):
         )
         self.strip_think_tags = strip_think_tags
         self.config = config
+        # Rendered system prompts keyed on their template vars (LRU, SYSTEM_PROMPT_CACHE_SIZE
+        # entries). Each distinct rendering is built once and reused by reference.
+        self._system_prompt_cache: "OrderedDict[Any, Message]" = OrderedDict()
 
         agent_internal_debug_logger.debug(
             f"[{self.agent_id}] BaseAgent.__init__ called. Description: '{self.description}'. "
@@ -68,10 +118,35 @@ class BaseAgent(ABC):
                 f"[{self.agent_id}] No system_prompt_template defined."
             )
             return None
+        try:
+            cache_key = tuple(sorted(kwargs_for_template.items()))
+            hash(cache_key)
+        except TypeError:  # Unhashable template vars are rendered fresh every time
+            cache_key = None
+        if cache_key is not None:
+            cached_msg = self._system_prompt_cache.get(cache_key)
+            if cached_msg is not None:
+                self._system_prompt_cache.move_to_end(cache_key)
+                return cached_msg
+        msg = self._build_system_message(kwargs_for_template)
+        if cache_key is not None:
+            self._system_prompt_cache[cache_key] = msg
+            if len(self._system_prompt_cache) > SYSTEM_PROMPT_CACHE_SIZE:
+                self._system_prompt_cache.popitem(
+                    last=False
+                )  # Evict least recently used
+        return msg
+
+    def _build_system_message(self, kwargs_for_template: Dict[str, Any]) -> Message:
         try:
             prompt_format_args = kwargs_for_template.copy()
+            # One line per tool: full descriptions and parameter schemas already reach the
+            # LLM through the tools payload, so repeating them here only costs tokens.
             tool_descriptions = "\n".join(
-                [f"- {name}: {tool.description}" for name, tool in self.tools.items()]
+                [
+                    f"- {name}: {_summarize_description(tool.description)}"
+                    for name, tool in self.tools.items()
+                ]
             )
             prompt_format_args["available_tools_descriptions"] = (
                 tool_descriptions or "No tools available."
@@ -108,23 +183,35 @@ class BaseAgent(ABC):
     def _post_process_llm_response(self, message: Message) -> Message:
         """Applies post-processing to the LLM response, like stripping think tags."""
         if self.strip_think_tags and message.content:
-            # Using regex to remove <think>...</think> blocks, including newlines within them
-            # re.DOTALL makes . match newlines as well
-            # Non-greedy match .*? is important
             original_content = message.content
-            processed_content = re.sub(
-                r"<think>.*?</think>\s*", "", original_content, flags=re.DOTALL
-            ).strip()
-            if processed_content != original_content:
+            processed_content = _strip_think_blocks(original_content)
+            if (
+                processed_content is not original_content
+            ):  # str.strip() returns the same object when unchanged
                 agent_internal_debug_logger.debug(
                     f"[{self.agent_id}] Stripped think tags. Original length: {len(original_content)}, Processed length: {len(processed_content)}"
                 )
                 logger.debug(
                     f"Agent '{self.agent_id}': Stripped think tags. Original: '{original_content[:100]}...', Processed: '{processed_content[:100]}...'"
                 )
-            message.content = processed_content
+                message.content = processed_content
         return message
 
+    async def _post_process_llm_response_async(self, message: Message) -> Message:
+        """_post_process_llm_response, run off the event loop for very large multi-block responses."""
+        content = message.content
+        if (
+            self.strip_think_tags
+            and isinstance(content, str)
+            and len(content) >= OFFLOAD_POST_PROCESS_CHARS
+            and content.count("<think>") > 1
+        ):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                None, self._post_process_llm_response, message
+            )
+        return self._post_process_llm_response(message)
+
     @abstractmethod
     async def run(self, input_message: Union[str, Message], **kwargs: Any) -> Message:
         """
@@ -3,43 +3,66 @@ import asyncio
 import inspect
 import logging
 import os
-from typing import Any, Callable, Coroutine, Dict, List, Optional, Type, Union
-
-try:
-    from typing import AsyncGenerator
-except ImportError:
-    from typing_extensions import AsyncGenerator
+import sys
+from contextvars import ContextVar
+from typing import (
+    Any,
+    AsyncGenerator,
+    Callable,
+    Coroutine,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 
 from .agents.base import BaseAgent
 from .agents.llm_agent import LLMAgent
 from .flows.flow_context import FlowContext
 from .flows.flows import Flow
-from .models.primitives import Message, MessageChunk, ToolDefinition, ToolParameters, ToolParameterProperty
-from .util.engine import Engine
-from .util.llms import BaseLLMWrapper
-from .util.logging.logging_config import setup_logging # Assuming this is your setup
-from .util.memory import BaseMemoryStore, InMemoryMemoryStore
-from .util.tools import Tool
 
 # --- MCP Integration Imports ---
 from .mcp.manager import MCPManager
 from .mcp.meta_tools import (
-    tframex_list_mcp_servers,
+    tframex_invalidate_mcp_cache,
+    tframex_list_mcp_prompts,
     tframex_list_mcp_resources,
+    tframex_list_mcp_servers,
     tframex_read_mcp_resource,
-    tframex_list_mcp_prompts,
-    tframex_use_mcp_prompt
+    tframex_use_mcp_prompt,
 )
+from .models.primitives import (
+    Message,
+    MessageChunk,
+    ToolDefinition,
+    ToolParameterProperty,
+    ToolParameters,
+)
+from .util.engine import Engine
+from .util.llms import BaseLLMWrapper, LLMSession
+from .util.logging.logging_config import setup_logging  # Assuming this is your setup
+from .util.memory import BaseMemoryStore, InMemoryMemoryStore
+from .util.tools import Tool
 
 # Call setup_logging here or ensure it's called by the application using the library
 # setup_logging(level=logging.INFO) # Example: if you want TFrameX to set a default
 logger = logging.getLogger("tframex.app")
 
+# (context, engine) for the batch item running in the current task; see run_batch_async
+_batch_engine: ContextVar[Optional[tuple]] = ContextVar(
+    "tframex_batch_engine", default=None
+)
+
+
 class TFrameXApp:
     def __init__(
         self,
         default_llm: Optional[BaseLLMWrapper] = None,
-        default_memory_store_factory: Callable[[], BaseMemoryStore] = InMemoryMemoryStore,
+        default_memory_store_factory: Callable[
+            [], BaseMemoryStore
+        ] = InMemoryMemoryStore,
         mcp_config_file: Optional[str] = "servers_config.json",
         enable_mcp_roots: bool = True,
         enable_mcp_sampling: bool = True,
@@ -52,6 +75,7 @@ class TFrameXApp:
 
         self.default_llm = default_llm
         self.default_memory_store_factory = default_memory_store_factory
+        self._warmup_task: Optional["asyncio.Task[bool]"] = None
 
         self._mcp_manager: Optional[MCPManager] = None
         if mcp_config_file:
@@ -62,56 +86,119 @@ class TFrameXApp:
                     enable_roots=enable_mcp_roots,
                     enable_sampling=enable_mcp_sampling,
                     enable_experimental=enable_mcp_experimental,
-                    roots_allowed_paths=mcp_roots_allowed_paths
+                    roots_allowed_paths=mcp_roots_allowed_paths,
+                )
+                logger.info(
+                    f"Enhanced MCPManager initialized with config file: {mcp_config_file}"
+                )
+                logger.info(
+                    f"MCP capabilities: roots={enable_mcp_roots}, sampling={enable_mcp_sampling}, experimental={enable_mcp_experimental}"
                 )
-                logger.info(f"Enhanced MCPManager initialized with config file: {mcp_config_file}")
-                logger.info(f"MCP capabilities: roots={enable_mcp_roots}, sampling={enable_mcp_sampling}, experimental={enable_mcp_experimental}")
             except Exception as e:
-                logger.error(f"Failed to initialize MCPManager with {mcp_config_file}: {e}", exc_info=True)
+                logger.error(
+                    f"Failed to initialize MCPManager with {mcp_config_file}: {e}",
+                    exc_info=True,
+                )
         else:
-            logger.info("No MCP config file provided, MCP integration will be limited or disabled.")
+            logger.info(
+                "No MCP config file provided, MCP integration will be limited or disabled."
+            )
 
-        if not default_llm and not os.getenv("TFRAMEX_ALLOW_NO_DEFAULT_LLM"): # Example env var check
+        if not default_llm and not os.getenv(
+            "TFRAMEX_ALLOW_NO_DEFAULT_LLM"
+        ):  # Example env var check
             logger.warning(
                 "TFrameXApp initialized without a default LLM. LLM must be provided to run_context or agent for LLM-based agents to function."
             )
-        
+
         self._register_mcp_meta_tools()
 
     def _register_mcp_meta_tools(self):
         """Registers client-side functions for interacting with MCP as native TFrameX tools."""
-        if not self._mcp_manager: # Only register if MCP manager is set up
-            logger.debug("MCP meta-tools registration skipped: MCPManager not available.")
+        if not self._mcp_manager:  # Only register if MCP manager is set up
+            logger.debug(
+                "MCP meta-tools registration skipped: MCPManager not available."
+            )
             return
 
         logger.debug("Registering MCP meta-tools...")
-        
-        self.tool(name="tframex_list_mcp_servers", description="Lists all configured and initialized MCP servers.")(tframex_list_mcp_servers)
-        
+
+        self.tool(
+            name="tframex_list_mcp_servers",
+            description="Lists all configured and initialized MCP servers.",
+        )(tframex_list_mcp_servers)
+
         list_resources_params = ToolParameters(
             properties={
-                "server_alias": ToolParameterProperty(type="string", description="Optional. The alias of a specific MCP server. If omitted, lists from all connected servers.")
-            }, required=[] )
-        self.tool(name="tframex_list_mcp_resources", description="Lists available resources from MCP server(s).", parameters_schema=list_resources_params)(tframex_list_mcp_resources)
+                "server_alias": ToolParameterProperty(
+                    type="string",
+                    description="Optional. The alias of a specific MCP server. If omitted, lists from all connected servers.",
+                )
+            },
+            required=[],
+        )
+        self.tool(
+            name="tframex_list_mcp_resources",
+            description="Lists available resources from MCP server(s).",
+            parameters_schema=list_resources_params,
+        )(tframex_list_mcp_resources)
 
         read_resource_params = ToolParameters(
             properties={
-                "server_alias": ToolParameterProperty(type="string", description="The alias of the MCP server."),
-                "resource_uri": ToolParameterProperty(type="string", description="The URI of the MCP resource to read.")
-            }, required=["server_alias", "resource_uri"])
-        self.tool(name="tframex_read_mcp_resource", description="Reads content from a specific MCP resource.", parameters_schema=read_resource_params)(tframex_read_mcp_resource)
+                "server_alias": ToolParameterProperty(
+                    type="string", description="The alias of the MCP server."
+                ),
+                "resource_uri": ToolParameterProperty(
+                    type="string", description="The URI of the MCP resource to read."
+                ),
+            },
+            required=["server_alias", "resource_uri"],
+        )
+        self.tool(
+            name="tframex_read_mcp_resource",
+            description="Reads content from a specific MCP resource.",
+            parameters_schema=read_resource_params,
+        )(tframex_read_mcp_resource)
 
         list_prompts_params = ToolParameters(
-             properties={ "server_alias": ToolParameterProperty(type="string", description="Optional. Alias of a specific MCP server.") }, required=[])
-        self.tool(name="tframex_list_mcp_prompts", description="Lists available prompts from MCP server(s).", parameters_schema=list_prompts_params)(tframex_list_mcp_prompts)
+            properties={
+                "server_alias": ToolParameterProperty(
+                    type="string",
+                    description="Optional. Alias of a specific MCP server.",
+                )
+            },
+            required=[],
+        )
+        self.tool(
+            name="tframex_list_mcp_prompts",
+            description="Lists available prompts from MCP server(s).",
+            parameters_schema=list_prompts_params,
+        )(tframex_list_mcp_prompts)
 
         use_prompt_params = ToolParameters(
             properties={
-                "server_alias": ToolParameterProperty(type="string", description="Alias of the MCP server."),
-                "prompt_name": ToolParameterProperty(type="string", description="Name of the MCP prompt."),
-                "arguments": ToolParameterProperty(type="object", description="Key-value arguments for the prompt.")
-            }, required=["server_alias", "prompt_name", "arguments"])
-        self.tool(name="tframex_use_mcp_prompt", description="Uses a server-defined MCP prompt, returning its messages for the LLM.", parameters_schema=use_prompt_params)(tframex_use_mcp_prompt)
+                "server_alias": ToolParameterProperty(
+                    type="string", description="Alias of the MCP server."
+                ),
+                "prompt_name": ToolParameterProperty(
+                    type="string", description="Name of the MCP prompt."
+                ),
+                "arguments": ToolParameterProperty(
+                    type="object", description="Key-value arguments for the prompt."
+                ),
+            },
+            required=["server_alias", "prompt_name", "arguments"],
+        )
+        self.tool(
+            name="tframex_use_mcp_prompt",
+            description="Uses a server-defined MCP prompt, returning its messages for the LLM.",
+            parameters_schema=use_prompt_params,
+        )(tframex_use_mcp_prompt)
+
+        self.tool(
+            name="tframex_invalidate_mcp_cache",
+            description="Clears cached MCP server/resource/prompt listings so they are re-read on the next call.",
+        )(tframex_invalidate_mcp_cache)
         logger.info("MCP meta-tools registered.")
 
     async def initialize_mcp_servers(self):
@@ -128,41 +215,85 @@ class TFrameXApp:
         else:
             logger.info("TFrameXApp: No MCP manager to shutdown.")
 
+    async def warmup(self, prime: bool = False) -> bool:
+        """
+        Warms the default LLM once per app: its connection pool, and with prime=True the model
+        itself (see BaseLLMWrapper.warmup). Later and concurrent callers share the first
+        attempt, so long-running services can call this before every request at no cost.
+        """
+        if self.default_llm is None or not hasattr(self.default_llm, "warmup"):
+            return False
+        # A task from an earlier event loop (a previous asyncio.run()) can't be awaited here
+        if (
+            self._warmup_task is None
+            or self._warmup_task.get_loop() is not asyncio.get_running_loop()
+        ):
+            self._warmup_task = asyncio.ensure_future(
+                self.default_llm.warmup(prime=prime)
+            )
+        return await asyncio.shield(self._warmup_task)
+
+    async def close(self) -> None:
+        """
+        Closes the default LLM's connection pool. Run contexts leave it open so consecutive
+        (or overlapping) contexts reuse warm keep-alive connections; call this once at shutdown.
+        A pool left open when its event loop ends is dropped on first use in the next loop.
+        """
+        self._warmup_task = None
+        if self.default_llm is not None and hasattr(self.default_llm, "close"):
+            await self.default_llm.close()
+
+    aclose = close
+
     def tool(
         self,
         name: Optional[str] = None,
         description: Optional[str] = None,
-        parameters_schema: Optional[ToolParameters] = None, 
+        parameters_schema: Optional[ToolParameters] = None,
+        cacheable: bool = False,
+        cache_ttl: Optional[float] = None,
     ) -> Callable:
+        """
+        Registers func as a tool. Set cacheable=True only for deterministic tools without
+        side effects: repeated calls with the same arguments then return the first result
+        (for cache_ttl seconds, when set) instead of running the tool again.
+        """
+
         def decorator(func: Callable[..., Any]) -> Callable:
             tool_name = name or func.__name__
             if tool_name in self._tools:
-                if tool_name.startswith("tframex_"): # Allow re-registration for meta-tools
-                     logger.debug(f"Re-registering MCP meta-tool: '{tool_name}'")
+                if tool_name.startswith(
+                    "tframex_"
+                ):  # Allow re-registration for meta-tools
+                    logger.debug(f"Re-registering MCP meta-tool: '{tool_name}'")
                 else:
                     raise ValueError(f"Tool '{tool_name}' already registered.")
 
             parsed_params_obj = None
             if isinstance(parameters_schema, ToolParameters):
                 parsed_params_obj = parameters_schema
-            elif isinstance(parameters_schema, dict): 
+            elif isinstance(parameters_schema, dict):
                 props = {
                     p_name: ToolParameterProperty(**p_def)
                     for p_name, p_def in parameters_schema.get("properties", {}).items()
                 }
                 required_list = parameters_schema.get("required")
                 parsed_params_obj = ToolParameters(
-                    properties=props, required=required_list if isinstance(required_list, list) else []
+                    properties=props,
+                    required=required_list if isinstance(required_list, list) else [],
                 )
-            
+
             self._tools[tool_name] = Tool(
                 name=tool_name,
                 func=func,
                 description=description,
-                parameters_schema=parsed_params_obj, 
+                parameters_schema=parsed_params_obj,
+                cacheable=cacheable,
+                cache_ttl=cache_ttl,
             )
             logger.debug(f"Registered tool: '{tool_name}'")
             return func
+
         return decorator
 
     def agent(
@@ -171,12 +302,13 @@ class TFrameXApp:
         description: Optional[str] = None,
         callable_agents: Optional[List[str]] = None,
         system_prompt: Optional[str] = None,
-        tools: Optional[List[str]] = None, 
-        mcp_tools_from_servers: Optional[Union[List[str], str]] = None, 
+        tools: Optional[List[str]] = None,
+        mcp_tools_from_servers: Optional[Union[List[str], str]] = None,
         llm: Optional[BaseLLMWrapper] = None,
         memory_store: Optional[BaseMemoryStore] = None,
         agent_class: type[BaseAgent] = LLMAgent,
         strip_think_tags: bool = True,
+        cache_control: Optional[str] = None,
         **agent_config: Any,
     ) -> Callable:
         def decorator(target: Union[Callable, type]) -> Union[Callable, type]:
@@ -188,21 +320,30 @@ class TFrameXApp:
                 "description": description,
                 "callable_agent_names": callable_agents or [],
                 "system_prompt_template": system_prompt,
-                "native_tool_names": tools or [], 
-                "mcp_tools_from_servers_config": mcp_tools_from_servers, # Store the user's preference
+                "native_tool_names": tools or [],
+                "mcp_tools_from_servers_config": mcp_tools_from_servers,  # Store the user's preference
                 "llm_instance_override": llm,
                 "memory_override": memory_store,
                 "agent_class_ref": agent_class,
                 "strip_think_tags": strip_think_tags,
+                "cache_control": cache_control,
                 **agent_config,
             }
-            
-            is_class_based_agent = inspect.isclass(target) and issubclass(target, BaseAgent)
-            agent_class_to_log = target.__name__ if is_class_based_agent else agent_class.__name__
+
+            is_class_based_agent = inspect.isclass(target) and issubclass(
+                target, BaseAgent
+            )
+            agent_class_to_log = (
+                target.__name__ if is_class_based_agent else agent_class.__name__
+            )
 
             self._agents[agent_name] = {
-                "type": "custom_class_agent" if is_class_based_agent else "framework_managed_agent",
-                "ref": target, # For class agents, this is the class itself
+                "type": (
+                    "custom_class_agent"
+                    if is_class_based_agent
+                    else "framework_managed_agent"
+                ),
+                "ref": target,  # For class agents, this is the class itself
                 "config": final_config,
             }
             logger.info(
@@ -211,6 +352,7 @@ class TFrameXApp:
                 f"MCP Tools from config: {mcp_tools_from_servers or 'None'}."
             )
             return target
+
         return decorator
 
     def get_tool(self, name: str) -> Optional[Tool]:
@@ -220,9 +362,13 @@ class TFrameXApp:
         if not isinstance(flow_instance, Flow):
             raise TypeError("Can only register an instance of the Flow class.")
         if flow_instance.flow_name in self._flows:
-            raise ValueError(f"Flow with name '{flow_instance.flow_name}' already registered.")
+            raise ValueError(
+                f"Flow with name '{flow_instance.flow_name}' already registered."
+            )
         self._flows[flow_instance.flow_name] = flow_instance
-        logger.debug(f"Registered flow: '{flow_instance.flow_name}' with {len(flow_instance.steps)} steps.")
+        logger.debug(
+            f"Registered flow: '{flow_instance.flow_name}' with {len(flow_instance.steps)} steps."
+        )
 
     def get_flow(self, name: str) -> Optional[Flow]:
         return self._flows.get(name)
@@ -233,42 +379,76 @@ class TFrameXApp:
         # context_memory_override: Optional[BaseMemoryStore] = None, # Not used by context currently
     ) -> "TFrameXRuntimeContext":
         ctx_llm = llm_override or self.default_llm
-        ctx_mcp_manager = self._mcp_manager 
+        ctx_mcp_manager = self._mcp_manager
         return TFrameXRuntimeContext(self, llm=ctx_llm, mcp_manager=ctx_mcp_manager)
 
+    async def run_batch_async(
+        self,
+        agent_name: str,
+        prompts: List[Union[str, Message]],
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Union[Message, BaseException]]:
+        """Runs an agent over many independent prompts in a fresh run context. See TFrameXRuntimeContext.run_batch_async."""
+        async with self.run_context() as ctx:
+            return await ctx.run_batch_async(
+                agent_name,
+                prompts,
+                max_concurrency=max_concurrency,
+                return_exceptions=return_exceptions,
+                **kwargs,
+            )
+
+
 class TFrameXRuntimeContext:
     def __init__(
         self,
         app: TFrameXApp,
-        llm: Optional[BaseLLMWrapper], # LLM for this context
+        llm: Optional[BaseLLMWrapper],  # LLM for this context
         mcp_manager: Optional[MCPManager] = None,
     ):
         self._app = app
-        self.llm = llm 
-        self.mcp_manager = mcp_manager 
-        self.engine = Engine(app, self) # Engine gets this context instance
+        self.llm = llm
+        self.mcp_manager = mcp_manager
+        self.engine = Engine(app, self)  # Engine gets this context instance
 
     async def __aenter__(self) -> "TFrameXRuntimeContext":
         llm_id = self.llm.model_id if self.llm else "None (App Default/Agent Specific)"
         logger.info(f"TFrameXRuntimeContext entered. Context LLM: {llm_id}.")
         if self.mcp_manager:
-            if not self.mcp_manager.servers or \
-                any(not s.is_initialized for s in self.mcp_manager.servers.values()):
-                logger.info("RuntimeContext: Initializing MCP servers on enter (first time or some not ready)...")
+            if not self.mcp_manager.servers or any(
+                not s.is_initialized for s in self.mcp_manager.servers.values()
+            ):
+                logger.info(
+                    "RuntimeContext: Initializing MCP servers on enter (first time or some not ready)..."
+                )
                 await self.mcp_manager.initialize_servers()
             else:
-                logger.debug("RuntimeContext: All configured MCP servers already initialized by app or previous context.")
+                logger.debug(
+                    "RuntimeContext: All configured MCP servers already initialized by app or previous context."
+                )
         return self
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        if (self.llm and hasattr(self.llm, "close") and inspect.iscoroutinefunction(self.llm.close)):
+        # The app's default LLM outlives any one context (TFrameXApp.close releases it), so the
+        # next context doesn't pay a fresh TCP/TLS handshake and overlapping contexts aren't
+        # cut off mid-request. Per-context overrides are closed here as before.
+        if (
+            self.llm
+            and self.llm is not self._app.default_llm
+            and hasattr(self.llm, "close")
+            and inspect.iscoroutinefunction(self.llm.close)
+        ):
             try:
                 await self.llm.close()
                 logger.info(f"Context LLM client for {self.llm.model_id} closed.")
             except Exception as e:
-                logger.error(f"Error closing context LLM client for {self.llm.model_id}: {e}")
+                logger.error(
+                    f"Error closing context LLM client for {self.llm.model_id}: {e}"
+                )
         logger.info("TFrameXRuntimeContext exited.")
-        
+
     async def run_flow(
         self,
         flow_ref: Union[str, Flow],
@@ -287,34 +467,167 @@ class TFrameXRuntimeContext:
             raise TypeError("flow_ref must be a flow name (str) or a Flow instance.")
         return await flow_to_run.execute(
             initial_input,
-            self.engine, 
+            self.engine,
             initial_shared_data=initial_shared_data,
             flow_template_vars=flow_template_vars,
         )
 
+    def session(
+        self, session_id: Optional[str] = None, param_name: str = "prompt_cache_key"
+    ) -> LLMSession:
+        """
+        Creates an LLMSession to share across the agent calls of one pipeline, so their
+        requests carry the same provider prompt-cache key. Pass a stable session_id (e.g.
+        derived from the pipeline's shared system prompt) to reuse the cache across runs.
+        """
+        return (
+            LLMSession(session_id, param_name)
+            if session_id
+            else LLMSession(param_name=param_name)
+        )
+
+    @staticmethod
+    def _expand_session(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        session: Optional[LLMSession] = kwargs.pop("session", None)
+        return {**session.request_params(), **kwargs} if session else kwargs
+
     async def call_agent(
         self, agent_name: str, input_message: Union[str, Message], **kwargs: Any
     ) -> Message:
-        return await self.engine.call_agent(agent_name, input_message, **kwargs)
-    
+        batch_item = _batch_engine.get()
+        engine = batch_item[1] if batch_item and batch_item[0] is self else self.engine
+        return await engine.call_agent(
+            agent_name, input_message, **self._expand_session(kwargs)
+        )
+
+    async def prime_agent(
+        self,
+        agent_name: str,
+        input_message: Optional[Union[str, Message]] = None,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Sends agent_name's system prompt, tool definitions and the optional known start of its
+        next input as a 1-token request, so a provider with prefix caching serves that prefix
+        from cache on the real call. Run it as a task alongside the steps that precede the call.
+        """
+        return await self.engine.prime_agent(
+            agent_name, input_message, **self._expand_session(kwargs)
+        )
+
+    async def run_batch_async(
+        self,
+        agent_name: str,
+        prompts: List[Union[str, Message]],
+        max_concurrency: int = 10,
+        return_exceptions: bool = False,
+        **kwargs: Any,
+    ) -> List[Union[Message, BaseException]]:
+        """
+        Runs agent_name over independent prompts concurrently, at most max_concurrency at a time.
+        Each prompt gets its own agent instances (and so its own memory) but still goes through
+        this context's call_agent, so subclasses' checks and metrics apply per prompt.
+        Results are returned in prompt order.
+        """
+        run_one = self._batch_runner(agent_name, max_concurrency, kwargs)
+        logger.info(
+            f"Running batch of {len(prompts)} prompts on agent '{agent_name}' (max concurrency {max_concurrency})."
+        )
+        return await asyncio.gather(
+            *(run_one(p) for p in prompts), return_exceptions=return_exceptions
+        )
+
+    async def iter_batch_async(
+        self,
+        agent_name: str,
+        prompts: List[Union[str, Message]],
+        max_concurrency: int = 10,
+        **kwargs: Any,
+    ) -> AsyncGenerator[Tuple[int, Union[Message, BaseException]], None]:
+        """
+        Like run_batch_async, but yields (prompt index, result) as each prompt finishes, so
+        callers can process (e.g. save) fast results while slow ones are still running.
+        Failures are yielded as the exception. Leaving the loop early cancels the rest.
+        """
+        run_one = self._batch_runner(agent_name, max_concurrency, kwargs)
+
+        async def run_indexed(
+            index: int, prompt: Union[str, Message]
+        ) -> Tuple[int, Union[Message, BaseException]]:
+            try:
+                return index, await run_one(prompt)
+            except Exception as e:
+                return index, e
+
+        logger.info(
+            f"Streaming batch of {len(prompts)} prompts on agent '{agent_name}' (max concurrency {max_concurrency})."
+        )
+        tasks = [asyncio.create_task(run_indexed(i, p)) for i, p in enumerate(prompts)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def _batch_runner(
+        self, agent_name: str, max_concurrency: int, kwargs: Dict[str, Any]
+    ) -> Callable[[Union[str, Message]], Coroutine[Any, Any, Message]]:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run_one(prompt: Union[str, Message]) -> Message:
+            async with semaphore:
+                self.isolate_agents()
+                return await self.call_agent(agent_name, prompt, **kwargs)
+
+        return run_one
+
+    def isolate_agents(self) -> None:
+        """
+        Gives the current task its own agent instances (and so its own memory) for this
+        context's call_agent and call_agent_stream, as run_batch_async does per prompt.
+        Call it again in the same task for another fresh set.
+        """
+        _batch_engine.set(
+            (self, Engine(self._app, self))
+        )  # Task-local: each task has its own context copy
+
     async def call_agent_stream(
         self, agent_name: str, input_message: Union[str, Message], **kwargs: Any
     ) -> AsyncGenerator[MessageChunk, None]:
         """
         Stream response from an agent. Yields MessageChunk objects as they arrive.
-        
+
         Args:
             agent_name: Name of the agent to call
-            input_message: User input as string or Message object  
+            input_message: User input as string or Message object
             **kwargs: Additional parameters passed to agent
-            
+
         Yields:
             MessageChunk: Individual chunks of the streaming response
         """
-        async for chunk in self.engine.call_agent_stream(agent_name, input_message, **kwargs):
+        batch_item = _batch_engine.get()
+        engine = batch_item[1] if batch_item and batch_item[0] is self else self.engine
+        async for chunk in engine.call_agent_stream(
+            agent_name, input_message, **self._expand_session(kwargs)
+        ):
             yield chunk
 
-    async def interactive_chat(self, default_agent_name: Optional[str] = None) -> None:
+    async def stream_agent(
+        self, agent_name: str, input_message: Union[str, Message], **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        """
+        Stream an agent's response as text deltas, so consumers can start on the first
+        tokens instead of waiting for the full Message. Chunks without text (e.g. tool
+        call deltas) are skipped.
+        """
+        async for chunk in self.call_agent_stream(agent_name, input_message, **kwargs):
+            if chunk.content:
+                yield chunk.content
+
+    async def interactive_chat(
+        self, default_agent_name: Optional[str] = None, stream: bool = True
+    ) -> None:
         print("\n--- TFrameX Interactive Agent Chat (with MCP) ---")
 
         agent_to_chat_with = default_agent_name
@@ -324,21 +637,44 @@ class TFrameXRuntimeContext:
                 return
             print("Available agents:")
             agent_names_list = list(self._app._agents.keys())
-            for i, name in enumerate(agent_names_list): print(f"  {i + 1}. {name}")
+            for i, name in enumerate(agent_names_list):
+                print(f"  {i + 1}. {name}")
             while True:
                 try:
-                    choice = await asyncio.to_thread(input, "Select an agent (number or name): ")
-                    if choice.isdigit() and 0 <= int(choice) - 1 < len(agent_names_list):
+                    choice = await asyncio.to_thread(
+                        input, "Select an agent (number or name): "
+                    )
+                    if choice.isdigit() and 0 <= int(choice) - 1 < len(
+                        agent_names_list
+                    ):
                         agent_to_chat_with = agent_names_list[int(choice) - 1]
                         break
                     elif choice in agent_names_list:
                         agent_to_chat_with = choice
                         break
-                    else: print("Invalid selection.")
-                except ValueError: print("Invalid input.")
-                except KeyboardInterrupt: print("\nExiting."); return
-        
-        if not agent_to_chat_with: print("No agent selected. Exiting."); return
+                    else:
+                        print("Invalid selection.")
+                except ValueError:
+                    print("Invalid input.")
+                except KeyboardInterrupt:
+                    print("\nExiting.")
+                    return
+
+        if not agent_to_chat_with:
+            print("No agent selected. Exiting.")
+            return
+
+        # Only LLM agents can stream; other agent types fall back to a single awaited response
+        agent_class_ref = (
+            self._app._agents.get(agent_to_chat_with, {})
+            .get("config", {})
+            .get("agent_class_ref")
+        )
+        stream = (
+            stream
+            and inspect.isclass(agent_class_ref)
+            and issubclass(agent_class_ref, LLMAgent)
+        )
 
         print(f"\nChatting with Agent: '{agent_to_chat_with}'. Type 'exit' or 'quit'.")
         # For a persistent chat, you'd use the agent's memory.
@@ -346,15 +682,38 @@ class TFrameXRuntimeContext:
         while True:
             try:
                 user_input_str = await asyncio.to_thread(input, "\nYou: ")
-                if user_input_str.lower() in ["exit", "quit"]: break
-                if not user_input_str.strip(): continue
-                
+                if user_input_str.lower() in ["exit", "quit"]:
+                    break
+                if not user_input_str.strip():
+                    continue
+
+                if stream:
+                    # Print tokens as they arrive instead of waiting for the full response
+                    print("\nAssistant: ", end="", flush=True)
+                    async for chunk in self.call_agent_stream(
+                        agent_to_chat_with, Message(role="user", content=user_input_str)
+                    ):
+                        if chunk.content:
+                            sys.stdout.write(chunk.content)
+                            sys.stdout.flush()
+                    print()
+                    continue
+
                 print("Assistant: Thinking...")
-                response_message = await self.call_agent(agent_to_chat_with, Message(role="user", content=user_input_str))
-                
+                response_message = await self.call_agent(
+                    agent_to_chat_with, Message(role="user", content=user_input_str)
+                )
+
                 print(f"\nAssistant ({response_message.role}):")
-                if response_message.content: print(f"  Content: {response_message.content}")
-                if response_message.tool_calls: print(f"  Final Tool Calls (should be processed by agent): {response_message.tool_calls}")
-            except KeyboardInterrupt: break
-            except Exception as e: print(f"Error: {e}"); logger.error("Chat Error", exc_info=True)
-        print(f"--- Ended chat with Agent: '{agent_to_chat_with}' ---")
\ No newline at end of file
+                if response_message.content:
+                    print(f"  Content: {response_message.content}")
+                if response_message.tool_calls:
+                    print(
+                        f"  Final Tool Calls (should be processed by agent): {response_message.tool_calls}"
+                    )
+            except KeyboardInterrupt:
+                break
+            except Exception as e:
+                print(f"Error: {e}")
+                logger.error("Chat Error", exc_info=True)
+        print(f"--- Ended chat with Agent: '{agent_to_chat_with}' ---")
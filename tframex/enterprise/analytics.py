@@ -10,13 +10,14 @@ import json
 import logging
 from collections import defaultdict
 from dataclasses import dataclass, field
-from datetime import datetime, timezone, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from uuid import uuid4
 
+from .metrics.manager import MetricsManager
 from .models import User
+from .security.audit import AuditLogger
 from .storage.base import BaseStorage
-from .metrics.manager import MetricsManager
 from .tracing import WorkflowTracer
 
 logger = logging.getLogger(__name__)
@@ -25,6 +26,7 @@ logger = logging.getLogger(__name__)
 @dataclass
 class AnalyticsSnapshot:
     """Snapshot of analytics data at a specific point in time."""
+
     timestamp: datetime
     total_requests: int
     success_rate: float
@@ -35,7 +37,7 @@ class AnalyticsSnapshot:
     cost_data: Dict[str, Any] = field(default_factory=dict)
     agent_performance: Dict[str, Any] = field(default_factory=dict)
     resource_utilization: Dict[str, Any] = field(default_factory=dict)
-    
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -48,13 +50,14 @@ class AnalyticsSnapshot:
             "throughput_per_minute": self.throughput_per_minute,
             "cost_data": self.cost_data,
             "agent_performance": self.agent_performance,
-            "resource_utilization": self.resource_utilization
+            "resource_utilization": self.resource_utilization,
         }
 
 
 @dataclass
 class AgentAnalytics:
     """Analytics data for a specific agent."""
+
     agent_name: str
     total_calls: int
     success_calls: int
@@ -63,17 +66,21 @@ class AgentAnalytics:
     total_tokens: int
     total_cost_usd: float
     last_called: Optional[datetime] = None
-    
+
     @property
     def success_rate(self) -> float:
         """Calculate success rate percentage."""
-        return (self.success_calls / self.total_calls * 100) if self.total_calls > 0 else 0
-    
+        return (
+            (self.success_calls / self.total_calls * 100) if self.total_calls > 0 else 0
+        )
+
     @property
     def failure_rate(self) -> float:
         """Calculate failure rate percentage."""
-        return (self.failed_calls / self.total_calls * 100) if self.total_calls > 0 else 0
-    
+        return (
+            (self.failed_calls / self.total_calls * 100) if self.total_calls > 0 else 0
+        )
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
         return {
@@ -86,14 +93,127 @@ class AgentAnalytics:
             "avg_duration_ms": self.avg_duration_ms,
             "total_tokens": self.total_tokens,
             "total_cost_usd": self.total_cost_usd,
-            "last_called": self.last_called.isoformat() if self.last_called else None
+            "last_called": self.last_called.isoformat() if self.last_called else None,
         }
 
 
+def _parse_timestamp(value: Any) -> datetime:
+    """Parse an audit timestamp as an aware UTC datetime (audit events store naive UTC)."""
+    timestamp = value if isinstance(value, datetime) else datetime.fromisoformat(value)
+    return timestamp if timestamp.tzinfo else timestamp.replace(tzinfo=timezone.utc)
+
+
+@dataclass
+class AgentRollup:
+    """Pre-aggregated activity of one agent."""
+
+    calls: int = 0
+    successes: int = 0
+    duration_sum: float = 0.0
+    durations: List[float] = field(default_factory=list)
+    tokens: int = 0
+    cost_usd: float = 0.0
+    last_called: Optional[datetime] = None
+
+    @property
+    def failures(self) -> int:
+        """Number of calls that did not succeed."""
+        return self.calls - self.successes
+
+    def merge(self, other: "AgentRollup") -> None:
+        """Fold another rollup into this one."""
+        self.calls += other.calls
+        self.successes += other.successes
+        self.duration_sum += other.duration_sum
+        self.durations.extend(other.durations)
+        self.tokens += other.tokens
+        self.cost_usd += other.cost_usd
+        if other.last_called and (
+            not self.last_called or other.last_called > self.last_called
+        ):
+            self.last_called = other.last_called
+
+
+@dataclass
+class MinuteRollup:
+    """
+    Pre-aggregated audit activity. The dashboard keeps one per minute, updated as
+    audit batches are flushed, so analytics queries merge a few hundred buckets
+    instead of re-reading and re-scanning every stored audit event.
+    """
+
+    requests: int = 0
+    successes: int = 0
+    duration_sum: float = 0.0
+    duration_count: int = 0
+    tokens: int = 0
+    agent_calls: int = 0
+    users: Set[str] = field(default_factory=set)
+    agents: Dict[str, AgentRollup] = field(default_factory=dict)
+
+    def add(self, log: Dict[str, Any]) -> None:
+        """Account for one audit event dictionary."""
+        details = log.get("details") or {}
+        success = log.get("outcome") == "success"
+
+        self.requests += 1
+        self.successes += success
+        if "duration_ms" in details:
+            self.duration_sum += details["duration_ms"]
+            self.duration_count += 1
+        if "tokens_used" in details:
+            self.tokens += details["tokens_used"]
+        if log.get("user_id"):
+            self.users.add(log["user_id"])
+
+        if log.get("resource") == "agent":
+            self.agent_calls += 1
+            agent_name = details.get("agent_name", "unknown")
+            agent = self.agents.get(agent_name)
+            if agent is None:
+                agent = self.agents[agent_name] = AgentRollup()
+            agent.calls += 1
+            agent.successes += success
+            if "duration_ms" in details:
+                agent.duration_sum += details["duration_ms"]
+                agent.durations.append(details["duration_ms"])
+            if "tokens_used" in details:
+                agent.tokens += details["tokens_used"]
+            if "cost_usd" in details:
+                agent.cost_usd += details["cost_usd"]
+            if log.get("timestamp"):
+                called = _parse_timestamp(log["timestamp"])
+                if not agent.last_called or called > agent.last_called:
+                    agent.last_called = called
+
+    def merge(self, other: "MinuteRollup") -> None:
+        """Fold another rollup into this one."""
+        self.requests += other.requests
+        self.successes += other.successes
+        self.duration_sum += other.duration_sum
+        self.duration_count += other.duration_count
+        self.tokens += other.tokens
+        self.agent_calls += other.agent_calls
+        self.users |= other.users
+        for agent_name, agent in other.agents.items():
+            total = self.agents.get(agent_name)
+            if total is None:
+                total = self.agents[agent_name] = AgentRollup()
+            total.merge(agent)
+
+    @classmethod
+    def combine(cls, rollups: Iterable["MinuteRollup"]) -> "MinuteRollup":
+        """Merge several rollups into a new one."""
+        total = cls()
+        for rollup in rollups:
+            total.merge(rollup)
+        return total
+
+
 class AnalyticsDashboard:
     """
     Enterprise analytics dashboard providing real-time insights and monitoring.
-    
+
     Features:
     - Real-time performance monitoring
     - Agent performance analytics
@@ -102,162 +222,248 @@ class AnalyticsDashboard:
     - Alerting and anomaly detection
     - Historical trend analysis
     """
-    
-    def __init__(self, storage: BaseStorage, 
-                 metrics_manager: Optional[MetricsManager] = None,
-                 workflow_tracer: Optional[WorkflowTracer] = None):
+
+    def __init__(
+        self,
+        storage: BaseStorage,
+        metrics_manager: Optional[MetricsManager] = None,
+        workflow_tracer: Optional[WorkflowTracer] = None,
+        audit_logger: Optional[AuditLogger] = None,
+    ):
         """
         Initialize analytics dashboard.
-        
+
         Args:
             storage: Storage backend for analytics data
             metrics_manager: Metrics manager for real-time metrics
             workflow_tracer: Workflow tracer for execution analytics
+            audit_logger: Audit logger whose flushed batches feed the per-minute
+                rollups; without one, every query scans stored audit logs
         """
         self.storage = storage
         self.metrics_manager = metrics_manager
         self.workflow_tracer = workflow_tracer
-        
+        self.audit_logger = audit_logger
+
         # In-memory analytics cache
         self._analytics_cache: Dict[str, Any] = {}
         self._agent_analytics: Dict[str, AgentAnalytics] = {}
         self._snapshots: List[AnalyticsSnapshot] = []
-        
+
         # Configuration
         self.snapshot_interval_minutes = 5
         self.max_snapshots = 288  # 24 hours of 5-minute snapshots
         self.cache_ttl_seconds = 30
-        
+        self.rollup_retention_hours = 24
+
+        # Per-minute audit rollups (minute start -> rollup), live while attached to the audit logger
+        self._rollups: Dict[datetime, MinuteRollup] = {}
+        self._rollups_cover_since: Optional[datetime] = (
+            None  # None until the rollups are live
+        )
+
         # Background tasks
         self._background_tasks: List[asyncio.Task] = []
         self._running = False
-        
+
         logger.info("Analytics dashboard initialized")
-    
+
     async def start(self) -> None:
         """Start the analytics dashboard background services."""
         if self._running:
             return
-        
+
         self._running = True
-        
+
+        if self.audit_logger:
+            await self._start_rollups()
+
         # Start background data collection
         snapshot_task = asyncio.create_task(self._snapshot_collector())
         cache_task = asyncio.create_task(self._cache_updater())
-        
+
         self._background_tasks = [snapshot_task, cache_task]
-        
+
         logger.info("Analytics dashboard services started")
-    
+
     async def stop(self) -> None:
         """Stop the analytics dashboard background services."""
         self._running = False
-        
+
         # Cancel background tasks
         for task in self._background_tasks:
             task.cancel()
-        
+
         # Wait for tasks to complete
         if self._background_tasks:
             await asyncio.gather(*self._background_tasks, return_exceptions=True)
-        
+
         self._background_tasks.clear()
-        
+
+        if self.audit_logger:
+            self.audit_logger.remove_flush_listener(self.record_events)
+        self._rollups_cover_since = None
+
         logger.info("Analytics dashboard services stopped")
-    
+
+    async def _start_rollups(self) -> None:
+        """Seed the rollups from stored audit logs once, then keep them current from audit flushes."""
+        # Batches flushed while the seed query runs are held back and de-duplicated against it
+        held_back: List[Dict[str, Any]] = []
+        self.audit_logger.add_flush_listener(held_back.extend)
+        try:
+            since = datetime.now(timezone.utc) - timedelta(
+                hours=self.rollup_retention_hours
+            )
+            stored = await self.storage.select(
+                "audit_logs",
+                filters={"timestamp": {"$gte": since.isoformat()}},
+                limit=10000,
+            )
+        finally:
+            self.audit_logger.remove_flush_listener(held_back.extend)
+
+        stored_ids = {log.get("id") for log in stored}
+        self._rollups.clear()
+        self.record_events(stored)
+        self.record_events(
+            [log for log in held_back if log.get("id") not in stored_ids]
+        )
+
+        self.audit_logger.add_flush_listener(self.record_events)
+        self._rollups_cover_since = since
+        logger.debug(f"Analytics rollups seeded from {len(stored)} audit events")
+
+    def record_events(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Add audit event dictionaries to the per-minute rollups.
+
+        Args:
+            events: Audit events as written to storage
+        """
+        for log in events:
+            minute = _parse_timestamp(log["timestamp"]).replace(second=0, microsecond=0)
+            rollup = self._rollups.get(minute)
+            if rollup is None:
+                rollup = self._rollups[minute] = MinuteRollup()
+            rollup.add(log)
+
+        cutoff = datetime.now(timezone.utc) - timedelta(
+            hours=self.rollup_retention_hours
+        )
+        for minute in [minute for minute in self._rollups if minute < cutoff]:
+            del self._rollups[minute]
+        if self._rollups_cover_since:
+            self._rollups_cover_since = max(self._rollups_cover_since, cutoff)
+
+    async def _aggregate_since(
+        self, since: datetime, filters: Optional[Dict[str, Any]] = None
+    ) -> MinuteRollup:
+        """
+        Aggregate audit activity since a point in time (to the minute).
+
+        Served from the live rollups when they cover the window; otherwise the
+        matching audit logs are read from storage and rolled up in one pass.
+        """
+        if self._rollups_cover_since and since >= self._rollups_cover_since:
+            start = since.replace(second=0, microsecond=0)
+            return MinuteRollup.combine(
+                rollup for minute, rollup in self._rollups.items() if minute >= start
+            )
+
+        audit_logs = await self.storage.select(
+            "audit_logs",
+            filters={**(filters or {}), "timestamp": {"$gte": since.isoformat()}},
+            limit=10000,
+        )
+        total = MinuteRollup()
+        for log in audit_logs:
+            total.add(log)
+        return total
+
     async def _snapshot_collector(self) -> None:
         """Background task to collect analytics snapshots."""
         while self._running:
             try:
                 snapshot = await self._create_analytics_snapshot()
-                
+
                 # Add to in-memory snapshots
                 self._snapshots.append(snapshot)
-                
+
                 # Keep only recent snapshots
                 if len(self._snapshots) > self.max_snapshots:
-                    self._snapshots = self._snapshots[-self.max_snapshots:]
-                
+                    self._snapshots = self._snapshots[-self.max_snapshots :]
+
                 # Persist snapshot
                 await self.storage.insert("analytics_snapshots", snapshot.to_dict())
-                
+
                 logger.debug(f"Analytics snapshot collected: {snapshot.timestamp}")
-                
+
             except Exception as e:
                 logger.error(f"Error collecting analytics snapshot: {e}")
-            
+
             # Wait for next interval
             await asyncio.sleep(self.snapshot_interval_minutes * 60)
-    
+
     async def _cache_updater(self) -> None:
         """Background task to update analytics cache."""
         while self._running:
             try:
                 # Update agent analytics
                 await self._update_agent_analytics()
-                
+
                 # Update general analytics cache
                 await self._update_analytics_cache()
-                
+
                 logger.debug("Analytics cache updated")
-                
+
             except Exception as e:
                 logger.error(f"Error updating analytics cache: {e}")
-            
+
             # Wait for next update
             await asyncio.sleep(self.cache_ttl_seconds)
-    
+
     async def _create_analytics_snapshot(self) -> AnalyticsSnapshot:
         """Create a new analytics snapshot."""
         now = datetime.now(timezone.utc)
         one_hour_ago = now - timedelta(hours=1)
-        
+
         try:
-            # Get recent audit logs for metrics
-            audit_logs = await self.storage.select(
-                "audit_logs",
-                filters={"timestamp": {"$gte": one_hour_ago.isoformat()}},
-                limit=10000
-            )
-            
+            activity = await self._aggregate_since(one_hour_ago)
+
             # Calculate metrics
-            total_requests = len(audit_logs)
-            successful_requests = len([log for log in audit_logs if log.get("outcome") == "success"])
-            
-            success_rate = (successful_requests / total_requests * 100) if total_requests > 0 else 0
+            total_requests = activity.requests
+            success_rate = (
+                (activity.successes / total_requests * 100) if total_requests > 0 else 0
+            )
             error_rate = 100 - success_rate
-            
+
             # Calculate response times (if available)
-            response_times = []
-            for log in audit_logs:
-                if "duration_ms" in log.get("details", {}):
-                    response_times.append(log["details"]["duration_ms"])
-            
-            avg_response_time = sum(response_times) / len(response_times) if response_times else 0
-            
+            avg_response_time = (
+                activity.duration_sum / activity.duration_count
+                if activity.duration_count
+                else 0
+            )
+
             # Calculate throughput
             throughput_per_minute = total_requests / 60 if total_requests > 0 else 0
-            
+
             # Get active users
-            unique_users = set()
-            for log in audit_logs:
-                if log.get("user_id"):
-                    unique_users.add(log["user_id"])
-            active_users = len(unique_users)
-            
+            active_users = len(activity.users)
+
             # Agent performance data
-            agent_performance = await self._calculate_agent_performance(audit_logs)
-            
+            agent_performance = self._calculate_agent_performance(activity)
+
             # Cost data (placeholder - would integrate with actual cost tracking)
-            cost_data = await self._calculate_cost_data(audit_logs)
-            
+            cost_data = self._calculate_cost_data(activity)
+
             # Resource utilization (placeholder)
             resource_utilization = {
                 "cpu_percent": 0,  # Would integrate with system metrics
                 "memory_percent": 0,
-                "storage_used_gb": 0
+                "storage_used_gb": 0,
             }
-            
+
             return AnalyticsSnapshot(
                 timestamp=now,
                 total_requests=total_requests,
@@ -268,9 +474,9 @@ class AnalyticsDashboard:
                 throughput_per_minute=throughput_per_minute,
                 cost_data=cost_data,
                 agent_performance=agent_performance,
-                resource_utilization=resource_utilization
+                resource_utilization=resource_utilization,
             )
-            
+
         except Exception as e:
             logger.error(f"Error creating analytics snapshot: {e}")
             # Return empty snapshot
@@ -281,275 +487,236 @@ class AnalyticsDashboard:
                 avg_response_time_ms=0,
                 active_users=0,
                 error_rate=0,
-                throughput_per_minute=0
+                throughput_per_minute=0,
             )
-    
-    async def _calculate_agent_performance(self, audit_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate agent performance metrics from audit logs."""
-        agent_stats = defaultdict(lambda: {
-            "calls": 0, "successes": 0, "failures": 0, 
-            "total_duration": 0, "response_times": []
-        })
-        
-        for log in audit_logs:
-            if log.get("resource") == "agent":
-                agent_name = log.get("details", {}).get("agent_name", "unknown")
-                stats = agent_stats[agent_name]
-                
-                stats["calls"] += 1
-                if log.get("outcome") == "success":
-                    stats["successes"] += 1
-                else:
-                    stats["failures"] += 1
-                
-                if "duration_ms" in log.get("details", {}):
-                    duration = log["details"]["duration_ms"]
-                    stats["total_duration"] += duration
-                    stats["response_times"].append(duration)
-        
-        # Convert to final format
+
+    def _calculate_agent_performance(self, activity: MinuteRollup) -> Dict[str, Any]:
+        """Calculate agent performance metrics from aggregated audit activity."""
         performance = {}
-        for agent_name, stats in agent_stats.items():
-            avg_duration = stats["total_duration"] / stats["calls"] if stats["calls"] > 0 else 0
-            success_rate = stats["successes"] / stats["calls"] * 100 if stats["calls"] > 0 else 0
-            
+        for agent_name, stats in activity.agents.items():
+            avg_duration = stats.duration_sum / stats.calls if stats.calls > 0 else 0
+            success_rate = stats.successes / stats.calls * 100 if stats.calls > 0 else 0
+
             performance[agent_name] = {
-                "total_calls": stats["calls"],
+                "total_calls": stats.calls,
                 "success_rate": success_rate,
                 "avg_duration_ms": avg_duration,
-                "p95_duration_ms": self._calculate_percentile(stats["response_times"], 95) if stats["response_times"] else 0
+                "p95_duration_ms": (
+                    self._calculate_percentile(stats.durations, 95)
+                    if stats.durations
+                    else 0
+                ),
             }
-        
+
         return performance
-    
-    async def _calculate_cost_data(self, audit_logs: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Calculate cost data from audit logs."""
+
+    def _calculate_cost_data(self, activity: MinuteRollup) -> Dict[str, Any]:
+        """Calculate cost data from aggregated audit activity."""
         # Placeholder cost calculation
         # In real implementation, would integrate with LLM provider billing APIs
-        
-        total_tokens = 0
-        total_api_calls = 0
-        
-        for log in audit_logs:
-            details = log.get("details", {})
-            if "tokens_used" in details:
-                total_tokens += details["tokens_used"]
-            if log.get("resource") == "agent":
-                total_api_calls += 1
-        
+
+        total_tokens = activity.tokens
+        total_api_calls = activity.agent_calls
+
         # Estimated costs (placeholder rates)
         estimated_token_cost = total_tokens * 0.00002  # $0.02 per 1K tokens
-        estimated_api_cost = total_api_calls * 0.001   # $0.001 per API call
+        estimated_api_cost = total_api_calls * 0.001  # $0.001 per API call
         total_estimated_cost = estimated_token_cost + estimated_api_cost
-        
+
         return {
             "total_tokens": total_tokens,
             "total_api_calls": total_api_calls,
             "estimated_cost_usd": total_estimated_cost,
             "cost_breakdown": {
                 "tokens": estimated_token_cost,
-                "api_calls": estimated_api_cost
-            }
+                "api_calls": estimated_api_cost,
+            },
         }
-    
+
     def _calculate_percentile(self, values: List[float], percentile: int) -> float:
         """Calculate percentile of a list of values."""
         if not values:
             return 0
-        
+
         sorted_values = sorted(values)
         index = int(len(sorted_values) * percentile / 100)
         return sorted_values[min(index, len(sorted_values) - 1)]
-    
+
     async def _update_agent_analytics(self) -> None:
         """Update agent analytics from recent data."""
         try:
-            # Get recent audit logs for agents
             one_day_ago = datetime.now(timezone.utc) - timedelta(days=1)
-            audit_logs = await self.storage.select(
-                "audit_logs",
-                filters={
-                    "resource": "agent",
-                    "timestamp": {"$gte": one_day_ago.isoformat()}
-                },
-                limit=10000
+            activity = await self._aggregate_since(
+                one_day_ago, filters={"resource": "agent"}
             )
-            
-            # Reset agent analytics
-            self._agent_analytics.clear()
-            
-            # Process audit logs
-            for log in audit_logs:
-                agent_name = log.get("details", {}).get("agent_name", "unknown")
-                
-                if agent_name not in self._agent_analytics:
-                    self._agent_analytics[agent_name] = AgentAnalytics(
-                        agent_name=agent_name,
-                        total_calls=0,
-                        success_calls=0,
-                        failed_calls=0,
-                        avg_duration_ms=0,
-                        total_tokens=0,
-                        total_cost_usd=0
-                    )
-                
-                analytics = self._agent_analytics[agent_name]
-                analytics.total_calls += 1
-                
-                if log.get("outcome") == "success":
-                    analytics.success_calls += 1
-                else:
-                    analytics.failed_calls += 1
-                
-                # Update last called time
-                log_time = datetime.fromisoformat(log["timestamp"])
-                if not analytics.last_called or log_time > analytics.last_called:
-                    analytics.last_called = log_time
-                
-                # Update tokens and cost if available
-                details = log.get("details", {})
-                if "tokens_used" in details:
-                    analytics.total_tokens += details["tokens_used"]
-                if "cost_usd" in details:
-                    analytics.total_cost_usd += details["cost_usd"]
-            
-            # Calculate average durations
-            for agent_name, analytics in self._agent_analytics.items():
-                # Get duration data from audit logs
-                durations = []
-                for log in audit_logs:
-                    if (log.get("details", {}).get("agent_name") == agent_name and
-                        "duration_ms" in log.get("details", {})):
-                        durations.append(log["details"]["duration_ms"])
-                
-                if durations:
-                    analytics.avg_duration_ms = sum(durations) / len(durations)
-            
+
+            self._agent_analytics = {
+                agent_name: AgentAnalytics(
+                    agent_name=agent_name,
+                    total_calls=stats.calls,
+                    success_calls=stats.successes,
+                    failed_calls=stats.failures,
+                    avg_duration_ms=(
+                        stats.duration_sum / len(stats.durations)
+                        if stats.durations
+                        else 0
+                    ),
+                    total_tokens=stats.tokens,
+                    total_cost_usd=stats.cost_usd,
+                    last_called=stats.last_called,
+                )
+                for agent_name, stats in activity.agents.items()
+            }
+
         except Exception as e:
             logger.error(f"Error updating agent analytics: {e}")
-    
+
     async def _update_analytics_cache(self) -> None:
         """Update general analytics cache."""
         try:
             # Create current snapshot without persisting
             current_snapshot = await self._create_analytics_snapshot()
-            
+
             # Update cache
             self._analytics_cache["current"] = current_snapshot.to_dict()
-            self._analytics_cache["last_updated"] = datetime.now(timezone.utc).isoformat()
-            
+            self._analytics_cache["last_updated"] = datetime.now(
+                timezone.utc
+            ).isoformat()
+
         except Exception as e:
             logger.error(f"Error updating analytics cache: {e}")
-    
+
     async def get_real_time_analytics(self) -> Dict[str, Any]:
         """
         Get real-time analytics data.
-        
+
         Returns:
             Real-time analytics including performance metrics, agent data, etc.
         """
         try:
             # Return cached data if available and recent
             if "current" in self._analytics_cache:
-                last_updated = datetime.fromisoformat(self._analytics_cache["last_updated"])
-                if (datetime.now(timezone.utc) - last_updated).seconds < self.cache_ttl_seconds:
+                last_updated = datetime.fromisoformat(
+                    self._analytics_cache["last_updated"]
+                )
+                if (
+                    datetime.now(timezone.utc) - last_updated
+                ).seconds < self.cache_ttl_seconds:
                     return {
                         "real_time": self._analytics_cache["current"],
-                        "agents": {name: analytics.to_dict() for name, analytics in self._agent_analytics.items()},
-                        "cache_hit": True
+                        "agents": {
+                            name: analytics.to_dict()
+                            for name, analytics in self._agent_analytics.items()
+                        },
+                        "cache_hit": True,
                     }
-            
+
             # Generate fresh data
             current_snapshot = await self._create_analytics_snapshot()
-            
+
             return {
                 "real_time": current_snapshot.to_dict(),
-                "agents": {name: analytics.to_dict() for name, analytics in self._agent_analytics.items()},
-                "cache_hit": False
+                "agents": {
+                    name: analytics.to_dict()
+                    for name, analytics in self._agent_analytics.items()
+                },
+                "cache_hit": False,
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting real-time analytics: {e}")
             return {"error": str(e)}
-    
-    async def get_historical_analytics(self, 
-                                     hours: int = 24,
-                                     granularity: str = "hourly") -> Dict[str, Any]:
+
+    async def get_historical_analytics(
+        self, hours: int = 24, granularity: str = "hourly"
+    ) -> Dict[str, Any]:
         """
         Get historical analytics data.
-        
+
         Args:
             hours: Number of hours of history to include
             granularity: Data granularity (hourly, daily)
-            
+
         Returns:
             Historical analytics data
         """
         try:
             since_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-            
+
             # Get snapshots from storage
             snapshots = await self.storage.select(
                 "analytics_snapshots",
                 filters={"timestamp": {"$gte": since_time.isoformat()}},
                 order_by="timestamp",
-                limit=1000
+                limit=1000,
             )
-            
+
             # Aggregate by granularity
             if granularity == "hourly":
                 aggregated = self._aggregate_snapshots_hourly(snapshots)
             else:
                 aggregated = snapshots  # Return raw data for now
-            
+
             return {
                 "time_range": {
                     "start": since_time.isoformat(),
                     "end": datetime.now(timezone.utc).isoformat(),
-                    "hours": hours
+                    "hours": hours,
                 },
                 "granularity": granularity,
                 "data_points": len(aggregated),
-                "snapshots": aggregated
+                "snapshots": aggregated,
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting historical analytics: {e}")
             return {"error": str(e)}
-    
-    def _aggregate_snapshots_hourly(self, snapshots: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+
+    def _aggregate_snapshots_hourly(
+        self, snapshots: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
         """Aggregate snapshots by hour."""
         hourly_buckets = defaultdict(list)
-        
+
         for snapshot in snapshots:
             timestamp = datetime.fromisoformat(snapshot["timestamp"])
             hour_key = timestamp.replace(minute=0, second=0, microsecond=0).isoformat()
             hourly_buckets[hour_key].append(snapshot)
-        
+
         aggregated = []
         for hour_key, hour_snapshots in sorted(hourly_buckets.items()):
             # Calculate averages for the hour
             avg_snapshot = {
                 "timestamp": hour_key,
                 "total_requests": sum(s["total_requests"] for s in hour_snapshots),
-                "success_rate": sum(s["success_rate"] for s in hour_snapshots) / len(hour_snapshots),
-                "avg_response_time_ms": sum(s["avg_response_time_ms"] for s in hour_snapshots) / len(hour_snapshots),
+                "success_rate": sum(s["success_rate"] for s in hour_snapshots)
+                / len(hour_snapshots),
+                "avg_response_time_ms": sum(
+                    s["avg_response_time_ms"] for s in hour_snapshots
+                )
+                / len(hour_snapshots),
                 "active_users": max(s["active_users"] for s in hour_snapshots),
-                "error_rate": sum(s["error_rate"] for s in hour_snapshots) / len(hour_snapshots),
-                "throughput_per_minute": sum(s["throughput_per_minute"] for s in hour_snapshots) / len(hour_snapshots),
-                "data_points": len(hour_snapshots)
+                "error_rate": sum(s["error_rate"] for s in hour_snapshots)
+                / len(hour_snapshots),
+                "throughput_per_minute": sum(
+                    s["throughput_per_minute"] for s in hour_snapshots
+                )
+                / len(hour_snapshots),
+                "data_points": len(hour_snapshots),
             }
             aggregated.append(avg_snapshot)
-        
+
         return aggregated
-    
-    async def get_agent_analytics(self, agent_name: Optional[str] = None) -> Dict[str, Any]:
+
+    async def get_agent_analytics(
+        self, agent_name: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Get analytics for specific agent or all agents.
-        
+
         Args:
             agent_name: Specific agent name (or all if None)
-            
+
         Returns:
             Agent analytics data
         """
@@ -561,22 +728,24 @@ class AnalyticsDashboard:
                     return {"error": f"Agent '{agent_name}' not found"}
             else:
                 return {
-                    "agents": {name: analytics.to_dict() 
-                             for name, analytics in self._agent_analytics.items()},
-                    "total_agents": len(self._agent_analytics)
+                    "agents": {
+                        name: analytics.to_dict()
+                        for name, analytics in self._agent_analytics.items()
+                    },
+                    "total_agents": len(self._agent_analytics),
                 }
-                
+
         except Exception as e:
             logger.error(f"Error getting agent analytics: {e}")
             return {"error": str(e)}
-    
+
     async def get_cost_analytics(self, time_period: str = "24h") -> Dict[str, Any]:
         """
         Get cost analytics and optimization recommendations.
-        
+
         Args:
             time_period: Time period for analysis (24h, 7d, 30d)
-            
+
         Returns:
             Cost analytics with optimization recommendations
         """
@@ -590,72 +759,62 @@ class AnalyticsDashboard:
                 hours = 24 * 30
             else:
                 hours = 24
-            
+
             since_time = datetime.now(timezone.utc) - timedelta(hours=hours)
-            
-            # Get audit logs for cost analysis
-            audit_logs = await self.storage.select(
-                "audit_logs",
-                filters={"timestamp": {"$gte": since_time.isoformat()}},
-                limit=10000
-            )
-            
-            # Calculate costs by agent
-            agent_costs = defaultdict(lambda: {"tokens": 0, "calls": 0, "cost": 0})
-            total_cost = 0
-            
-            for log in audit_logs:
-                if log.get("resource") == "agent":
-                    agent_name = log.get("details", {}).get("agent_name", "unknown")
-                    details = log.get("details", {})
-                    
-                    agent_costs[agent_name]["calls"] += 1
-                    
-                    if "tokens_used" in details:
-                        tokens = details["tokens_used"]
-                        agent_costs[agent_name]["tokens"] += tokens
-                        
-                        # Estimate cost (placeholder rates)
-                        cost = tokens * 0.00002
-                        agent_costs[agent_name]["cost"] += cost
-                        total_cost += cost
-            
+
+            activity = await self._aggregate_since(since_time)
+
+            # Calculate costs by agent (placeholder rate per token)
+            agent_costs = {
+                agent_name: {
+                    "tokens": stats.tokens,
+                    "calls": stats.calls,
+                    "cost": stats.tokens * 0.00002,
+                }
+                for agent_name, stats in activity.agents.items()
+            }
+            total_cost = sum(costs["cost"] for costs in agent_costs.values())
+
             # Generate optimization recommendations
             recommendations = []
-            
+
             # Find high-cost, low-efficiency agents
             for agent_name, costs in agent_costs.items():
                 if costs["calls"] > 0:
                     cost_per_call = costs["cost"] / costs["calls"]
                     tokens_per_call = costs["tokens"] / costs["calls"]
-                    
+
                     if cost_per_call > 0.01:  # High cost per call
-                        recommendations.append({
-                            "type": "high_cost_agent",
-                            "agent": agent_name,
-                            "message": f"Agent '{agent_name}' has high cost per call (${cost_per_call:.4f})",
-                            "suggestion": "Consider optimizing prompts or using a cheaper model"
-                        })
-                    
+                        recommendations.append(
+                            {
+                                "type": "high_cost_agent",
+                                "agent": agent_name,
+                                "message": f"Agent '{agent_name}' has high cost per call (${cost_per_call:.4f})",
+                                "suggestion": "Consider optimizing prompts or using a cheaper model",
+                            }
+                        )
+
                     if tokens_per_call > 1000:  # High token usage
-                        recommendations.append({
-                            "type": "high_token_usage",
-                            "agent": agent_name,
-                            "message": f"Agent '{agent_name}' uses many tokens per call ({tokens_per_call:.0f})",
-                            "suggestion": "Consider reducing prompt length or output requirements"
-                        })
-            
+                        recommendations.append(
+                            {
+                                "type": "high_token_usage",
+                                "agent": agent_name,
+                                "message": f"Agent '{agent_name}' uses many tokens per call ({tokens_per_call:.0f})",
+                                "suggestion": "Consider reducing prompt length or output requirements",
+                            }
+                        )
+
             return {
                 "time_period": time_period,
                 "total_cost_usd": total_cost,
-                "agent_breakdown": dict(agent_costs),
+                "agent_breakdown": agent_costs,
                 "recommendations": recommendations,
                 "cost_trends": {
                     "daily_average": total_cost / (hours / 24),
-                    "projected_monthly": total_cost * (30 * 24 / hours)
-                }
+                    "projected_monthly": total_cost * (30 * 24 / hours),
+                },
             }
-            
+
         except Exception as e:
             logger.error(f"Error getting cost analytics: {e}")
-            return {"error": str(e)}
\ No newline at end of file
+            return {"error": str(e)}
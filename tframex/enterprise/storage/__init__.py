@@ -5,15 +5,29 @@ This package provides storage abstraction and implementations for
 enterprise data persistence including multiple backend support.
 """
 
-from .base import BaseStorage, StorageError, ConnectionError, QueryError
+from .base import BaseStorage, ConnectionError, QueryError, StorageError
 from .memory import InMemoryStorage
-from .sqlite import SQLiteStorage
-from .postgresql import PostgreSQLStorage
-from .s3 import S3Storage
 from .migrations import MigrationManager
+from .sqlite import SQLiteStorage
 
 __all__ = [
-    "BaseStorage", "StorageError", "ConnectionError", "QueryError",
-    "InMemoryStorage", "SQLiteStorage", "PostgreSQLStorage", "S3Storage",
-    "MigrationManager"
-]
\ No newline at end of file
+    "BaseStorage",
+    "StorageError",
+    "ConnectionError",
+    "QueryError",
+    "InMemoryStorage",
+    "SQLiteStorage",
+    "PostgreSQLStorage",
+    "S3Storage",
+    "MigrationManager",
+]
+
+
+def __getattr__(name):
+    # PostgreSQLStorage and S3Storage pull in asyncpg/aioboto3, so they are only
+    # imported when first accessed rather than on every enterprise import.
+    if name in ("PostgreSQLStorage", "S3Storage"):
+        from .factory import _load_backend
+
+        return _load_backend(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
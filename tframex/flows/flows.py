@@ -7,6 +7,7 @@ import yaml  # NEW IMPORT
 from ..models.primitives import Message
 from ..patterns.patterns import (
     BasePattern,
+    DAGPattern,
     DiscussionPattern,
     ParallelPattern,
     RouterPattern,
@@ -283,6 +284,14 @@ class Flow:
                     self._generate_yaml_data_recursive(t, app)
                     for t in step_or_task.tasks
                 ]
+            elif isinstance(step_or_task, DAGPattern):
+                pattern_data["nodes"] = {
+                    node: {
+                        **self._get_agent_details_for_yaml(agent_name, app),
+                        "depends_on": list(deps),
+                    }
+                    for node, (agent_name, deps, _) in step_or_task.nodes.items()
+                }
             elif isinstance(step_or_task, RouterPattern):
                 pattern_data["router_agent"] = self._get_agent_details_for_yaml(
                     step_or_task.router_agent_name, app
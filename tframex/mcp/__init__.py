@@ -3,14 +3,15 @@ import logging
 
 from .config import MCPConfigError, load_mcp_server_configs
 from .manager import MCPManager
-from .server_connector import MCPConnectedServer
 from .meta_tools import (
-    tframex_list_mcp_servers,
+    tframex_invalidate_mcp_cache,
+    tframex_list_mcp_prompts,
     tframex_list_mcp_resources,
+    tframex_list_mcp_servers,
     tframex_read_mcp_resource,
-    tframex_list_mcp_prompts,
-    tframex_use_mcp_prompt
+    tframex_use_mcp_prompt,
 )
+from .server_connector import MCPConnectedServer
 
 logger = logging.getLogger("tframex.mcp")
 
@@ -24,6 +25,7 @@ __all__ = [
     "tframex_read_mcp_resource",
     "tframex_list_mcp_prompts",
     "tframex_use_mcp_prompt",
+    "tframex_invalidate_mcp_cache",
 ]
 
-logger.debug("TFrameX MCP Integration package initialized.")
\ No newline at end of file
+logger.debug("TFrameX MCP Integration package initialized.")
@@ -1,10 +1,19 @@
 # tframex/mcp/meta_tools.py
+import functools
 import logging
-from typing import Dict, Any, Optional, List, Union, TYPE_CHECKING # Import TYPE_CHECKING
+from typing import (  # Import TYPE_CHECKING
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+from mcp.types import EmbeddedResource, ImageContent, TextContent
 
 # from tframex.app import TFrameXRuntimeContext # REMOVE THIS DIRECT IMPORT
-from .manager import MCPManager # To access the manager
-from mcp.types import TextContent, ImageContent, EmbeddedResource 
+from .manager import MCPManager  # To access the manager
 
 # Conditional import for type hinting to avoid circular import
 if TYPE_CHECKING:
@@ -15,29 +24,77 @@ logger = logging.getLogger("tframex.mcp.meta_tools")
 # These functions will be wrapped by @app.tool() in TFrameXApp setup.
 # They need access to the MCPManager, which can be passed via TFrameXRuntimeContext.
 
+
+def _cached_listing(kind: str):
+    """
+    Memoizes a listing meta-tool per server connection epoch. Listings only change when
+    a server (re)connects, disconnects or sends a list_changed notification, so repeated
+    introspection calls from the LLM are answered without re-rendering. Error replies
+    (e.g. an unknown server alias) are not cached, so the next call checks again.
+    """
+
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(rt_ctx: "TFrameXRuntimeContext", **kwargs):
+            manager: Optional[MCPManager] = getattr(rt_ctx, "mcp_manager", None)
+            if not manager:
+                return await func(rt_ctx, **kwargs)
+            server_alias = kwargs.get("server_alias")
+            key = manager.listing_cache_key(kind, server_alias)
+            cached = manager.get_cached_listing(key)
+            if cached is not None:
+                logger.debug(
+                    f"Serving cached MCP {kind} listing for {server_alias or 'all servers'}."
+                )
+                return cached
+            result = await func(rt_ctx, **kwargs)
+            if not (isinstance(result, str) and result.startswith("Error")):
+                manager.cache_listing(key, result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 # Use string literal for the type hint if TYPE_CHECKING is False at runtime
-async def tframex_list_mcp_servers(rt_ctx: 'TFrameXRuntimeContext') -> str:
+@_cached_listing("servers")
+async def tframex_list_mcp_servers(rt_ctx: "TFrameXRuntimeContext") -> str:
     """Lists all configured and initialized MCP servers."""
     # Ensure rt_ctx has mcp_manager (runtime check)
-    if not hasattr(rt_ctx, 'mcp_manager') or not rt_ctx.mcp_manager:
-        return "MCP integration is not initialized in the application's runtime context."
-    
-    manager: MCPManager = rt_ctx.mcp_manager # Type cast if needed, or rely on duck typing
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
+        return (
+            "MCP integration is not initialized in the application's runtime context."
+        )
+
+    manager: MCPManager = (
+        rt_ctx.mcp_manager
+    )  # Type cast if needed, or rely on duck typing
     output = "Connected MCP Servers:\n"
     if not manager.servers:
         return "No MCP servers are currently configured or connected."
-    
+
     for alias, server_obj in manager.servers.items():
-        status = "Initialized" if server_obj.is_initialized else "Failed/Not Initialized"
+        status = (
+            "Initialized" if server_obj.is_initialized else "Failed/Not Initialized"
+        )
         s_info = server_obj.server_info
-        name_version = f"{s_info.name} v{s_info.version}" if s_info and hasattr(s_info, 'name') and hasattr(s_info, 'version') else "N/A"
+        name_version = (
+            f"{s_info.name} v{s_info.version}"
+            if s_info and hasattr(s_info, "name") and hasattr(s_info, "version")
+            else "N/A"
+        )
         output += f"  - Alias: {alias} (Name: {name_version}, Status: {status})\n"
         if server_obj.is_initialized and server_obj.capabilities:
             caps = server_obj.capabilities
             output += f"    Capabilities: Tools={hasattr(caps, 'tools') and bool(caps.tools)}, Resources={hasattr(caps, 'resources') and bool(caps.resources)}, Prompts={hasattr(caps, 'prompts') and bool(caps.prompts)}\n"
     return output
 
-async def tframex_list_mcp_resources(rt_ctx: 'TFrameXRuntimeContext', server_alias: Optional[str] = None) -> Union[str, Dict[str, List[Dict[str, Any]]]]:
+
+@_cached_listing("resources")
+async def tframex_list_mcp_resources(
+    rt_ctx: "TFrameXRuntimeContext", server_alias: Optional[str] = None
+) -> Union[str, Dict[str, List[Dict[str, Any]]]]:
     """
     Lists available resources from a specific MCP server or all initialized MCP servers.
     Args:
@@ -46,13 +103,15 @@ async def tframex_list_mcp_resources(rt_ctx: 'TFrameXRuntimeContext', server_ali
     Returns:
         A string listing resources or a dictionary if server_alias is None.
     """
-    if not hasattr(rt_ctx, 'mcp_manager') or not rt_ctx.mcp_manager:
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
         return "MCP integration is not initialized."
     manager: MCPManager = rt_ctx.mcp_manager
     infos_by_server: Dict[str, List[Dict[str, Any]]] = {}
     servers_to_query = []
     if server_alias:
-        server = manager.get_server(server_alias) # get_server checks for initialization
+        server = manager.get_server(
+            server_alias
+        )  # get_server checks for initialization
         if server:
             servers_to_query.append(server)
         else:
@@ -65,26 +124,39 @@ async def tframex_list_mcp_resources(rt_ctx: 'TFrameXRuntimeContext', server_ali
 
     for server_obj in servers_to_query:
         # Ensure capabilities and resources attribute exist before accessing
-        if server_obj.capabilities and hasattr(server_obj.capabilities, 'resources') and server_obj.capabilities.resources and server_obj.resources:
+        if (
+            server_obj.capabilities
+            and hasattr(server_obj.capabilities, "resources")
+            and server_obj.capabilities.resources
+            and server_obj.resources
+        ):
             infos_by_server[server_obj.server_alias] = [
-                {"uri": str(r.uri), "name": r.name, "description": r.description, "mimeType": r.mimeType}
-                for r in server_obj.resources # server_obj.resources should be List[ActualMCPResource]
+                {
+                    "uri": str(r.uri),
+                    "name": r.name,
+                    "description": r.description,
+                    "mimeType": r.mimeType,
+                }
+                for r in server_obj.resources  # server_obj.resources should be List[ActualMCPResource]
             ]
         else:
-            infos_by_server[server_obj.server_alias] = [] 
+            infos_by_server[server_obj.server_alias] = []
 
-    if server_alias: 
+    if server_alias:
         res_list = infos_by_server.get(server_alias, [])
-        if not res_list: return f"No resources found or resource capability missing on server '{server_alias}'."
+        if not res_list:
+            return f"No resources found or resource capability missing on server '{server_alias}'."
         output = f"Resources from MCP server '{server_alias}':\n"
         for r_info in res_list:
             output += f"  - URI: {r_info['uri']}\n    Name: {r_info['name']}\n    Desc: {r_info['description']}\n    MIME: {r_info['mimeType']}\n"
         return output
-    else: 
+    else:
         return infos_by_server
 
 
-async def tframex_read_mcp_resource(rt_ctx: 'TFrameXRuntimeContext', server_alias: str, resource_uri: str) -> str:
+async def tframex_read_mcp_resource(
+    rt_ctx: "TFrameXRuntimeContext", server_alias: str, resource_uri: str
+) -> str:
     """
     Reads content from a specific resource on a specific MCP server.
     Args:
@@ -94,33 +166,51 @@ async def tframex_read_mcp_resource(rt_ctx: 'TFrameXRuntimeContext', server_alia
     Returns:
         The resource content as a string, or an error message.
     """
-    if not hasattr(rt_ctx, 'mcp_manager') or not rt_ctx.mcp_manager:
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
         return "MCP integration is not initialized."
     manager: MCPManager = rt_ctx.mcp_manager
     server = manager.get_server(server_alias)
     if not server:
         return f"Error: MCP Server '{server_alias}' not found or not initialized."
-    if not (server.capabilities and hasattr(server.capabilities, 'resources') and server.capabilities.resources):
+    if not (
+        server.capabilities
+        and hasattr(server.capabilities, "resources")
+        and server.capabilities.resources
+    ):
         return f"Error: Server '{server_alias}' does not support resources."
 
     try:
         content_result = await server.read_mcp_resource(resource_uri)
-        
-        if isinstance(content_result, str): return content_result
-        if isinstance(content_result, TextContent) and content_result.text is not None: return content_result.text
-        if isinstance(content_result, ImageContent): return f"[Image content from MCP resource '{resource_uri}', mime: {content_result.mimeType}]"
-        if isinstance(content_result, EmbeddedResource): return f"[Embedded resource from MCP resource '{resource_uri}', uri: {content_result.resource.uri}]"
-        
-        if hasattr(content_result, 'text') and content_result.text is not None: return content_result.text
-        
+
+        if isinstance(content_result, str):
+            return content_result
+        if isinstance(content_result, TextContent) and content_result.text is not None:
+            return content_result.text
+        if isinstance(content_result, ImageContent):
+            return f"[Image content from MCP resource '{resource_uri}', mime: {content_result.mimeType}]"
+        if isinstance(content_result, EmbeddedResource):
+            return f"[Embedded resource from MCP resource '{resource_uri}', uri: {content_result.resource.uri}]"
+
+        if hasattr(content_result, "text") and content_result.text is not None:
+            return content_result.text
+
         return f"[Non-textual or complex content received from resource '{resource_uri}'. Type: {type(content_result)}]"
     except Exception as e:
-        logger.error(f"Error reading MCP resource '{resource_uri}' from '{server_alias}': {e}", exc_info=True)
-        return f"Error reading resource '{resource_uri}' from '{server_alias}': {str(e)}"
+        logger.error(
+            f"Error reading MCP resource '{resource_uri}' from '{server_alias}': {e}",
+            exc_info=True,
+        )
+        return (
+            f"Error reading resource '{resource_uri}' from '{server_alias}': {str(e)}"
+        )
 
-async def tframex_list_mcp_prompts(rt_ctx: 'TFrameXRuntimeContext', server_alias: Optional[str] = None) -> Union[str, Dict[str, List[Dict[str, Any]]]]:
+
+@_cached_listing("prompts")
+async def tframex_list_mcp_prompts(
+    rt_ctx: "TFrameXRuntimeContext", server_alias: Optional[str] = None
+) -> Union[str, Dict[str, List[Dict[str, Any]]]]:
     """Lists available prompts from a specific or all MCP servers."""
-    if not hasattr(rt_ctx, 'mcp_manager') or not rt_ctx.mcp_manager:
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
         return "MCP integration is not initialized."
     manager: MCPManager = rt_ctx.mcp_manager
     infos_by_server: Dict[str, List[Dict[str, Any]]] = {}
@@ -128,38 +218,69 @@ async def tframex_list_mcp_prompts(rt_ctx: 'TFrameXRuntimeContext', server_alias
 
     if server_alias:
         server = manager.get_server(server_alias)
-        if server: servers_to_query.append(server)
-        else: return f"Error: MCP Server '{server_alias}' not found or not initialized."
+        if server:
+            servers_to_query.append(server)
+        else:
+            return f"Error: MCP Server '{server_alias}' not found or not initialized."
     else:
         servers_to_query = [s for s in manager.servers.values() if s.is_initialized]
 
-    if not servers_to_query: return "No MCP servers to list prompts from."
+    if not servers_to_query:
+        return "No MCP servers to list prompts from."
 
     for server_obj in servers_to_query:
-        if server_obj.capabilities and hasattr(server_obj.capabilities, 'prompts') and server_obj.capabilities.prompts and server_obj.prompts:
+        if (
+            server_obj.capabilities
+            and hasattr(server_obj.capabilities, "prompts")
+            and server_obj.capabilities.prompts
+            and server_obj.prompts
+        ):
             infos_by_server[server_obj.server_alias] = [
                 {
-                    "name": p.name, 
-                    "description": p.description, 
-                    "arguments": [{"name": arg.name, "description": arg.description, "required": arg.required} for arg in p.arguments] if p.arguments else []
+                    "name": p.name,
+                    "description": p.description,
+                    "arguments": (
+                        [
+                            {
+                                "name": arg.name,
+                                "description": arg.description,
+                                "required": arg.required,
+                            }
+                            for arg in p.arguments
+                        ]
+                        if p.arguments
+                        else []
+                    ),
                 }
-                for p in server_obj.prompts # server_obj.prompts should be List[ActualMCPPrompt]
+                for p in server_obj.prompts  # server_obj.prompts should be List[ActualMCPPrompt]
             ]
-        else: infos_by_server[server_obj.server_alias] = []
-    
+        else:
+            infos_by_server[server_obj.server_alias] = []
+
     if server_alias:
         p_list = infos_by_server.get(server_alias, [])
-        if not p_list: return f"No prompts found or prompt capability missing on server '{server_alias}'."
+        if not p_list:
+            return f"No prompts found or prompt capability missing on server '{server_alias}'."
         output = f"Prompts from MCP server '{server_alias}':\n"
         for p_info in p_list:
-            args_str = ", ".join([f"{a['name']}{' (req)' if a['required'] else ''}" for a in p_info['arguments']])
+            args_str = ", ".join(
+                [
+                    f"{a['name']}{' (req)' if a['required'] else ''}"
+                    for a in p_info["arguments"]
+                ]
+            )
             output += f"  - Name: {p_info['name']}\n    Desc: {p_info['description']}\n    Args: {args_str}\n"
         return output
     else:
         return infos_by_server
 
 
-async def tframex_use_mcp_prompt(rt_ctx: 'TFrameXRuntimeContext', server_alias: str, prompt_name: str, arguments: Dict[str, Any]) -> List[Dict[str, str]]:
+async def tframex_use_mcp_prompt(
+    rt_ctx: "TFrameXRuntimeContext",
+    server_alias: str,
+    prompt_name: str,
+    arguments: Dict[str, Any],
+) -> List[Dict[str, str]]:
     """
     Gets messages from a server-defined MCP prompt. The LLMAgent should then use these.
     Args:
@@ -170,31 +291,74 @@ async def tframex_use_mcp_prompt(rt_ctx: 'TFrameXRuntimeContext', server_alias:
     Returns:
         A list of message dictionaries (e.g., [{"role": "user", "content": "..."}]), or an error message list.
     """
-    if not hasattr(rt_ctx, 'mcp_manager') or not rt_ctx.mcp_manager:
-        return [{"role": "system", "content": "MCP integration is not initialized."}] 
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
+        return [{"role": "system", "content": "MCP integration is not initialized."}]
     manager: MCPManager = rt_ctx.mcp_manager
     # ... (rest of the function as before)
     server = manager.get_server(server_alias)
     if not server:
-        return [{"role": "system", "content": f"Error: MCP Server '{server_alias}' not found or not initialized."}]
-    if not (server.capabilities and hasattr(server.capabilities, 'prompts') and server.capabilities.prompts):
-        return [{"role": "system", "content": f"Error: Server '{server_alias}' does not support prompts."}]
+        return [
+            {
+                "role": "system",
+                "content": f"Error: MCP Server '{server_alias}' not found or not initialized.",
+            }
+        ]
+    if not (
+        server.capabilities
+        and hasattr(server.capabilities, "prompts")
+        and server.capabilities.prompts
+    ):
+        return [
+            {
+                "role": "system",
+                "content": f"Error: Server '{server_alias}' does not support prompts.",
+            }
+        ]
 
     try:
-        prompt_result = await server.get_mcp_prompt(prompt_name, arguments) 
+        prompt_result = await server.get_mcp_prompt(prompt_name, arguments)
         messages = []
-        if prompt_result and hasattr(prompt_result, 'messages'):
-            for mcp_msg in prompt_result.messages: 
+        if prompt_result and hasattr(prompt_result, "messages"):
+            for mcp_msg in prompt_result.messages:
                 content_text = ""
-                if isinstance(mcp_msg.content, TextContent): content_text = mcp_msg.content.text or ""
-                elif isinstance(mcp_msg.content, ImageContent): content_text = f"[Image from prompt: {mcp_msg.content.mimeType}]"
-                elif isinstance(mcp_msg.content, EmbeddedResource): content_text = f"[Resource from prompt: {mcp_msg.content.resource.uri}]"
-                else: content_text = str(mcp_msg.content) if mcp_msg.content else ""
+                if isinstance(mcp_msg.content, TextContent):
+                    content_text = mcp_msg.content.text or ""
+                elif isinstance(mcp_msg.content, ImageContent):
+                    content_text = f"[Image from prompt: {mcp_msg.content.mimeType}]"
+                elif isinstance(mcp_msg.content, EmbeddedResource):
+                    content_text = (
+                        f"[Resource from prompt: {mcp_msg.content.resource.uri}]"
+                    )
+                else:
+                    content_text = str(mcp_msg.content) if mcp_msg.content else ""
                 messages.append({"role": mcp_msg.role, "content": content_text})
             return messages
         else:
-            logger.error(f"MCP prompt '{prompt_name}' from '{server_alias}' returned invalid result: {prompt_result}")
-            return [{"role": "system", "content": f"Error: Prompt '{prompt_name}' from '{server_alias}' returned an empty or invalid result."}]
+            logger.error(
+                f"MCP prompt '{prompt_name}' from '{server_alias}' returned invalid result: {prompt_result}"
+            )
+            return [
+                {
+                    "role": "system",
+                    "content": f"Error: Prompt '{prompt_name}' from '{server_alias}' returned an empty or invalid result.",
+                }
+            ]
     except Exception as e:
-        logger.error(f"Error using MCP prompt '{prompt_name}' from '{server_alias}': {e}", exc_info=True)
-        return [{"role": "system", "content": f"Error getting prompt '{prompt_name}' from '{server_alias}': {str(e)}"}]
\ No newline at end of file
+        logger.error(
+            f"Error using MCP prompt '{prompt_name}' from '{server_alias}': {e}",
+            exc_info=True,
+        )
+        return [
+            {
+                "role": "system",
+                "content": f"Error getting prompt '{prompt_name}' from '{server_alias}': {str(e)}",
+            }
+        ]
+
+
+async def tframex_invalidate_mcp_cache(rt_ctx: "TFrameXRuntimeContext") -> str:
+    """Clears cached MCP server/resource/prompt listings so the next listing call re-reads them."""
+    if not hasattr(rt_ctx, "mcp_manager") or not rt_ctx.mcp_manager:
+        return "MCP integration is not initialized."
+    removed = rt_ctx.mcp_manager.invalidate_listing_cache()
+    return f"Cleared {removed} cached MCP listing(s)."
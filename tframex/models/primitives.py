@@ -39,7 +39,8 @@ class ToolParameterProperty(BaseModel):
     type: str  # e.g., "string", "number", "integer", "boolean", "array", "object"
     description: Optional[str] = None
     enum: Optional[List[Any]] = None
-    # For array items or object properties, nested schema can be defined if needed
+    # JSON schema of an array's elements; OpenAI rejects "array" parameters without it
+    items: Optional[Dict[str, Any]] = None
 
 
 class ToolParameters(BaseModel):
@@ -1,16 +1,18 @@
 # tframex/patterns/__init__.py
 from .patterns import (
     BasePattern,
-    SequentialPattern,
+    DAGPattern,
+    DiscussionPattern,
     ParallelPattern,
     RouterPattern,
-    DiscussionPattern,
+    SequentialPattern,
 )
 
 __all__ = [
     "BasePattern",
+    "DAGPattern",
     "SequentialPattern",
     "ParallelPattern",
     "RouterPattern",
     "DiscussionPattern",
-]
\ No newline at end of file
+]
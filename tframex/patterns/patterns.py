@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 
 from ..flows.flow_context import FlowContext
 from ..models.primitives import Message, ToolCall
@@ -98,9 +99,16 @@ class SequentialPattern(BasePattern):
 
 
 class ParallelPattern(BasePattern):
-    def __init__(self, pattern_name: str, tasks: List[Union[str, BasePattern]]):
+    def __init__(
+        self,
+        pattern_name: str,
+        tasks: List[Union[str, BasePattern]],
+        max_concurrency: Optional[int] = 8,
+    ):
         super().__init__(pattern_name)
         self.tasks = tasks
+        # Upper bound on branches in flight at once (None = unbounded)
+        self.max_concurrency = max_concurrency
 
     async def execute(
         self,
@@ -150,6 +158,15 @@ class ParallelPattern(BasePattern):
 
                 coroutines.append(error_coro())
 
+        if self.max_concurrency:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def bounded(coro):
+                async with semaphore:
+                    return await coro
+
+            coroutines = [bounded(coro) for coro in coroutines]
+
         results = await asyncio.gather(*coroutines, return_exceptions=True)
         # ... (rest of result aggregation logic - no changes needed here for agent_call_kwargs) ...
         aggregated_content_parts = []
@@ -235,6 +252,153 @@ class ParallelPattern(BasePattern):
         return flow_ctx
 
 
+# Builds a DAG node's input from the results so far and the pattern's input message
+DAGInputBuilder = Callable[[Dict[str, Any], Message], Union[str, Message]]
+
+
+class DAGPattern(BasePattern):
+    """
+    Runs agents as a dependency graph. Steps are validated and grouped into levels once,
+    when the pattern is built; each execution then gathers one level after another, so
+    independent agents overlap and only real dependencies stay sequential.
+
+    A step is (node, agent_name, deps) or (node, agent_name, deps, build_input). Without
+    build_input, root nodes get the pattern's input message, a node with one dependency
+    gets that node's output, and a node with several gets their outputs joined by blank
+    lines. A failed node is recorded as its exception and nodes depending on it are skipped.
+    """
+
+    def __init__(
+        self,
+        pattern_name: str,
+        steps: Sequence[Tuple[Any, ...]],
+    ):
+        super().__init__(pattern_name)
+        # node -> (agent name, dependency nodes, optional input builder)
+        self.nodes: Dict[
+            str, Tuple[str, Tuple[str, ...], Optional[DAGInputBuilder]]
+        ] = {}
+        for step in steps:
+            node, agent_name = step[0], step[1]
+            deps = tuple(step[2]) if len(step) > 2 else ()
+            build_input = step[3] if len(step) > 3 else None
+            if node in self.nodes:
+                raise ValueError(
+                    f"DAGPattern '{pattern_name}': duplicate node '{node}'."
+                )
+            self.nodes[node] = (agent_name, deps, build_input)
+        self.levels = self._compile_levels()
+        depended_on = {dep for _, deps, _ in self.nodes.values() for dep in deps}
+        self.sinks = [node for node in self.nodes if node not in depended_on]
+
+    def _compile_levels(self) -> List[List[str]]:
+        for node, (_, deps, _) in self.nodes.items():
+            unknown = [dep for dep in deps if dep not in self.nodes]
+            if unknown:
+                raise ValueError(
+                    f"DAGPattern '{self.pattern_name}': node '{node}' depends on unknown nodes {unknown}."
+                )
+
+        levels: List[List[str]] = []
+        done: set = set()
+        remaining = list(self.nodes)
+        while remaining:
+            level = [
+                node
+                for node in remaining
+                if all(dep in done for dep in self.nodes[node][1])
+            ]
+            if not level:
+                raise ValueError(
+                    f"DAGPattern '{self.pattern_name}': dependency cycle among {sorted(remaining)}."
+                )
+            levels.append(level)
+            done.update(level)
+            remaining = [node for node in remaining if node not in done]
+        return levels
+
+    def _node_input(
+        self, node: str, results: Dict[str, Any], initial_input_msg: Message
+    ) -> Union[str, Message]:
+        _, deps, build_input = self.nodes[node]
+        if build_input:
+            return build_input(results, initial_input_msg)
+        if not deps:
+            return initial_input_msg
+        if len(deps) == 1:
+            return results[deps[0]]
+        return Message(
+            role="user", content="\n\n".join(str(results[dep].content) for dep in deps)
+        )
+
+    async def execute(
+        self,
+        flow_ctx: FlowContext,
+        engine: Engine,
+        agent_call_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> FlowContext:
+        logger.info(
+            f"Executing DAGPattern '{self.pattern_name}' with {len(self.nodes)} nodes in {len(self.levels)} levels. Input: {str(flow_ctx.current_message.content)[:50]}..."
+        )
+        initial_input_msg = flow_ctx.current_message
+        effective_agent_call_kwargs = agent_call_kwargs or {}
+        results: Dict[str, Union[Message, BaseException]] = {}
+
+        for level in self.levels:
+            runnable = []
+            for node in level:
+                failed = [
+                    dep
+                    for dep in self.nodes[node][1]
+                    if isinstance(results[dep], BaseException)
+                ]
+                if failed:
+                    results[node] = RuntimeError(
+                        f"Skipped: dependencies failed: {failed}"
+                    )
+                    continue
+                try:
+                    runnable.append(
+                        (node, self._node_input(node, results, initial_input_msg))
+                    )
+                except Exception as e:
+                    results[node] = e
+
+            outcomes = await asyncio.gather(
+                *(
+                    engine.call_agent(
+                        self.nodes[node][0], node_input, **effective_agent_call_kwargs
+                    )
+                    for node, node_input in runnable
+                ),
+                return_exceptions=True,
+            )
+            for (node, _), outcome in zip(runnable, outcomes):
+                if isinstance(outcome, BaseException):
+                    logger.error(
+                        f"DAGPattern '{self.pattern_name}' - Node '{node}' failed: {outcome}",
+                        exc_info=False,
+                    )
+                results[node] = outcome
+
+        flow_ctx.shared_data[f"{self.pattern_name}_results"] = results
+        sink_results = [results[node] for node in self.sinks]
+        if len(sink_results) == 1 and isinstance(sink_results[0], Message):
+            final_output_message = sink_results[0]
+        else:
+            final_output_message = Message(
+                role="assistant",
+                content="\n\n".join(
+                    f"{node}: {result.content if isinstance(result, Message) else f'failed: {result}'}"
+                    for node, result in zip(self.sinks, sink_results)
+                ),
+            )
+        flow_ctx.update_current_message(final_output_message)
+
+        logger.info(f"DAGPattern '{self.pattern_name}' completed.")
+        return flow_ctx
+
+
 class RouterPattern(BasePattern):
     def __init__(
         self,
@@ -356,6 +520,10 @@ class DiscussionPattern(BasePattern):
         self.discussion_rounds = discussion_rounds
         self.moderator_agent_name = moderator_agent_name
         self.stop_phrase = stop_phrase.lower() if stop_phrase else None
+        # Compiled once; a case-insensitive search avoids lowercasing every (long) response
+        self._stop_phrase_re = (
+            re.compile(re.escape(stop_phrase), re.IGNORECASE) if stop_phrase else None
+        )
 
     async def execute(
         self,
@@ -393,9 +561,8 @@ class DiscussionPattern(BasePattern):
                         agent_response  # Next agent responds to this
                     )
 
-                    if (
-                        self.stop_phrase
-                        and self.stop_phrase in (agent_response.content or "").lower()
+                    if self._stop_phrase_re and self._stop_phrase_re.search(
+                        agent_response.content or ""
                     ):
                         logger.info(
                             f"DiscussionPattern '{self.pattern_name}': Agent '{agent_name}' said stop phrase. Ending."
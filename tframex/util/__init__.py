@@ -1,18 +1,44 @@
 # tframex/util/__init__.py
 # This can re-export or be left empty if util modules are imported directly.
 # For exposing to the main tframex API, we'll re-export key components.
-from .llms import BaseLLMWrapper, OpenAIChatLLM
-from .memory import BaseMemoryStore, InMemoryMemoryStore
-from .tools import Tool
+from .cache import (
+    CacheBackend,
+    FileCacheBackend,
+    FlowCache,
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    SemanticCache,
+    SQLiteCacheBackend,
+    make_cache_key,
+)
 from .engine import Engine
+from .llms import BaseLLMWrapper, CachingLLM, LLMSession, OpenAIChatLLM
 from .logging.logging_config import setup_logging
+from .memory import BaseMemoryStore, InMemoryMemoryStore
+from .text import extract_code_block
+from .tokens import count_message_tokens, count_tokens, truncate_by_tokens
+from .tools import Tool
 
 __all__ = [
     "BaseLLMWrapper",
     "OpenAIChatLLM",
+    "CachingLLM",
+    "LLMSession",
     "BaseMemoryStore",
     "InMemoryMemoryStore",
     "Tool",
     "Engine",
+    "CacheBackend",
+    "FileCacheBackend",
+    "FlowCache",
+    "InMemoryCacheBackend",
+    "RedisCacheBackend",
+    "SemanticCache",
+    "SQLiteCacheBackend",
+    "make_cache_key",
+    "count_tokens",
+    "count_message_tokens",
+    "truncate_by_tokens",
+    "extract_code_block",
     "setup_logging",
-]
\ No newline at end of file
+]
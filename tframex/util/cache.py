@@ -0,0 +1,453 @@
+# tframex/util/cache.py
+import asyncio
+import contextlib
+import hashlib
+import inspect
+import json
+import logging
+import math
+import os
+import sqlite3
+import tempfile
+import time
+import weakref
+from collections import OrderedDict
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Protocol,
+    Sequence,
+    Tuple,
+    runtime_checkable,
+)
+
+try:
+    import numpy
+except ImportError:  # Optional speedup; install with: pip install tframex[speedups]
+    numpy = None
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(payload: Any) -> str:
+    """
+    Builds a stable SHA-256 hex key from any JSON-serializable payload.
+    Dict keys are sorted so logically equal payloads always hash the same.
+    """
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+@runtime_checkable
+class CacheBackend(Protocol):
+    """Minimal async key/value interface shared by all cache backends."""
+
+    async def get(self, key: str) -> Optional[Any]: ...
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None: ...
+
+    async def delete(self, key: str) -> None: ...
+
+    async def clear(self) -> None: ...
+
+
+def _loop_lock(
+    locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]",
+) -> asyncio.Lock:
+    """
+    Returns the running loop's lock from locks, creating it there. Backends are often built
+    at import time; a lock made then would be bound to that loop on Python < 3.10 and fail
+    in a later asyncio.run().
+    """
+    loop = asyncio.get_running_loop()
+    lock = locks.get(loop)
+    if lock is None:
+        lock = locks[loop] = asyncio.Lock()
+    return lock
+
+
+class InMemoryCacheBackend:
+    """Process-local LRU cache with optional per-entry TTL."""
+
+    def __init__(self, max_entries: Optional[int] = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._locks: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]"
+        ) = weakref.WeakKeyDictionary()
+
+    async def get(self, key: str) -> Optional[Any]:
+        async with _loop_lock(self._locks):
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        async with _loop_lock(self._locks):
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)  # Evict least recently used
+
+    async def delete(self, key: str) -> None:
+        async with _loop_lock(self._locks):
+            self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        async with _loop_lock(self._locks):
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """
+    Persistent cache stored in a single SQLite table. Values must be JSON-serializable.
+    Blocking sqlite3 calls run in the default executor to keep the event loop free.
+    """
+
+    def __init__(
+        self, db_path: str = "tframex_cache.db", table_name: str = "tframex_cache"
+    ):
+        self.db_path = db_path
+        self.table_name = table_name
+        self._conn: Optional[sqlite3.Connection] = None
+        self._locks: (
+            "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]"
+        ) = weakref.WeakKeyDictionary()
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {self.table_name} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        async with _loop_lock(
+            self._locks
+        ):  # sqlite3 connections are not safe for concurrent use
+            return await loop.run_in_executor(None, func, *args)
+
+    def _get_sync(self, key: str) -> Optional[Any]:
+        conn = self._connection()
+        row = conn.execute(
+            f"SELECT value, expires_at FROM {self.table_name} WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        value, expires_at = row
+        if expires_at is not None and expires_at <= time.time():
+            conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+            conn.commit()
+            return None
+        return json.loads(value)
+
+    def _set_sync(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        conn = self._connection()
+        expires_at = time.time() + ttl if ttl else None
+        conn.execute(
+            f"INSERT OR REPLACE INTO {self.table_name} (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires_at),
+        )
+        conn.commit()
+
+    def _delete_sync(self, key: str) -> None:
+        conn = self._connection()
+        conn.execute(f"DELETE FROM {self.table_name} WHERE key = ?", (key,))
+        conn.commit()
+
+    def _clear_sync(self) -> None:
+        conn = self._connection()
+        conn.execute(f"DELETE FROM {self.table_name}")
+        conn.commit()
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._run(self._get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._run(self._set_sync, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete_sync, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear_sync)
+
+    async def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+class FileCacheBackend:
+    """
+    Persistent cache with one JSON file per entry, named by the SHA-256 of the key. Entries
+    are written to a temporary file and atomically renamed into place, so a crashed or
+    concurrent run never leaves a half-written entry behind. Values must be JSON-serializable.
+    """
+
+    def __init__(self, directory: str = ".tframex_cache"):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(
+            self.directory, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json"
+        )
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _get_sync(self, key: str) -> Optional[Any]:
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"Ignoring unreadable cache entry for key {key[:12]}...: {e}"
+            )
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= time.time():
+            self._delete_sync(key)
+            return None
+        return entry["value"]
+
+    def _set_sync(self, key: str, value: Any, ttl: Optional[float]) -> None:
+        entry = {"value": value, "expires_at": time.time() + ttl if ttl else None}
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+    def _delete_sync(self, key: str) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(self._path(key))
+
+    def _clear_sync(self) -> None:
+        for name in os.listdir(self.directory):
+            if name.endswith(".json"):
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(os.path.join(self.directory, name))
+
+    async def get(self, key: str) -> Optional[Any]:
+        return await self._run(self._get_sync, key)
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._run(self._set_sync, key, value, ttl)
+
+    async def delete(self, key: str) -> None:
+        await self._run(self._delete_sync, key)
+
+    async def clear(self) -> None:
+        await self._run(self._clear_sync)
+
+
+class RedisCacheBackend:
+    """Shared cache backed by Redis. Requires the 'redis' package (enterprise extra)."""
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        key_prefix: str = "tframex:cache:",
+        client: Optional[Any] = None,
+    ):
+        if client is None:
+            try:
+                import redis.asyncio as redis
+            except ImportError:
+                raise ImportError(
+                    "Redis cache support requires 'redis' package. "
+                    "Install with: pip install redis[hiredis]"
+                )
+            client = redis.from_url(url)
+        self._redis = client
+        self.key_prefix = key_prefix
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._redis.get(self.key_prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self._redis.set(
+            self.key_prefix + key, json.dumps(value), ex=int(ttl) if ttl else None
+        )
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self.key_prefix + key)
+
+    async def clear(self) -> None:
+        async for redis_key in self._redis.scan_iter(match=f"{self.key_prefix}*"):
+            await self._redis.delete(redis_key)
+
+    async def close(self) -> None:
+        await self._redis.close()
+
+
+class FlowCache:
+    """
+    Caches final flow outputs keyed on (flow_name, input payload), so deterministic
+    re-runs of the same flow can skip every LLM call in it.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[CacheBackend] = None,
+        default_ttl: Optional[float] = None,
+    ):
+        self.backend: CacheBackend = backend or InMemoryCacheBackend()
+        self.default_ttl = default_ttl
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key_for(flow_name: str, payload: Any) -> str:
+        return make_cache_key({"flow": flow_name, "input": payload})
+
+    async def get(self, key: str) -> Optional[Any]:
+        value = await self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            logger.debug(f"FlowCache miss for key {key[:12]}...")
+        else:
+            self.hits += 1
+            logger.debug(f"FlowCache hit for key {key[:12]}...")
+        return value
+
+    async def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        await self.backend.set(key, value, ttl if ttl is not None else self.default_ttl)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
+
+
+def _unit_vector(vector: Any) -> List[float]:
+    values = [float(x) for x in vector]
+    norm = math.sqrt(sum(x * x for x in values))
+    return [x / norm for x in values] if norm else values
+
+
+class SemanticCache:
+    """
+    Serves values cached for earlier free-text requests to reworded ones: a lookup embeds
+    the text and returns the entry whose embedding is most similar (cosine >=
+    similarity_threshold). Vectors are normalized once when stored, so a lookup costs one
+    dot product per entry; with numpy installed the index is also kept as a float32 matrix
+    and all entries are scored by a single matrix-vector product. The index is stored in the
+    backend next to the values, so a persistent backend keeps it across runs.
+    """
+
+    def __init__(
+        self,
+        embedder: Callable[[str], Any],
+        backend: Optional[CacheBackend] = None,
+        similarity_threshold: float = 0.92,
+        max_entries: int = 1024,
+        default_ttl: Optional[float] = None,
+        namespace: str = "semantic",
+    ):
+        self.embedder = embedder  # Sync or async callable returning a vector for a text
+        self.backend: CacheBackend = backend or InMemoryCacheBackend()
+        self.similarity_threshold = similarity_threshold
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.namespace = namespace
+        self._index_key = make_cache_key({"semantic_index": namespace})
+        self._index: Optional[List[Tuple[str, List[float]]]] = (
+            None  # (value key, unit vector)
+        )
+        self._matrix: Any = (
+            None  # numpy copy of the index vectors, rebuilt after changes
+        )
+        self.hits = 0
+        self.misses = 0
+
+    async def _embed(self, text: str) -> List[float]:
+        vector = self.embedder(text)
+        if inspect.isawaitable(vector):
+            vector = await vector
+        return _unit_vector(vector)
+
+    async def _load_index(self) -> List[Tuple[str, List[float]]]:
+        if self._index is None:
+            stored = await self.backend.get(self._index_key)
+            self._index = [(key, vector) for key, vector in stored or []]
+        return self._index
+
+    async def get(self, text: str) -> Optional[Any]:
+        index = await self._load_index()
+        value = None
+        if index:
+            scores = self._similarities(index, await self._embed(text))
+            best = (
+                int(numpy.argmax(scores))
+                if numpy is not None
+                else max(range(len(index)), key=scores.__getitem__)
+            )
+            best_key, best_score = index[best][0], float(scores[best])
+            if best_score >= self.similarity_threshold:
+                value = await self.backend.get(best_key)
+                if value is None:  # Expired or evicted; stop matching against it
+                    index[:] = [entry for entry in index if entry[0] != best_key]
+                    self._matrix = None
+                else:
+                    logger.debug(
+                        f"SemanticCache '{self.namespace}' hit (similarity {best_score:.3f})"
+                    )
+        if value is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return value
+
+    def _similarities(
+        self, index: List[Tuple[str, List[float]]], query: List[float]
+    ) -> Sequence[float]:
+        if numpy is None:
+            return [sum(q * v for q, v in zip(query, vector)) for _, vector in index]
+        if self._matrix is None:
+            self._matrix = numpy.array(
+                [vector for _, vector in index], dtype=numpy.float32
+            )
+        return self._matrix @ numpy.asarray(query, dtype=numpy.float32)
+
+    async def set(self, text: str, value: Any, ttl: Optional[float] = None) -> None:
+        key = make_cache_key({"semantic": self.namespace, "text": text})
+        vector = await self._embed(text)
+        await self.backend.set(key, value, ttl if ttl is not None else self.default_ttl)
+        index = await self._load_index()
+        index[:] = [entry for entry in index if entry[0] != key]
+        index.append((key, vector))
+        del index[: max(0, len(index) - self.max_entries)]
+        self._matrix = None
+        await self.backend.set(
+            self._index_key, [[key, vector] for key, vector in index]
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -0,0 +1,33 @@
+# tframex/util/jsonio.py
+"""
+JSON helpers for hot request/response paths. Uses orjson when it is installed
+(it is 2-5x faster and produces bytes directly) and falls back to the stdlib.
+"""
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # Optional speedup; install with: pip install tframex[speedups]
+    orjson = None
+
+HAS_ORJSON = orjson is not None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both.
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any, indent: bool = False) -> bytes:
+    """Serializes obj to UTF-8 encoded JSON bytes (two-space indented if requested)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def loads(data: Union[bytes, bytearray, str]) -> Any:
+    """Parses JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,15 +1,26 @@
 import asyncio
+import contextlib
+import importlib.util
+import inspect
 import json
 import logging
+import random
+import re
+import uuid
+import weakref
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from typing import (
     Any,
     AsyncGenerator,
+    Callable,
     Coroutine,
     Dict,
     List,
     Literal,
     Optional,
+    Tuple,
     Union,
     overload,
 )
@@ -17,10 +28,61 @@ from typing import (
 import httpx
 
 from tframex.models.primitives import FunctionCall, Message, MessageChunk, ToolCall
+from tframex.util import jsonio
+from tframex.util.cache import (
+    CacheBackend,
+    InMemoryCacheBackend,
+    SemanticCache,
+    make_cache_key,
+)
 
 logger = logging.getLogger(__name__)
 
 
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 50
+DEFAULT_KEEPALIVE_EXPIRY = 75.0  # seconds
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Rate limiting and transient server errors are retried like dropped connections
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+RETRY_BASE_DELAY = (
+    0.5  # seconds; doubled per attempt, plus up to the same again as jitter
+)
+RETRY_MAX_DELAY = 30.0  # seconds
+
+
+def _retry_delay(attempt: int, response: Optional[httpx.Response] = None) -> float:
+    """Seconds to wait before retry number attempt+1, honoring a numeric Retry-After header."""
+    if response is not None:
+        try:
+            return min(
+                max(float(response.headers["Retry-After"]), 0.0), RETRY_MAX_DELAY
+            )
+        except (KeyError, ValueError):
+            pass
+    # Jitter keeps concurrent callers that failed together from retrying in lockstep
+    return min(RETRY_BASE_DELAY * (2**attempt), RETRY_MAX_DELAY) + random.uniform(
+        0, RETRY_BASE_DELAY
+    )
+
+
+# In-flight request caps per event loop, keyed on (endpoint, limit), so every wrapper that
+# targets the same endpoint with the same max_concurrent_requests shares one semaphore.
+_request_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], asyncio.Semaphore]]" = (weakref.WeakKeyDictionary())
+
+# Text-format tool calls such as [function_name(args)] or function_name(args), compiled once.
+# Quoted strings are matched whole, so a ")" or "," inside an argument value doesn't end it.
+_TEXT_TOOL_CALL_RE = re.compile(
+    r"""(?:\[)?(\w+)\(((?:"[^"]*"|'[^']*'|[^)"'])*)\)(?:\])?"""
+)
+_TEXT_TOOL_ARG_RE = re.compile(r"""(\w+)\s*=\s*("[^"]*"|'[^']*'|[^,]*)""")
+
+# Pooled clients per event loop (httpx clients can't cross loops), keyed on API key and
+# client options. Values are [client, number of wrappers using it].
+_shared_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], List[Any]]]" = (weakref.WeakKeyDictionary())
+
+
 class BaseLLMWrapper(ABC):
     def __init__(
         self,
@@ -28,36 +90,116 @@ class BaseLLMWrapper(ABC):
         api_key: Optional[str] = None,
         api_base_url: Optional[str] = None,
         client_kwargs: Optional[Dict[str, Any]] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
     ):
         self.model_id = model_id
         self.api_key = api_key
         self.api_base_url = api_base_url.rstrip("/") if api_base_url else None
         self.client_kwargs = client_kwargs or {}
+        # A caller-owned client (e.g. one httpx.AsyncClient with explicit limits handed to every
+        # wrapper of an app) is used as is instead of the pool and never closed here. It carries
+        # no per-wrapper headers, so those go with each request.
+        self.http_client = http_client
+        self._request_headers: Optional[Dict[str, str]] = (
+            self._headers() if http_client is not None else None
+        )
         self._client: Optional[httpx.AsyncClient] = None
+        # Event loop self._client belongs to (weakly, so a finished loop can be collected)
+        self._client_loop: Optional[
+            "weakref.ReferenceType[asyncio.AbstractEventLoop]"
+        ] = None
+        self._client_pool: Dict[Tuple[Any, ...], List[Any]] = {}
+        self._client_key: Tuple[Any, ...] = ()
         logger.info(f"BaseLLMWrapper initialized for model_id: {model_id}")
 
+    def _headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.api_key:
+            headers["Authorization"] = f"Bearer {self.api_key}"
+        headers["Content-Type"] = "application/json"
+        return headers
+
+    def _build_client(self) -> httpx.AsyncClient:
+        headers = self._headers()
+
+        # Read (not pop) our options so a client recreated after close() keeps them
+        client_kwargs = dict(self.client_kwargs)
+        timeout_config = client_kwargs.pop("timeout", None)
+        if timeout_config is None:
+            timeouts = httpx.Timeout(
+                300.0, connect=60.0
+            )  # Default: 5 min total, 1 min connect
+        elif isinstance(timeout_config, (int, float)):
+            timeouts = httpx.Timeout(timeout_config)
+        else:  # Assumes httpx.Timeout object
+            timeouts = timeout_config
+
+        # Concurrent agent calls reuse keep-alive connections (and multiplex over
+        # HTTP/2 when 'h2' is installed) instead of paying a TCP/TLS handshake per request.
+        client_kwargs.setdefault(
+            "limits",
+            httpx.Limits(
+                max_connections=DEFAULT_MAX_CONNECTIONS,
+                max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+                keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+            ),
+        )
+        client_kwargs.setdefault("http2", _HTTP2_AVAILABLE)
+
+        return httpx.AsyncClient(headers=headers, timeout=timeouts, **client_kwargs)
+
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None or self._client.is_closed:
-            headers = {}
-            if self.api_key:
-                headers["Authorization"] = f"Bearer {self.api_key}"
-            headers["Content-Type"] = "application/json"
-
-            timeout_config = self.client_kwargs.pop("timeout", None)
-            if timeout_config is None:
-                timeouts = httpx.Timeout(
-                    300.0, connect=60.0
-                )  # Default: 5 min total, 1 min connect
-            elif isinstance(timeout_config, (int, float)):
-                timeouts = httpx.Timeout(timeout_config)
-            else:  # Assumes httpx.Timeout object
-                timeouts = timeout_config
-
-            self._client = httpx.AsyncClient(
-                headers=headers, timeout=timeouts, **self.client_kwargs
-            )
+        """
+        Returns the pooled client for this wrapper. Wrappers with the same API key and client
+        options (limits, timeout, transport, ...) share one client per event loop, so e.g. the
+        per-agent LLM instances of an app draw from a single connection pool.
+        """
+        if self.http_client is not None:
+            return self.http_client
+        loop = asyncio.get_running_loop()
+        if self._client is not None and (
+            self._client_loop is None or self._client_loop() is not loop
+        ):
+            # Left over from an earlier event loop (e.g. a previous asyncio.run()); its
+            # connections can't be used, or closed, from this one
+            self._release_client()
+        if self._client is not None and not self._client.is_closed:
+            return self._client
+        if self._client is not None:  # Closed underneath us; drop our reference first
+            await self.close()
+
+        pool = _shared_clients.setdefault(loop, {})
+        key = (
+            self.api_key,
+            tuple(sorted((k, repr(v)) for k, v in self.client_kwargs.items())),
+        )
+        entry = pool.get(key)
+        if entry is None or entry[0].is_closed:
+            entry = pool[key] = [self._build_client(), 0]
+        entry[1] += 1
+        self._client, self._client_pool, self._client_key = entry[0], pool, key
+        self._client_loop = weakref.ref(loop)
         return self._client
 
+    def _release_client(self) -> Optional[httpx.AsyncClient]:
+        """
+        Drops this wrapper's reference to its pooled client. Returns the client if no other
+        wrapper still uses it (the caller may close it), else None.
+        """
+        client, self._client, self._client_loop = self._client, None, None
+        if client is None:
+            return None
+        entry = self._client_pool.get(self._client_key)
+        if entry is not None and entry[0] is client:
+            entry[1] -= 1
+            if entry[1] > 0:
+                logger.debug(
+                    f"LLM client for {self.model_id} released; still shared by {entry[1]} wrapper(s)."
+                )
+                return None
+            del self._client_pool[self._client_key]
+        return client
+
     @overload
     @abstractmethod
     async def chat_completion(
@@ -76,11 +218,60 @@ class BaseLLMWrapper(ABC):
     ) -> Coroutine[Any, Any, Union[Message, AsyncGenerator[MessageChunk, None]]]:
         pass
 
+    async def warmup(
+        self,
+        prime: bool = False,
+        messages: Optional[List[Message]] = None,
+        **kwargs: Any,
+    ) -> bool:
+        """
+        Opens a pooled connection to the endpoint ahead of the first real request (e.g. while
+        waiting for user input), so that request doesn't pay DNS/TCP/TLS setup. With prime=True
+        it sends a 1-token completion instead, so a cold model server also loads the model.
+        Passing the messages (and tools etc. as kwargs) of an upcoming request primes with
+        those, so a provider with prefix caching has their prefill cached when it arrives.
+        Never raises.
+        """
+        if not self.api_base_url:
+            return False
+        try:
+            if prime:
+                # The request kwargs may carry their own max_tokens; priming caps it at 1
+                response = await self.chat_completion(
+                    messages or [Message(role="user", content="hi")],
+                    **{**kwargs, "max_tokens": 1, "max_retries": 0},
+                )
+                primed = not _is_error_response(response)
+                logger.debug(
+                    f"LLM model priming for {self.model_id}: {'ok' if primed else response.content}"
+                )
+                return primed
+            client = await self._get_client()
+            response = await client.get(
+                f"{self.api_base_url}/models",
+                headers=self._request_headers,
+                timeout=10.0,
+            )
+            logger.debug(
+                f"LLM endpoint warm-up for {self.model_id}: HTTP {response.status_code}"
+            )
+            return True
+        except Exception as e:
+            logger.debug(f"LLM endpoint warm-up for {self.model_id} failed: {e}")
+            return False
+
     async def close(self):
-        if self._client and not self._client.is_closed:
-            await self._client.aclose()
+        """
+        Releases this wrapper's client; the shared pool closes once no wrapper uses it.
+        A caller-supplied http_client is left open for its owner to close.
+        """
+        client = self._release_client()
+        if client is not None and not client.is_closed:
+            await client.aclose()
             logger.info(f"LLM client for {self.model_id} closed.")
 
+    aclose = close
+
 
 class OpenAIChatLLM(BaseLLMWrapper):
     def __init__(
@@ -91,20 +282,114 @@ class OpenAIChatLLM(BaseLLMWrapper):
         default_max_tokens: int = 4096,
         default_temperature: float = 0.7,
         parse_text_tool_calls: bool = False,
+        prompt_caching: Optional[bool] = None,
+        max_concurrent_requests: Optional[int] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
         **kwargs: Any,
     ):
         # Extract OpenAIChatLLM-specific parameters before passing to parent
         self.parse_text_tool_calls = parse_text_tool_calls
-        
+        # Requests beyond this many in flight wait client-side instead of queueing on the
+        # server (e.g. set to vLLM's --max-num-seqs). None means no cap.
+        self.max_concurrent_requests = max_concurrent_requests
+
         super().__init__(
             model_id=model_name,
             api_key=api_key,
             api_base_url=api_base_url,
             client_kwargs=kwargs,
+            http_client=http_client,
         )
         self.chat_completions_url = f"{self.api_base_url}/chat/completions"
         self.default_max_tokens = default_max_tokens
         self.default_temperature = default_temperature
+        # Anthropic only caches prompt prefixes that are explicitly marked with cache_control;
+        # OpenAI caches long prefixes automatically, so the marker is only added when needed.
+        if prompt_caching is None:
+            prompt_caching = "anthropic" in (self.api_base_url or "").lower()
+        self.prompt_caching = prompt_caching
+        # Serialized system messages keyed on id(); agents reuse one system Message per rendering,
+        # so its payload dict only needs to be built once. The Message is kept to pin the id.
+        self._system_payload_cache: Dict[int, Tuple[Message, Dict[str, Any]]] = {}
+        self.usage_totals: Dict[str, int] = {
+            "prompt_tokens": 0,
+            "completion_tokens": 0,
+            "cached_tokens": 0,
+            "cache_creation_input_tokens": 0,
+            "cache_read_input_tokens": 0,
+        }
+
+    def _message_payload(self, msg: Message) -> Dict[str, Any]:
+        if msg.role != "system":
+            return msg.model_dump(exclude_none=True)
+        cached = self._system_payload_cache.get(id(msg))
+        if cached is None or cached[0] is not msg:
+            if len(self._system_payload_cache) >= 256:
+                self._system_payload_cache.clear()
+            cached = (msg, msg.model_dump(exclude_none=True))
+            self._system_payload_cache[id(msg)] = cached
+        return dict(
+            cached[1]
+        )  # Shallow copy: _apply_prompt_caching rewrites "content" in place
+
+    def _apply_prompt_caching(
+        self, payload_messages: List[Dict[str, Any]], cache_type: str = "ephemeral"
+    ) -> None:
+        """Marks the first system message as a cacheable prefix (Anthropic cache_control)."""
+        for msg in payload_messages:
+            if msg.get("role") == "system" and isinstance(msg.get("content"), str):
+                msg["content"] = [
+                    {
+                        "type": "text",
+                        "text": msg["content"],
+                        "cache_control": {"type": cache_type},
+                    }
+                ]
+                return
+
+    def _extract_tokens(self, usage: Optional[Dict[str, Any]]) -> Dict[str, int]:
+        """Accumulates token usage, including prompt-cache hits/writes, from an API response."""
+        if not usage:
+            return {}
+        prompt_details = usage.get("prompt_tokens_details") or {}
+        tokens = {
+            "prompt_tokens": usage.get("prompt_tokens", 0) or 0,
+            "completion_tokens": usage.get("completion_tokens", 0) or 0,
+            "cached_tokens": prompt_details.get("cached_tokens", 0) or 0,
+            "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0)
+            or 0,
+            "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0) or 0,
+        }
+        for key, value in tokens.items():
+            self.usage_totals[key] += value
+        logger.debug(f"OpenAIChatLLM ({self.model_id}) token usage: {tokens}")
+        return tokens
+
+    def _request_limiter(self) -> Optional[asyncio.Semaphore]:
+        if not self.max_concurrent_requests:
+            return None
+        limits = _request_limits.setdefault(asyncio.get_running_loop(), {})
+        key = (self.api_base_url, self.max_concurrent_requests)
+        limiter = limits.get(key)
+        if limiter is None:
+            limiter = limits[key] = asyncio.Semaphore(self.max_concurrent_requests)
+        return limiter
+
+    async def embed(
+        self, texts: List[str], model: Optional[str] = None
+    ) -> List[List[float]]:
+        """Embeds texts in one request to the endpoint's OpenAI-compatible /embeddings route."""
+        client = await self._get_client()
+        response = await client.post(
+            f"{self.api_base_url}/embeddings",
+            content=jsonio.dumps({"model": model or self.model_id, "input": texts}),
+            headers=self._request_headers,
+        )
+        response.raise_for_status()
+        data = jsonio.loads(response.content)["data"]
+        return [
+            item["embedding"] for item in sorted(data, key=lambda item: item["index"])
+        ]
 
     async def chat_completion(
         self,
@@ -116,11 +401,15 @@ class OpenAIChatLLM(BaseLLMWrapper):
         client = await self._get_client()
         payload: Dict[str, Any] = {
             "model": self.model_id,
-            "messages": [msg.model_dump(exclude_none=True) for msg in messages],
+            "messages": [self._message_payload(msg) for msg in messages],
             "stream": stream,
             "max_tokens": kwargs.get("max_tokens", self.default_max_tokens),
             "temperature": kwargs.get("temperature", self.default_temperature),
         }
+        # Per-agent cache marker type; only providers that need explicit markers receive it.
+        cache_control = kwargs.pop("cache_control", None) or "ephemeral"
+        if self.prompt_caching:
+            self._apply_prompt_caching(payload["messages"], cache_control)
 
         # Handle tools if provided
         if "tools" in kwargs and kwargs["tools"]:
@@ -142,24 +431,50 @@ class OpenAIChatLLM(BaseLLMWrapper):
                 logger.debug(
                     f"OpenAIChatLLM: Attempt {attempt+1} to {self.chat_completions_url}. Stream: {stream}. Model: {self.model_id}"
                 )
+                limiter = self._request_limiter()
                 if stream:
-                    return self._stream_response(client, self.chat_completions_url, payload)  # type: ignore
+                    if limiter is not None:
+                        return self._limited_stream(  # type: ignore
+                            limiter,
+                            client,
+                            self.chat_completions_url,
+                            payload,
+                            max_retries,
+                        )
+                    return self._stream_response(client, self.chat_completions_url, payload, max_retries)  # type: ignore
                 else:
-                    response = await client.post(
-                        self.chat_completions_url, json=payload
-                    )
+                    # Pre-serialized body; the client already sends Content-Type: application/json
+                    body = jsonio.dumps(payload)
+                    if limiter is None:
+                        response = await client.post(
+                            self.chat_completions_url,
+                            content=body,
+                            headers=self._request_headers,
+                        )
+                    else:
+                        async with limiter:
+                            response = await client.post(
+                                self.chat_completions_url,
+                                content=body,
+                                headers=self._request_headers,
+                            )
                     response.raise_for_status()
-                    response_data = response.json()
+                    response_data = jsonio.loads(response.content)
+                    self._extract_tokens(response_data.get("usage"))
                     choice = response_data.get("choices", [{}])[0]
                     msg_data = choice.get("message", {})
-                    
-                    # Debug logging for tool call parsing issues
-                    logger.debug(f"LLM Response choice: {choice}")
-                    logger.debug(f"LLM Response msg_data: {msg_data}")
-                    
+
+                    # Debug logging for tool call parsing issues (guarded: repr of a full response)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"LLM Response choice: {choice}")
+                        logger.debug(f"LLM Response msg_data: {msg_data}")
+
                     # Handle tool_calls parsing - some APIs return them differently
                     if "tool_calls" in msg_data and msg_data["tool_calls"]:
-                        logger.debug(f"Found tool_calls in response: {msg_data['tool_calls']}")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                f"Found tool_calls in response: {msg_data['tool_calls']}"
+                            )
                         # Ensure tool_calls are properly formatted
                         for i, tool_call in enumerate(msg_data["tool_calls"]):
                             if isinstance(tool_call, dict):
@@ -168,27 +483,54 @@ class OpenAIChatLLM(BaseLLMWrapper):
                                     tool_call["id"] = f"call_{i}"
                                 if "type" not in tool_call:
                                     tool_call["type"] = "function"
-                                if "function" in tool_call and isinstance(tool_call["function"], dict):
+                                if "function" in tool_call and isinstance(
+                                    tool_call["function"], dict
+                                ):
                                     # Ensure arguments is a string
                                     if "arguments" in tool_call["function"]:
                                         args = tool_call["function"]["arguments"]
                                         if not isinstance(args, str):
-                                            tool_call["function"]["arguments"] = json.dumps(args)
-                    
-                    # Optional: Handle APIs that return tool calls as text content
-                    elif (hasattr(self, 'parse_text_tool_calls') and self.parse_text_tool_calls and 
-                          msg_data.get("content") and self._contains_text_tool_calls(msg_data["content"])):
-                        logger.debug(f"Parsing tool calls from text content: {msg_data['content']}")
-                        parsed_tool_calls = self._parse_text_tool_calls(msg_data["content"])
+                                            tool_call["function"]["arguments"] = (
+                                                json.dumps(args)
+                                            )
+
+                    # Optional: Handle APIs that return tool calls as text content. Parsed in one
+                    # findall pass; no separate search first, since no matches means no tool calls.
+                    elif (
+                        hasattr(self, "parse_text_tool_calls")
+                        and self.parse_text_tool_calls
+                        and msg_data.get("content")
+                    ):
+                        parsed_tool_calls = self._parse_text_tool_calls(
+                            msg_data["content"]
+                        )
                         if parsed_tool_calls:
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug(
+                                    f"Parsed tool calls from text content: {msg_data['content']}"
+                                )
                             msg_data["tool_calls"] = parsed_tool_calls
                             # Clear content since it's now a tool call
                             msg_data["content"] = None
-                            logger.debug(f"Converted text to {len(parsed_tool_calls)} tool calls")
-                    
+                            logger.debug(
+                                f"Converted text to {len(parsed_tool_calls)} tool calls"
+                            )
+
                     return Message(**msg_data)
 
             except httpx.HTTPStatusError as e:
+                if (
+                    e.response.status_code in RETRYABLE_STATUS_CODES
+                    and attempt < max_retries
+                ):
+                    last_exception = e
+                    delay = _retry_delay(attempt, e.response)
+                    logger.warning(
+                        f"LLM Call Attempt {attempt+1} for {self.model_id} got HTTP {e.response.status_code}. "
+                        f"Retrying in {delay:.2f}s..."
+                    )
+                    await asyncio.sleep(delay)
+                    continue
                 logger.error(
                     f"HTTP Error from LLM API ({self.model_id}): {e.response.status_code} - {e.response.text}",
                     exc_info=False,
@@ -210,7 +552,7 @@ class OpenAIChatLLM(BaseLLMWrapper):
             except (
                 httpx.ReadError,
                 httpx.ConnectError,
-                httpx.PoolTimeout,
+                httpx.TimeoutException,
                 httpx.RemoteProtocolError,
             ) as e:
                 last_exception = e
@@ -218,7 +560,7 @@ class OpenAIChatLLM(BaseLLMWrapper):
                     f"LLM Call Attempt {attempt+1} for {self.model_id} failed with {type(e).__name__}: {e}. Retrying..."
                 )
                 if attempt < max_retries:
-                    await asyncio.sleep(1 * (2**attempt))
+                    await asyncio.sleep(_retry_delay(attempt))
             except Exception as e:
                 logger.error(
                     f"Unexpected error during LLM call ({self.model_id}): {e}",
@@ -245,10 +587,57 @@ class OpenAIChatLLM(BaseLLMWrapper):
             return err_gen()  # type: ignore
         return Message(role="assistant", content=err_msg)
 
+    async def _limited_stream(
+        self,
+        limiter: asyncio.Semaphore,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+        max_retries: int = 0,
+    ) -> AsyncGenerator[MessageChunk, None]:
+        """Holds a request slot for the whole stream, released when it ends or is closed."""
+        async with limiter:
+            async for chunk in self._stream_response(client, url, payload, max_retries):
+                yield chunk
+
+    @contextlib.asynccontextmanager
+    async def _open_stream(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+        max_retries: int,
+    ) -> AsyncGenerator[httpx.Response, None]:
+        """
+        Opens the streaming response. Rate limiting and transient server errors are retried
+        as for non-stream calls; that is only possible here, before any chunk is yielded.
+        """
+        body = jsonio.dumps(payload)
+        for attempt in range(max_retries + 1):
+            async with client.stream(
+                "POST", url, content=body, headers=self._request_headers
+            ) as response:
+                if (
+                    response.status_code not in RETRYABLE_STATUS_CODES
+                    or attempt >= max_retries
+                ):
+                    yield response
+                    return
+                delay = _retry_delay(attempt, response)
+            logger.warning(
+                f"LLM Stream Attempt {attempt+1} for {self.model_id} got HTTP {response.status_code}. "
+                f"Retrying in {delay:.2f}s..."
+            )
+            await asyncio.sleep(delay)
+
     async def _stream_response(
-        self, client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        payload: Dict[str, Any],
+        max_retries: int = 0,
     ) -> AsyncGenerator[MessageChunk, None]:
-        async with client.stream("POST", url, json=payload) as response:
+        async with self._open_stream(client, url, payload, max_retries) as response:
             if response.status_code != 200:
                 error_content_bytes = await response.aread()
                 error_content = error_content_bytes.decode(errors="replace")
@@ -263,19 +652,28 @@ class OpenAIChatLLM(BaseLLMWrapper):
 
             # Tool call accumulation logic (OpenAI specific streaming format for tools)
             current_tool_calls: List[Dict[str, Any]] = []
+            # Tool calls stream one after another, so once a delta for index i arrives every call
+            # below i is complete and is yielded right away (a consumer can start running it
+            # while the rest is generated). emitted counts the calls already yielded.
+            emitted = 0
+            # This loop runs once per streamed token, so the lookups it repeats are bound once here
+            loads = jsonio.loads
 
             async for line in response.aiter_lines():
                 if line.startswith("data:"):
-                    data_content = line[len("data:") :].strip()
+                    data_content = line[5:].strip()
                     if data_content == "[DONE]":
                         break
                     try:
-                        chunk_data = json.loads(data_content)
-                        delta = chunk_data.get("choices", [{}])[0].get("delta", {})
-
-                        role_chunk = delta.get(
-                            "role"
-                        )  # Will be "assistant" on first useful chunk
+                        chunk_data = loads(data_content)
+                        usage = chunk_data.get("usage")
+                        if usage:
+                            self._extract_tokens(usage)
+                        choices = chunk_data.get("choices")
+                        if not choices:
+                            continue  # Usage-only trailer chunk
+                        choice = choices[0]
+                        delta = choice.get("delta") or {}
                         content_chunk = delta.get("content")
                         tool_calls_chunk = delta.get("tool_calls")
 
@@ -306,37 +704,39 @@ class OpenAIChatLLM(BaseLLMWrapper):
                                             "name"
                                         ] = tc_delta["function"]["name"]
                                     if "arguments" in tc_delta["function"]:
+                                        # Collected as fragments and joined once: += on a dict
+                                        # value copies the whole string on every delta
                                         current_tool_calls[index][
                                             "function"
-                                        ].setdefault("arguments", "")
-                                        current_tool_calls[index]["function"][
-                                            "arguments"
-                                        ] += tc_delta["function"]["arguments"]
+                                        ].setdefault("argument_parts", []).append(
+                                            tc_delta["function"]["arguments"]
+                                        )
 
-                        finish_reason = chunk_data.get("choices", [{}])[0].get(
-                            "finish_reason"
-                        )
+                            completed = max(
+                                tc_delta.get("index", 0)
+                                for tc_delta in tool_calls_chunk
+                            )
+                            if completed > emitted:
+                                parsed_tool_calls_list = self._build_stream_tool_calls(
+                                    current_tool_calls[emitted:completed]
+                                )
+                                emitted = completed
+                                if parsed_tool_calls_list:
+                                    yield MessageChunk(
+                                        role="assistant",
+                                        content=None,
+                                        tool_calls=parsed_tool_calls_list,
+                                    )
+
+                        finish_reason = choice.get("finish_reason")
                         if finish_reason == "tool_calls" or (
                             finish_reason
                             and not tool_calls_chunk
                             and current_tool_calls
                         ):  # End of stream and we have tool calls
-                            parsed_tool_calls_list = []
-                            for tc_data in current_tool_calls:
-                                if tc_data.get("id") and tc_data.get(
-                                    "function", {}
-                                ).get("name"):
-                                    parsed_tool_calls_list.append(
-                                        ToolCall(
-                                            id=tc_data["id"],
-                                            function=FunctionCall(
-                                                name=tc_data["function"]["name"],
-                                                arguments=tc_data["function"].get(
-                                                    "arguments", "{}"
-                                                ),  # Default to empty JSON obj string
-                                            ),
-                                        )
-                                    )
+                            parsed_tool_calls_list = self._build_stream_tool_calls(
+                                current_tool_calls[emitted:]
+                            )
                             if parsed_tool_calls_list:
                                 yield MessageChunk(
                                     role="assistant",
@@ -346,109 +746,391 @@ class OpenAIChatLLM(BaseLLMWrapper):
                             current_tool_calls = (
                                 []
                             )  # Reset for potential future chunks (though unlikely with OpenAI)
+                            emitted = 0
 
-                    except json.JSONDecodeError:
+                    except jsonio.JSONDecodeError:
                         logger.warning(
                             f"Could not decode stream chunk for {self.model_id}: {data_content}"
                         )
 
             # If stream ended and there are still unyielded tool calls (e.g. no explicit finish_reason="tool_calls")
-            if current_tool_calls:
-                parsed_tool_calls_list = []
-                for tc_data in current_tool_calls:
-                    if tc_data.get("id") and tc_data.get("function", {}).get("name"):
-                        parsed_tool_calls_list.append(
-                            ToolCall(
-                                id=tc_data["id"],
-                                function=FunctionCall(
-                                    name=tc_data["function"]["name"],
-                                    arguments=tc_data["function"].get(
-                                        "arguments", "{}"
-                                    ),
-                                ),
-                            )
-                        )
+            if current_tool_calls[emitted:]:
+                parsed_tool_calls_list = self._build_stream_tool_calls(
+                    current_tool_calls[emitted:]
+                )
                 if parsed_tool_calls_list:
                     yield MessageChunk(
                         role="assistant",
                         content=None,
                         tool_calls=parsed_tool_calls_list,
                     )
-    
+
+    @staticmethod
+    def _build_stream_tool_calls(
+        tool_call_data: List[Dict[str, Any]]
+    ) -> List[ToolCall]:
+        """Builds ToolCalls from accumulated stream deltas, skipping incomplete entries."""
+        tool_calls = []
+        for tc_data in tool_call_data:
+            function_data = tc_data.get("function", {})
+            if tc_data.get("id") and function_data.get("name"):
+                parts = function_data.get("argument_parts")
+                tool_calls.append(
+                    ToolCall(
+                        id=tc_data["id"],
+                        function=FunctionCall(
+                            name=function_data["name"],
+                            arguments=(
+                                "".join(parts) if parts is not None else "{}"
+                            ),  # Default to empty JSON obj string
+                        ),
+                    )
+                )
+        return tool_calls
+
     def _contains_text_tool_calls(self, content: str) -> bool:
         """Check if content contains tool calls in text format."""
         if not content:
             return False
-        
+
         # Look for patterns like [function_name(...)] or function_name(...)
-        import re
-        patterns = [
-            r'\[[\w_]+\([^)]*\)\]',  # [function_name(args)]
-            r'[\w_]+\([^)]*\)',      # function_name(args)
-        ]
-        
-        for pattern in patterns:
-            if re.search(pattern, content):
-                return True
-        return False
-    
+        return _TEXT_TOOL_CALL_RE.search(content) is not None
+
     def _parse_text_tool_calls(self, content: str) -> List[Dict[str, Any]]:
         """Parse tool calls from text content."""
-        import re
-        import uuid
-        
         tool_calls = []
-        
-        # Pattern to match [function_name(args)] or function_name(args)
-        pattern = r'(?:\[)?(\w+)\(([^)]*)\)(?:\])?'
-        matches = re.findall(pattern, content)
-        
+
+        # Match [function_name(args)] or function_name(args)
+        matches = _TEXT_TOOL_CALL_RE.findall(content)
+
         for i, (func_name, args_str) in enumerate(matches):
             # Generate unique ID
             call_id = f"call_{str(uuid.uuid4())[:8]}"
-            
+
             # Parse arguments
             arguments = {}
             if args_str.strip():
                 # Simple argument parsing - handles key=value pairs
                 try:
                     # Try to parse as Python-like function call
-                    for arg_pair in args_str.split(','):
-                        if '=' in arg_pair:
-                            key, value = arg_pair.split('=', 1)
-                            key = key.strip()
-                            value = value.strip()
-                            
-                            # Try to parse the value
-                            try:
-                                # Handle quoted strings
-                                if (value.startswith('"') and value.endswith('"')) or \
-                                   (value.startswith("'") and value.endswith("'")):
-                                    arguments[key] = value[1:-1]
-                                # Handle numbers
-                                elif value.isdigit():
-                                    arguments[key] = int(value)
-                                elif '.' in value and value.replace('.', '').isdigit():
-                                    arguments[key] = float(value)
-                                # Handle booleans
-                                elif value.lower() in ['true', 'false']:
-                                    arguments[key] = value.lower() == 'true'
-                                else:
-                                    arguments[key] = value
-                            except:
+                    for key, value in _TEXT_TOOL_ARG_RE.findall(args_str):
+                        value = value.strip()
+
+                        # Try to parse the value
+                        try:
+                            # Handle quoted strings
+                            if (value.startswith('"') and value.endswith('"')) or (
+                                value.startswith("'") and value.endswith("'")
+                            ):
+                                arguments[key] = value[1:-1]
+                            # Handle numbers
+                            elif value.isdigit():
+                                arguments[key] = int(value)
+                            elif "." in value and value.replace(".", "").isdigit():
+                                arguments[key] = float(value)
+                            # Handle booleans
+                            elif value.lower() in ["true", "false"]:
+                                arguments[key] = value.lower() == "true"
+                            else:
                                 arguments[key] = value
+                        except:
+                            arguments[key] = value
                 except:
                     # If parsing fails, just pass empty arguments
                     pass
-            
+
             tool_call = {
                 "id": call_id,
                 "type": "function",
-                "function": {
-                    "name": func_name,
-                    "arguments": json.dumps(arguments)
-                }
+                "function": {"name": func_name, "arguments": json.dumps(arguments)},
             }
             tool_calls.append(tool_call)
-        
+
         return tool_calls
+
+
+# Prefixes of the error messages OpenAIChatLLM returns instead of raising; never cache these.
+_ERROR_CONTENT_PREFIXES = (
+    "LLM API Error",
+    "LLM API Stream Error",
+    "Unexpected error",
+    "LLM call (",
+)
+# Request params that only steer transport or provider-side prompt caching, not the answer
+_CACHE_KEY_IGNORED_PARAMS = frozenset(
+    {"max_retries", "cache_control", "prompt_cache_key"}
+)
+
+
+def _is_error_response(message: Message) -> bool:
+    return isinstance(message.content, str) and message.content.startswith(
+        _ERROR_CONTENT_PREFIXES
+    )
+
+
+# Per-context SemanticCache objects kept in memory; their indexes live in the backend
+_MAX_SEMANTIC_CONTEXTS = 256
+# Recent embeddings, so a miss stored after its lookup is not embedded twice
+_MAX_MEMOIZED_EMBEDDINGS = 64
+
+
+class CachingLLM(BaseLLMWrapper):
+    """
+    Wraps another LLM wrapper and replays cached responses for repeated requests.
+
+    Exact hits are keyed on a SHA-256 of (model, messages, tools, sampling params). If an
+    embedder is given, a request that misses exactly but whose final user message is
+    semantically close (cosine >= similarity_threshold) to a cached one with the same
+    preceding context is served from that entry too. Each context has its own SemanticCache
+    whose index is kept in the backend, so a persistent backend keeps semantic hits across
+    restarts. Semantic hits are only used for
+    plain-text answers; responses carrying tool calls are replayed on exact hits only.
+    Streaming requests share both caches: a hit is replayed as a single chunk, and a miss
+    is passed through chunk by chunk and cached once the stream has run to completion.
+    Requests whose temperature is above max_cacheable_temperature, when one is set (e.g. 0
+    to cache only greedy decoding), always go to the wrapped LLM.
+    """
+
+    def __init__(
+        self,
+        base_llm: BaseLLMWrapper,
+        backend: Optional[CacheBackend] = None,
+        embedder: Optional[Callable[[str], Any]] = None,
+        similarity_threshold: float = 0.92,
+        ttl: Optional[float] = 3600,
+        max_semantic_entries: int = 1024,
+        metrics_manager: Optional[Any] = None,
+        max_cacheable_temperature: Optional[float] = None,
+    ):
+        super().__init__(
+            model_id=base_llm.model_id,
+            api_key=base_llm.api_key,
+            api_base_url=base_llm.api_base_url,
+        )
+        self.base_llm = base_llm
+        self.backend: CacheBackend = backend or InMemoryCacheBackend()
+        self.embedder = embedder
+        self.similarity_threshold = similarity_threshold
+        self.ttl = ttl
+        self.max_semantic_entries = max_semantic_entries
+        self.metrics_manager = metrics_manager  # Anything with async increment_counter(name, value, labels)
+        self.max_cacheable_temperature = max_cacheable_temperature
+        # context key -> SemanticCache mapping reworded final user messages to exact cache keys
+        self._semantic_caches: "OrderedDict[str, SemanticCache]" = OrderedDict()
+        self._embeddings: "OrderedDict[str, List[float]]" = OrderedDict()
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose wrapped-LLM settings (default_temperature, usage_totals, ...) unchanged
+        if name == "base_llm":
+            raise AttributeError(name)
+        return getattr(self.base_llm, name)
+
+    @staticmethod
+    def _request_payload(
+        messages: List[Message], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return {
+            "messages": [msg.model_dump(exclude_none=True) for msg in messages],
+            "params": {
+                k: v for k, v in kwargs.items() if k not in _CACHE_KEY_IGNORED_PARAMS
+            },
+        }
+
+    async def _embed(self, text: str) -> List[float]:
+        vector = self._embeddings.get(text)
+        if vector is None:
+            vector = self.embedder(text)
+            if inspect.isawaitable(vector):
+                vector = await vector
+            vector = self._embeddings[text] = list(vector)
+            if len(self._embeddings) > _MAX_MEMOIZED_EMBEDDINGS:
+                self._embeddings.popitem(last=False)
+        return vector
+
+    def _semantic_cache(self, context_key: str) -> SemanticCache:
+        cache = self._semantic_caches.get(context_key)
+        if cache is None:
+            cache = self._semantic_caches[context_key] = SemanticCache(
+                self._embed,
+                backend=self.backend,
+                similarity_threshold=self.similarity_threshold,
+                max_entries=self.max_semantic_entries,
+                default_ttl=self.ttl,
+                namespace=f"llm:{context_key}",
+            )
+            if len(self._semantic_caches) > _MAX_SEMANTIC_CONTEXTS:
+                self._semantic_caches.popitem(last=False)
+        else:
+            self._semantic_caches.move_to_end(context_key)
+        return cache
+
+    async def _record(self, outcome: str) -> None:
+        if self.metrics_manager is None:
+            return
+        try:
+            await self.metrics_manager.increment_counter(
+                "tframex_llm_cache_requests",
+                labels={"model": self.model_id, "outcome": outcome},
+            )
+        except Exception as e:
+            logger.debug(f"CachingLLM could not record cache metric: {e}")
+
+    async def chat_completion(
+        self, messages: List[Message], stream: bool = False, **kwargs: Any
+    ) -> Union[Message, AsyncGenerator[MessageChunk, None]]:
+        if self.max_cacheable_temperature is not None:
+            temperature = kwargs.get(
+                "temperature", getattr(self.base_llm, "default_temperature", None)
+            )
+            if temperature is not None and temperature > self.max_cacheable_temperature:
+                return await self.base_llm.chat_completion(
+                    messages, stream=stream, **kwargs
+                )
+
+        payload = self._request_payload(messages, kwargs)
+        cache_key = make_cache_key({"model": self.model_id, **payload})
+        cached = await self.backend.get(cache_key)
+        if cached is not None:
+            self.exact_hits += 1
+            await self._record("exact_hit")
+            logger.debug(
+                f"CachingLLM exact hit for {self.model_id} (key {cache_key[:12]}...)"
+            )
+            return (
+                self._replay_stream(cached)
+                if stream
+                else Message.model_validate(cached)
+            )
+
+        last_user_text = next(
+            (
+                m.content
+                for m in reversed(messages)
+                if m.role == "user" and isinstance(m.content, str)
+            ),
+            None,
+        )
+        semantic_cache = None
+        if self.embedder is not None and last_user_text:
+            context_payload = {**payload, "messages": payload["messages"][:-1]}
+            semantic_cache = self._semantic_cache(
+                make_cache_key({"model": self.model_id, **context_payload})
+            )
+            entry_key = await semantic_cache.get(
+                last_user_text
+            )  # The exact cache key of a similar request
+            cached = (
+                await self.backend.get(entry_key) if entry_key is not None else None
+            )
+            if cached is not None:
+                self.semantic_hits += 1
+                await self._record("semantic_hit")
+                logger.debug(
+                    f"CachingLLM semantic hit for {self.model_id} (key {entry_key[:12]}...)"
+                )
+                return (
+                    self._replay_stream(cached)
+                    if stream
+                    else Message.model_validate(cached)
+                )
+
+        semantic_text = last_user_text if semantic_cache is not None else None
+        self.misses += 1
+        await self._record("miss")
+        if stream:
+            response_stream = await self.base_llm.chat_completion(
+                messages, stream=True, **kwargs
+            )
+            return self._record_stream(
+                response_stream, cache_key, semantic_cache, semantic_text
+            )
+        response = await self.base_llm.chat_completion(messages, stream=False, **kwargs)
+        if isinstance(response, Message):
+            await self._store(response, cache_key, semantic_cache, semantic_text)
+        return response
+
+    async def _store(
+        self,
+        response: Message,
+        cache_key: str,
+        semantic_cache: Optional[SemanticCache],
+        semantic_text: Optional[str],
+    ) -> None:
+        if _is_error_response(response):
+            return
+        await self.backend.set(
+            cache_key, response.model_dump(exclude_none=True), self.ttl
+        )
+        if semantic_cache is not None and not response.tool_calls:
+            await semantic_cache.set(semantic_text, cache_key)
+
+    @staticmethod
+    async def _replay_stream(
+        cached: Dict[str, Any]
+    ) -> AsyncGenerator[MessageChunk, None]:
+        yield MessageChunk.model_validate(cached)
+
+    async def _record_stream(
+        self,
+        response_stream: AsyncGenerator[MessageChunk, None],
+        cache_key: str,
+        semantic_cache: Optional[SemanticCache] = None,
+        semantic_text: Optional[str] = None,
+    ) -> AsyncGenerator[MessageChunk, None]:
+        """Passes chunks through as they arrive; the joined response is cached only if the stream completes."""
+        content_parts: List[str] = []
+        tool_calls: List[ToolCall] = []
+        async for chunk in response_stream:
+            if chunk.content:
+                content_parts.append(chunk.content)
+            if chunk.tool_calls:
+                tool_calls.extend(chunk.tool_calls)
+            yield chunk
+        if not (content_parts or tool_calls):
+            return
+        response = Message(
+            role="assistant",
+            content="".join(content_parts) or None,
+            tool_calls=tool_calls or None,
+        )
+        await self._store(response, cache_key, semantic_cache, semantic_text)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "exact_hits": self.exact_hits,
+            "semantic_hits": self.semantic_hits,
+            "misses": self.misses,
+        }
+
+    async def warmup(
+        self,
+        prime: bool = False,
+        messages: Optional[List[Message]] = None,
+        **kwargs: Any,
+    ) -> bool:
+        # Warm the wrapped LLM's client (the one requests actually use), bypassing the cache
+        return await self.base_llm.warmup(prime=prime, messages=messages, **kwargs)
+
+    async def close(self):
+        await self.base_llm.close()
+
+
+@dataclass(frozen=True)
+class LLMSession:
+    """
+    Tags a run's LLM requests with one prompt-cache key. Agents handing work to each other
+    resend a long shared prefix (system prompts, earlier outputs); providers that route by
+    this key (OpenAI's prompt_cache_key, or a proxy mapping it to a sticky vLLM/SGLang
+    replica) can then serve that prefix from cache instead of prefilling it again.
+    Pass one to TFrameXRuntimeContext.call_agent(..., session=...).
+    """
+
+    session_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    param_name: str = "prompt_cache_key"
+
+    def request_params(self) -> Dict[str, str]:
+        """Extra request body fields that carry the session key."""
+        return {self.param_name: self.session_id}
@@ -3,6 +3,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from tframex.models.primitives import Message
+from tframex.util.tokens import count_message_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -24,18 +25,47 @@ class BaseMemoryStore(ABC):
 
 
 class InMemoryMemoryStore(BaseMemoryStore):
-    def __init__(self, max_history_size: Optional[int] = None):
+    def __init__(
+        self,
+        max_history_size: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+        model_name: Optional[str] = None,
+    ):
         self._history: List[Message] = []
         self.max_history_size = max_history_size
-        logger.debug(f"InMemoryMemoryStore initialized. Max size: {max_history_size}")
+        # Token budget for the stored history; oldest turns are evicted once it is exceeded
+        self.max_tokens = max_tokens
+        self.model_name = model_name
+        self._token_counts: List[int] = []
+        self.total_tokens = 0
+        logger.debug(
+            f"InMemoryMemoryStore initialized. Max size: {max_history_size}. Max tokens: {max_tokens}"
+        )
+
+    def _pop_oldest(self) -> None:
+        self._history.pop(0)
+        if self.max_tokens is not None:
+            self.total_tokens -= self._token_counts.pop(0)
+
+    def _evict_oldest_turn(self) -> None:
+        self._pop_oldest()
+        # Tool results must not outlive the assistant message that requested them
+        while self._history and self._history[0].role == "tool":
+            self._pop_oldest()
 
     async def add_message(self, message: Message) -> None:
         self._history.append(message)
+        if self.max_tokens is not None:
+            message_tokens = count_message_tokens(message, self.model_name)
+            self._token_counts.append(message_tokens)
+            self.total_tokens += message_tokens
+            while self.total_tokens > self.max_tokens and len(self._history) > 1:
+                self._evict_oldest_turn()
         if (
             self.max_history_size is not None
             and len(self._history) > self.max_history_size
         ):
-            self._history.pop(0)  # Keep it a rolling window
+            self._evict_oldest_turn()  # Keep it a rolling window
         logger.debug(
             f"Added message to InMemoryMemoryStore: Role={message.role}, Content='{str(message.content)[:50]}...', ToolCalls={bool(message.tool_calls)}"
         )
@@ -63,4 +93,6 @@ class InMemoryMemoryStore(BaseMemoryStore):
 
     async def clear(self) -> None:
         self._history = []
+        self._token_counts = []
+        self.total_tokens = 0
         logger.info("InMemoryMemoryStore cleared.")
@@ -0,0 +1,39 @@
+# tframex/util/text.py
+"""
+Helpers for pulling structured content out of free-form LLM output.
+"""
+from typing import Optional
+
+_FENCE_CHARS = ("`", "~")
+_MIN_FENCE_LENGTH = 3
+
+
+def extract_code_block(text: Optional[str]) -> Optional[str]:
+    """
+    Returns the body of the first fenced code block (``` or ~~~) in text, or None if there
+    is none. Lines are scanned once with fence state tracked, as in Markdown: a block only
+    closes on a line made of the same fence character at least as long as the opener, so
+    shorter or different fences inside it (e.g. generated Markdown) stay part of the body.
+    An unterminated block (a truncated response) yields everything after its opener.
+    """
+    if not text:
+        return None
+    fence_char = None
+    fence_length = 0
+    body = []
+    for line in text.split("\n"):
+        stripped = line.strip()
+        if fence_char is None:
+            if stripped[:1] in _FENCE_CHARS:
+                length = len(stripped) - len(stripped.lstrip(stripped[0]))
+                if length >= _MIN_FENCE_LENGTH:
+                    fence_char, fence_length = stripped[0], length
+            continue
+        if (
+            len(stripped) >= fence_length
+            and stripped[0] == fence_char
+            and stripped.count(fence_char) == len(stripped)
+        ):
+            return "\n".join(body)
+        body.append(line)
+    return "\n".join(body) if fence_char is not None else None
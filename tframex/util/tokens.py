@@ -0,0 +1,90 @@
+# tframex/util/tokens.py
+"""
+Token counting and budget helpers. Uses tiktoken when it is installed and falls
+back to a ~4 characters-per-token estimate otherwise.
+"""
+import logging
+import re
+from functools import lru_cache
+from typing import Any, Optional
+
+from tframex.models.primitives import Message
+
+logger = logging.getLogger(__name__)
+
+CHARS_PER_TOKEN_ESTIMATE = 4
+MESSAGE_OVERHEAD_TOKENS = 4  # Role/separator tokens the chat format adds per message
+DEFAULT_ENCODING = "cl100k_base"
+
+_SECTION_SPLIT_RE = re.compile(r"\n\s*\n")
+
+
+@lru_cache(maxsize=16)
+def _get_encoding(model_name: Optional[str]) -> Optional[Any]:
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    try:
+        return (
+            tiktoken.encoding_for_model(model_name)
+            if model_name
+            else tiktoken.get_encoding(DEFAULT_ENCODING)
+        )
+    except KeyError:  # Non-OpenAI model names (e.g. local Ollama models)
+        return tiktoken.get_encoding(DEFAULT_ENCODING)
+
+
+def count_tokens(text: Optional[str], model_name: Optional[str] = None) -> int:
+    """Counts (or, without tiktoken, estimates) the tokens in text."""
+    if not text:
+        return 0
+    encoding = _get_encoding(model_name)
+    if encoding is None:
+        return -(-len(text) // CHARS_PER_TOKEN_ESTIMATE)  # Ceiling division
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(message: Message, model_name: Optional[str] = None) -> int:
+    """Tokens a message contributes to a chat request, including tool call arguments."""
+    tokens = MESSAGE_OVERHEAD_TOKENS + count_tokens(message.content, model_name)
+    for tool_call in message.tool_calls or []:
+        tokens += count_tokens(tool_call.function.name, model_name)
+        tokens += count_tokens(tool_call.function.arguments, model_name)
+    return tokens
+
+
+def truncate_by_tokens(
+    text: str, max_tokens: int, model_name: Optional[str] = None
+) -> str:
+    """
+    Keeps text within max_tokens. Whole blank-line separated sections are kept in order
+    until the budget runs out, so later (typically less important) sections are dropped
+    first; a single oversized leading section is cut mid-text.
+    """
+    if count_tokens(text, model_name) <= max_tokens:
+        return text
+
+    kept = []
+    used = 0
+    for section in _SECTION_SPLIT_RE.split(text):
+        section_tokens = count_tokens(section, model_name) + 1  # +1 for the separator
+        if used + section_tokens > max_tokens:
+            break
+        kept.append(section)
+        used += section_tokens
+
+    if kept:
+        truncated = "\n\n".join(kept)
+    else:
+        encoding = _get_encoding(model_name)
+        if encoding is None:
+            truncated = text[: max_tokens * CHARS_PER_TOKEN_ESTIMATE]
+        else:
+            truncated = encoding.decode(
+                encoding.encode(text, disallowed_special=())[:max_tokens]
+            )
+    logger.warning(
+        f"Text truncated to fit a {max_tokens}-token budget ({len(text)} -> {len(truncated)} chars)."
+    )
+    return truncated
@@ -1,4 +1,5 @@
 import asyncio
+import copy
 import inspect
 import json
 import logging
@@ -9,6 +10,7 @@ from tframex.models.primitives import (
     ToolParameterProperty,
     ToolParameters,
 )
+from tframex.util.cache import InMemoryCacheBackend, make_cache_key
 
 logger = logging.getLogger(__name__)
 
@@ -20,9 +22,19 @@ class Tool:
         func: Callable[..., Any],
         description: Optional[str] = None,
         parameters_schema: Optional[ToolParameters] = None,
+        cacheable: bool = False,
+        cache_ttl: Optional[float] = None,
+        cache_max_entries: int = 256,
     ):
         self.name = name
         self.func = func
+        # Results of deterministic tools are memoized per argument set. Tools with side
+        # effects or time-dependent output (file writes, clocks) must stay uncached.
+        self.cacheable = cacheable
+        self.cache_ttl = cache_ttl
+        self._result_cache: Optional[InMemoryCacheBackend] = (
+            InMemoryCacheBackend(max_entries=cache_max_entries) if cacheable else None
+        )
         self.description = (
             description or inspect.getdoc(func) or f"Tool named '{name}'."
         )
@@ -52,32 +64,16 @@ class Tool:
             ]:  # Skip common bound/context args
                 continue
 
-            # Basic type mapping (can be expanded significantly)
-            param_type_str = "string"  # Default
             param_description = f"Parameter '{param_name}'"
-
-            if param.annotation != inspect.Parameter.empty:
-                if param.annotation == int:
-                    param_type_str = "integer"
-                elif param.annotation == float:
-                    param_type_str = "number"
-                elif param.annotation == bool:
-                    param_type_str = "boolean"
-                elif (
-                    param.annotation == list
-                    or getattr(param.annotation, "__origin__", None) == list
-                ):
-                    param_type_str = "array"  # Basic list
-                elif (
-                    param.annotation == dict
-                    or getattr(param.annotation, "__origin__", None) == dict
-                ):
-                    param_type_str = "object"  # Basic dict
-                # For more complex annotations (e.g., List[str], MyPydanticModel), more advanced parsing is needed.
-                # Type hints in docstrings could also be parsed.
+            param_type_str = self._json_type(param.annotation)
+            items = None
+            if param_type_str == "array":
+                # List[X] gives the element type; a bare list falls back to strings
+                element_args = getattr(param.annotation, "__args__", None) or (str,)
+                items = {"type": self._json_type(element_args[0])}
 
             properties[param_name] = ToolParameterProperty(
-                type=param_type_str, description=param_description
+                type=param_type_str, description=param_description, items=items
             )
             if param.default == inspect.Parameter.empty:
                 required_params.append(param_name)
@@ -86,6 +82,23 @@ class Tool:
             properties=properties, required=required_params or None
         )  # None if empty list
 
+    @staticmethod
+    def _json_type(annotation: Any) -> str:
+        # Basic type mapping (can be expanded significantly)
+        if annotation == int:
+            return "integer"
+        if annotation == float:
+            return "number"
+        if annotation == bool:
+            return "boolean"
+        if annotation == list or getattr(annotation, "__origin__", None) == list:
+            return "array"
+        if annotation == dict or getattr(annotation, "__origin__", None) == dict:
+            return "object"
+        # For more complex annotations (e.g., MyPydanticModel), more advanced parsing is needed.
+        # Type hints in docstrings could also be parsed.
+        return "string"  # Default, also for unannotated parameters
+
     def get_openai_tool_definition(self) -> ToolDefinition:
         """Returns schema in OpenAI function calling format."""
         return ToolDefinition(
@@ -112,14 +125,42 @@ class Tool:
 
         # TODO: Add Pydantic validation of kwargs against self.parameters schema here for robustness
 
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = make_cache_key(
+                kwargs
+            )  # Canonical JSON, so argument order doesn't matter
+            cached = await self._result_cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Tool '{self.name}' result served from cache.")
+                return copy.deepcopy(
+                    cached
+                )  # Callers may mutate results; the cached one must not change
+
         try:
             if asyncio.iscoroutinefunction(self.func):
-                return await self.func(**kwargs)
+                result = await self.func(**kwargs)
             else:
                 # Consider context for to_thread if event loop isn't guaranteed to be the one expected by func's potential side effects
-                return await asyncio.to_thread(self.func, **kwargs)
+                result = await asyncio.to_thread(self.func, **kwargs)
         except Exception as e:
             logger.error(
                 f"Error during execution of tool '{self.name}': {e}", exc_info=True
             )
             return {"error": f"Execution error in tool '{self.name}': {str(e)}"}
+
+        # Error results (None, {"error": ...}) are not memoized, so a transient failure can be retried
+        if (
+            cache_key is not None
+            and result is not None
+            and not (isinstance(result, dict) and "error" in result)
+        ):
+            await self._result_cache.set(
+                cache_key, copy.deepcopy(result), self.cache_ttl
+            )
+        return result
+
+    async def clear_cache(self) -> None:
+        """Drops memoized results, e.g. after the data a cacheable tool reads has changed."""
+        if self._result_cache is not None:
+            await self._result_cache.clear()